@@ -0,0 +1,207 @@
+'''Benchmark every public backend method against MariaDB and/or Firestore.
+
+Run from the repository root, e.g.:
+
+    python -m benchmarks.backends --backend mariadb --size 10k --seed
+    python -m benchmarks.backends --backend firebase --size 1k --seed   # with FIRESTORE_EMULATOR_HOST set
+    python -m benchmarks.backends --backend mariadb --save-baseline benchmarks/baseline.json
+    python -m benchmarks.backends --backend mariadb --baseline benchmarks/baseline.json
+
+For each method it reports p50/p95/p99 latency in milliseconds, and the average number of database
+round trips (MariaDB statements / Firestore RPCs) and rows read per call. With --baseline it also prints
+the change of each percentile against a previously saved run.
+'''
+import argparse
+import json
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime
+
+from database.data_generator.generate_donations import (BLOOD_TYPES, SEED_MAX_REQUEST_ID, generateDonations,
+                                                        generateDonors, generateRequests)
+from database.backend import BACKENDS, getBackend
+from database.instrumentation import instrumentation
+from database.models import BloodDonation, BloodRequest, Donor, User
+
+SIZES = {'1k': 1000, '10k': 10000, '100k': 100000, '1M': 1000000}
+
+def seed(db, name, donations, rng: random.Random):
+    '''Load a synthetic dataset of the given number of donations through the backend API'''
+    start = datetime(2020, 1, 1)
+    end = datetime(2022, 11, 30)
+    donorCount = max(donations // 10, 8)
+    requestCount = max(donations // 20, 8)
+    fulfilledCount = int(requestCount * 0.8)
+
+    bloodTypeSeed = rng.getrandbits(32)
+    for nric, donorName, dateOfBirth, contactNo, bloodTypeId, registrationDate in generateDonors(
+            rng, donorCount, start, bloodTypeSeed):
+        db.insertDonor(Donor(nric, donorName, datetime.combine(dateOfBirth, datetime.min.time()),
+                             contactNo, BLOOD_TYPES[bloodTypeId][0], registrationDate))
+    db.commit()
+
+    requestIds = []
+    for id, requesterId, bloodTypeId, quantity, date, address, status, fulfilled in generateRequests(
+            rng, requestCount, fulfilledCount, start, end):
+        req = BloodRequest(None, requesterId, BLOOD_TYPES[bloodTypeId][0], quantity, date, address, status, fulfilled)
+        requestIds.append(db.insertRequest(req))
+    db.commit()
+
+    rows = generateDonations(rng, donations, donorCount, fulfilledCount, 0.6, start, end, bloodTypeSeed)
+    db.bulkInsertDonations(
+        BloodDonation(None, nric, quantity, date, branchId, recordedBy, requestIds[usedBy - SEED_MAX_REQUEST_ID - 1] if usedBy else None)
+        for _, nric, quantity, date, branchId, recordedBy, usedBy, _ in rows)
+    print(f'[{name}] Seeded {donorCount} donors, {requestCount} requests, {donations} donations')
+
+
+def cases(db, includeWrites):
+    '''(method name, callable) for every public backend method'''
+    donor = db.getDonorsPage(None, 1)[0][0]
+    request = db.getRequestsPage(None, 1)[0][0]
+    result = [
+        ('login', lambda: db.login('user1', '1234')),
+        ('getUserById', lambda: db.getUserById(1)),
+        ('getAllDonors', db.getAllDonors),
+        ('getDonorsPage', lambda: db.getDonorsPage(None, 100)),
+        ('getDonorByNRIC', lambda: db.getDonorByNRIC(donor.nric)),
+        ('getAllDonations', db.getAllDonations),
+        ('getDonationsPage', lambda: db.getDonationsPage(None, 100)),
+        ('getDonationsIdsByRequestId', lambda: db.getDonationsIdsByRequestId(request.id)),
+        ('getAvailableDonationsByBloodType', lambda: db.getAvailableDonationsByBloodType('O+')),
+        ('getAllRequests', db.getAllRequests),
+        ('getRequestsPage', lambda: db.getRequestsPage(None, 100)),
+        ('getRequestById', lambda: db.getRequestById(request.id)),
+        ('getAllBranches', db.getAllBranches),
+        ('getDashboardStats', lambda: db.getDashboardStats(10001)),
+        ('getBloodInventoryByBranchId', lambda: db.getBloodInventoryByBranchId(10001)),
+        ('getAnalyticsRows', db.getAnalyticsRows),
+    ]
+    if includeWrites:
+        created = [] # NRICs of the donors inserted by insertDonor, deleted again by deleteDonorByNRIC
+        def insertDonor():
+            nric = f'B{uuid.uuid4().hex[:7].upper()}Z'
+            db.insertDonor(Donor(nric, 'Benchmark Donor', datetime(1990, 1, 1), '91234567', donor.bloodType, datetime.now()))
+            db.commit()
+            created.append(nric)
+        def updateDonor():
+            db.updateDonor(donor) # Unchanged, so the data stays the same
+            db.commit()
+        def deleteDonorByNRIC():
+            # Runs as many times as insertDonor, so every call has a donor to delete
+            db.deleteDonorByNRIC(created.pop())
+            db.commit()
+        def register():
+            db.register(User(None, f'bench-{uuid.uuid4().hex[:8]}', '1234', 'Benchmark User', 10001, 'role.staff.bloodbank'))
+        def insertRequest():
+            db.insertRequest(BloodRequest(None, 5, donor.bloodType, 450, datetime.today(), 'Benchmark', 'Pending', 0))
+            db.commit()
+        def insertDonation():
+            db.insertDonation(BloodDonation(None, donor.nric, 450, datetime.now(), 10001, 1, None))
+            db.commit()
+        def fulfillRequest():
+            # Fulfill a new request with one fresh donation, so every call has valid input
+            req = BloodRequest(None, 5, donor.bloodType, 450, datetime.today(), 'Benchmark', 'Pending', 0)
+            requestId = db.insertRequest(req)
+            db.insertDonation(BloodDonation(None, donor.nric, 450, datetime.now(), 10001, 1, None))
+            db.commit()
+            donationId = db.getAvailableDonationsByBloodType(donor.bloodType)[0].id
+            db.fulfillRequest(requestId, [donationId])
+            db.commit()
+        result += [
+            ('insertDonor', insertDonor),
+            ('updateDonor', updateDonor),
+            ('deleteDonorByNRIC', deleteDonorByNRIC),
+            ('register', register),
+            ('insertRequest', insertRequest),
+            ('insertDonation', insertDonation),
+            ('fulfillRequest', fulfillRequest),
+        ]
+    return result
+
+
+def percentile(samples, p):
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method='inclusive')[p - 1]
+
+
+def run(db, name, repeat, includeWrites):
+    '''Time every method. Returns: { method: { p50, p95, p99, roundTrips, rows } } with times in ms,
+    and round trips and rows averaged over the calls
+    '''
+    results = {}
+    for method, call in cases(db, includeWrites):
+        call() # Warm up caches and connections
+        samples = []
+        roundTrips = []
+        rows = []
+        for _ in range(repeat):
+            instrumentation.begin()
+            start = time.perf_counter()
+            call()
+            samples.append((time.perf_counter() - start) * 1000)
+            stats = instrumentation.end()
+            roundTrips.append(stats.queries)
+            rows.append(stats.rows)
+            db.release()
+        results[method] = {
+            'p50': percentile(samples, 50),
+            'p95': percentile(samples, 95),
+            'p99': percentile(samples, 99),
+            'roundTrips': statistics.mean(roundTrips),
+            'rows': statistics.mean(rows),
+        }
+    return results
+
+
+def delta(current, baseline):
+    if not baseline:
+        return ''
+    return f'{(current - baseline) / baseline * 100:+.0f}%'
+
+
+def report(name, results, baseline):
+    print(f'\n[{name}]')
+    print(f"{'method':34} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'trips':>6} {'rows':>8}" + ('   Δp50   Δp95   Δp99' if baseline else ''))
+    for method, r in results.items():
+        line = f"{method:34} {r['p50']:9.2f} {r['p95']:9.2f} {r['p99']:9.2f} {r['roundTrips']:6.1f} {r['rows']:8.1f}"
+        b = baseline.get(method) if baseline else None
+        if b:
+            line += ' ' + ' '.join(f'{delta(r[p], b[p]):>6}' for p in ('p50', 'p95', 'p99'))
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the database backends')
+    parser.add_argument('--backend', choices=BACKENDS, action='append', help='backend to benchmark, can be repeated (default mariadb and firebase)')
+    parser.add_argument('--size', default='1k', help='donations to seed: 1k, 10k, 100k, 1M or a number')
+    parser.add_argument('--seed', action='store_true', help='seed the dataset before benchmarking')
+    parser.add_argument('--repeat', type=int, default=20, help='timed calls per method')
+    parser.add_argument('--writes', action='store_true', help='also benchmark the write methods (modifies data)')
+    parser.add_argument('--baseline', help='JSON file of a previous run to compare against')
+    parser.add_argument('--save-baseline', help='write the results to this JSON file')
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    allResults = {}
+    for name in args.backend or ['mariadb', 'firebase']:
+        db = getBackend(name)
+        if args.seed:
+            seed(db, name, SIZES.get(args.size) or int(args.size), random.Random(0))
+        allResults[name] = run(db, name, args.repeat, args.writes)
+        report(name, allResults[name], baseline.get(name))
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(allResults, f, indent=2)
+        print(f'\nSaved results to {args.save_baseline}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+'''Awaitable access to a database backend for async views.
+
+The database drivers are blocking, so each call runs on a worker thread of a shared pool, and
+independent queries of one page can be awaited together with asyncio.gather. The worker thread
+returns its connection to the pool as soon as the call finishes, and its queries are counted in
+the stats of the request that awaited it.
+'''
+import asyncio
+import contextvars
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from database.models import DashboardData
+
+# Worker threads for backends whose connections are not limited by a pool
+DEFAULT_WORKERS = 8
+
+
+class AsyncBackend:
+    '''Wraps a backend so that every method returns an awaitable.
+
+    Each call checks out its own connection, so calls that belong to one transaction
+    (writes followed by commit) must be grouped in one function passed to run().
+    '''
+    def __init__(self, backend, maxWorkers=DEFAULT_WORKERS):
+        self.backend = backend
+        self._executor = ThreadPoolExecutor(max_workers=maxWorkers, thread_name_prefix='db')
+
+    @staticmethod
+    def fromEnv(backend):
+        '''Create with BLOODMGT_DB_THREADS worker threads, by default as many as the backend's
+        connection pool holds (8 for backends without a pool).
+        Workers take their connections from the same pool as request threads, so a thread must not hold
+        a checked out connection while it awaits a worker: with the pool taken by waiting threads, the
+        workers would block in the pool until it times out. main.load_user returns its connection for this
+        reason, and async views only reach the database through this class.
+        '''
+        threads = os.getenv('BLOODMGT_DB_THREADS')
+        if threads is None:
+            return AsyncBackend(backend, maxWorkers=backend.maxConnections or DEFAULT_WORKERS)
+        return AsyncBackend(backend, maxWorkers=int(threads))
+
+    def _call(self, fn, *args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.backend.release()
+
+    async def run(self, fn, *args, **kwargs):
+        '''Run fn on a worker thread, in a copy of the caller's context (so the Flask request and the
+        request's query stats are available), and await its result
+        '''
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, self._call, fn, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    def __getattr__(self, name):
+        method = getattr(self.backend, name)
+        if not callable(method):
+            return method
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            return await self.run(method, *args, **kwargs)
+        return call
+
+    async def getDashboardStats(self, branchId):
+        '''Query data to show on the dashboard, running the counts and the inventory query concurrently
+        Returns: DashboardData
+        '''
+        counts, inventory = await asyncio.gather(
+            self.run(self.backend.getDashboardCounts),
+            self.run(self.backend.getBloodInventoryByBranchId, branchId))
+        return DashboardData(*counts, inventory.storage)
@@ -0,0 +1,113 @@
+'''Vectorized analytics over donation records.
+
+The donation columns needed for analytics (date, quantity, branch, blood type, used) are loaded
+once into NumPy arrays; every query is then a handful of array operations and group-bys
+(np.bincount) rather than a loop over donation objects.
+'''
+from datetime import datetime
+
+import numpy as np
+
+from database.models import BLOOD_TYPES
+
+# Red blood cells can be stored for up to 42 days after donation
+SHELF_LIFE_DAYS = 42
+
+_BLOOD_TYPE_CODES = {t: i for i, t in enumerate(BLOOD_TYPES)}
+
+
+def _factorize(values):
+    '''Encode values as integer codes, in order of first appearance
+    Returns: (list of distinct values as strings, array of codes)
+    '''
+    index = {}
+    codes = np.fromiter(map(lambda v: index.setdefault(v, len(index)), values), dtype=np.int64)
+    return [str(v) for v in index], codes
+
+
+class DonationAnalytics:
+    def __init__(self, dates, quantities, branchIds, bloodTypes, used):
+        '''Build from equal-length columns. Dates must be naive UTC datetimes.'''
+        self.dates = np.asarray(dates, dtype='datetime64[s]')
+        self.quantities = np.asarray(quantities, dtype=np.int64)
+        self.branches, self.branchCodes = _factorize(branchIds)
+        self.bloodTypeCodes = np.fromiter(map(lambda t: _BLOOD_TYPE_CODES.get(t, -1), bloodTypes), dtype=np.int64, count=len(self.quantities))
+        self.used = np.asarray(used, dtype=bool)
+
+    @staticmethod
+    def fromRows(rows):
+        '''Build from rows of (date, quantity, branchId, bloodType, usedBy)'''
+        rows = list(rows)
+        if not rows:
+            return DonationAnalytics([], [], [], [], [])
+        dates, quantities, branchIds, bloodTypes, usedBy = zip(*rows)
+        return DonationAnalytics(dates, quantities, branchIds, bloodTypes, [u is not None for u in usedBy])
+
+    def __len__(self):
+        return len(self.quantities)
+
+    def _groupByBranchAndType(self, mask):
+        '''Sum quantities of the masked donations per (branch, blood type)
+        Returns: { branchId: { bloodType: quantity } }
+        '''
+        mask = mask & (self.bloodTypeCodes >= 0)
+        nTypes = len(BLOOD_TYPES)
+        keys = self.branchCodes[mask] * nTypes + self.bloodTypeCodes[mask]
+        sums = np.bincount(keys, weights=self.quantities[mask], minlength=len(self.branches) * nTypes)
+        sums = sums.reshape(len(self.branches), nTypes).astype(np.int64)
+        return {
+            str(branch): dict(zip(BLOOD_TYPES, sums[i].tolist()))
+            for i, branch in enumerate(self.branches)}
+
+    def inventory(self):
+        '''Quantity of unused blood per branch and blood type'''
+        return self._groupByBranchAndType(~self.used)
+
+    def intake(self, period='week', since: datetime = None):
+        '''Number and total quantity of donations per week (starting Monday) or month
+        Returns: list of { period, donations, quantity } in chronological order
+        '''
+        dates = self.dates
+        quantities = self.quantities
+        if since is not None:
+            mask = dates >= np.datetime64(since, 's')
+            dates = dates[mask]
+            quantities = quantities[mask]
+        if period == 'month':
+            periods = dates.astype('datetime64[M]').astype(np.int64)
+            step = 1
+        elif period == 'week':
+            days = dates.astype('datetime64[D]').astype(np.int64)
+            # 1970-01-01 is a Thursday, so (days + 3) % 7 is the weekday with Monday as 0
+            periods = days - (days + 3) % 7
+            step = 7
+        else:
+            raise ValueError(f'Unknown period: {period}')
+        if len(periods) == 0:
+            return []
+        # Group by offset from the first period; bincount is linear, unlike sorting
+        first = periods.min()
+        codes = (periods - first) // step
+        counts = np.bincount(codes)
+        sums = np.bincount(codes, weights=quantities).astype(np.int64)
+        result = []
+        for code in np.flatnonzero(counts):
+            key = first + code * step
+            key = np.datetime64(int(key), 'M').astype('datetime64[D]') if period == 'month' else np.datetime64(int(key), 'D')
+            result.append({'period': str(key), 'donations': int(counts[code]), 'quantity': int(sums[code])})
+        return result
+
+    def expiring(self, withinDays=7, now: datetime = None):
+        '''Unused blood per branch and blood type that expires within the given number of days,
+        plus unused blood that has already expired
+        Returns: { 'expiring': { branchId: { bloodType: quantity } }, 'expired': { ... } }
+        '''
+        now = np.datetime64(now or datetime.utcnow(), 's')
+        expiry = self.dates + np.timedelta64(SHELF_LIFE_DAYS, 'D')
+        available = ~self.used
+        expired = available & (expiry < now)
+        expiring = available & (expiry >= now) & (expiry < now + np.timedelta64(withinDays, 'D'))
+        return {
+            'expiring': self._groupByBranchAndType(expiring),
+            'expired': self._groupByBranchAndType(expired),
+        }
@@ -0,0 +1,222 @@
+'''Common interface of the database backends and the registry used to select one.
+
+The backend is chosen by name with the BLOODMGT_DB_BACKEND environment variable (default mariadb).
+Backend modules are only imported when selected, so unused database drivers are never loaded.
+New backends are added with `registerBackend(name, 'module:ClassName')`.
+'''
+import importlib
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from database.models import BloodDonation, BloodRequest, DashboardData, Donor, User
+from database.paging import PAGE_SIZE, iterPages
+
+DEFAULT_BACKEND = 'mariadb'
+
+# Index the SQL backends look up available donations with (checked by `manage.py explain-available`)
+AVAILABLE_DONATIONS_INDEX = 'IDX_BloodDonation_available'
+
+# Donations moved to the archive per transaction by archiveDonations
+ARCHIVE_BATCH_SIZE = 1000
+
+# Collections whose version is incremented by every write to them (the ETags of /query)
+DATA_VERSIONS = ('donor', 'donation', 'request')
+
+# Backend name -> 'module:ClassName'
+BACKENDS = {
+    'mariadb': 'database.mariadb:MariaDBBackend',
+    'firebase': 'database.firebase:FirebaseBackend',
+    'sqlite': 'database.sqlite:SQLiteBackend',
+}
+
+
+class DatabaseBackend(ABC):
+    '''Operations the web app and maintenance commands need from a database'''
+
+    # Most connections the backend holds at once, or None if it is not limited by a pool
+    maxConnections = None
+
+    def commit(self):
+        '''Commit pending writes (no-op for backends that write immediately)'''
+
+    def release(self):
+        '''Free per-thread resources such as pooled connections (called when a request ends)'''
+
+    @abstractmethod
+    def getUserById(self, id):
+        '''Query user by id'''
+
+    @abstractmethod
+    def login(self, username, password):
+        '''User authentication. Return the user if successful or None'''
+
+    @abstractmethod
+    def register(self, user: User):
+        '''User registration. Return the user if successful or None'''
+
+    def getAllDonors(self):
+        '''Query list of all donors'''
+        return list(iterPages(self.getDonorsPage))
+
+    @abstractmethod
+    def getDonorsPage(self, after=None, pageSize=PAGE_SIZE, serialized=False):
+        '''Query one page of donors ordered by NRIC, starting after the given cursor
+        Returns: (list of Donor, or of serialize()-shaped dicts if serialized, next page cursor or None)
+        '''
+
+    @abstractmethod
+    def getDonorByNRIC(self, nric: str):
+        '''Query one donor by NRIC'''
+
+    @abstractmethod
+    def insertDonor(self, donor: Donor, idempotencyKey=None):
+        '''Insert new Donor.
+        With an idempotencyKey, nothing is written if a write with that key was already applied.
+        '''
+
+    @abstractmethod
+    def updateDonor(self, donor: Donor):
+        '''Update existing Donor'''
+
+    @abstractmethod
+    def deleteDonorByNRIC(self, nric: str):
+        '''Delete donor and their donations by NRIC'''
+
+    def getAllDonations(self):
+        '''Query list of all blood donations'''
+        return list(iterPages(self.getDonationsPage))
+
+    @abstractmethod
+    def getDonationsPage(self, after=None, pageSize=PAGE_SIZE, serialized=False):
+        '''Query one page of blood donations, newest first, starting after the given cursor
+        Returns: (list of BloodDonation, or of serialize()-shaped dicts if serialized, next page cursor or None)
+        '''
+
+    @abstractmethod
+    def getDonationsIdsByRequestId(self, id, includeArchive=False):
+        '''Query all blood donation ids used to fulfill the request with given id
+        includeArchive: also search the donations moved to the archive by archiveDonations
+        '''
+
+    def getAvailableDonationsByBloodType(self, bloodType: str):
+        '''Query donation records not yet used for request fulfillment by blood type'''
+        return self.getAvailableDonations([bloodType])
+
+    @abstractmethod
+    def getAvailableDonations(self, bloodTypes=None):
+        '''Query donation records not yet used for request fulfillment, oldest first, with their blood type.
+        bloodTypes: only return donations of these blood types (default all)
+        '''
+
+    def explainAvailableDonations(self, bloodTypes=None):
+        '''Query plan of getAvailableDonations as lines of text, or None if the backend has no query planner'''
+        return None
+
+    @abstractmethod
+    def insertDonation(self, donation: BloodDonation, idempotencyKey=None):
+        '''Insert new donation. Returns: id of the donation.
+        With an idempotencyKey, nothing is written (returning None) if a write with that key was already applied.
+        '''
+
+    @abstractmethod
+    def bulkInsertDonations(self, donations):
+        '''Insert many donations (any iterable, consumed lazily). Returns: number of donations inserted'''
+
+    def getAllRequests(self):
+        '''Query list of all blood requests'''
+        return list(iterPages(self.getRequestsPage))
+
+    @abstractmethod
+    def getRequestsPage(self, after=None, pageSize=PAGE_SIZE, serialized=False):
+        '''Query one page of blood requests ordered by id, starting after the given cursor
+        Returns: (list of BloodRequest, or of serialize()-shaped dicts if serialized, next page cursor or None)
+        '''
+
+    @abstractmethod
+    def getPendingRequests(self):
+        '''Query blood requests that are not fulfilled yet, oldest first'''
+
+    @abstractmethod
+    def getRequestById(self, id):
+        '''Query blood request by request id, or None'''
+
+    @abstractmethod
+    def insertRequest(self, req: BloodRequest):
+        '''Insert new blood request. Returns: id of the request'''
+
+    @abstractmethod
+    def fulfillRequest(self, requestId: str, donationIds: list[str]):
+        '''Mark blood request as fulfilled using one or more blood donations.
+        Raises FulfillmentConflictError if the request or a donation is missing or already used;
+        nothing is written in that case.
+        '''
+
+    @abstractmethod
+    def getAllBranches(self):
+        '''Query list of all blood bank branches'''
+
+    @abstractmethod
+    def getAnalyticsRows(self, includeArchive=False):
+        '''Query (date, quantity, branchId, blood type, usedBy) of every donation, for analytics
+        includeArchive: also include the donations moved to the archive by archiveDonations
+        '''
+
+    def getDashboardStats(self, branchId):
+        '''Query data to show on the dashboard
+        Returns: DashboardData(donor count, available blood, pending requests, donations, blood inventory)
+        '''
+        counts = self.getDashboardCounts()
+        inventory = self.getBloodInventoryByBranchId(branchId)
+        return DashboardData(*counts, inventory.storage)
+
+    @abstractmethod
+    def getDashboardCounts(self):
+        '''Query the dashboard figures that do not depend on the branch
+        Returns: (donor count, available blood, pending requests, donations this week, quantity donated this week)
+        '''
+
+    @abstractmethod
+    def getBloodInventoryByBranchId(self, branchId):
+        '''Query blood inventory data
+        Returns: BloodInventory
+        '''
+
+    @abstractmethod
+    def archiveDonations(self, before: datetime, batchSize=ARCHIVE_BATCH_SIZE):
+        '''Move donations used by a request and dated before the given time to the archive,
+        batchSize donations per transaction. Archived donations are only returned by the methods
+        taking includeArchive=True; they still count in the weekly donation counters.
+        Returns: number of donations archived
+        '''
+
+    @abstractmethod
+    def rebuildInventory(self):
+        '''Recompute the materialized inventory and weekly counters from the donation records'''
+
+    @abstractmethod
+    def getDataVersion(self, name):
+        '''Query the version of one of the DATA_VERSIONS collections, incremented by every write to it
+        Returns: (version, naive UTC datetime of the last write or None)
+        '''
+
+
+def registerBackend(name, target):
+    '''Make a backend selectable by name. target is 'module:ClassName', imported on first use.'''
+    BACKENDS[name] = target
+
+
+def backendClass(name):
+    '''Import and return the class of the backend with the given name'''
+    try:
+        target = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown database backend '{name}' (available: {', '.join(BACKENDS)})")
+    moduleName, className = target.split(':')
+    return getattr(importlib.import_module(moduleName), className)
+
+
+def getBackend(name=None) -> DatabaseBackend:
+    '''Construct the database backend with the given name, or the one selected by BLOODMGT_DB_BACKEND'''
+    name = name or os.getenv('BLOODMGT_DB_BACKEND', DEFAULT_BACKEND)
+    return backendClass(name)()
@@ -0,0 +1,53 @@
+import os
+import threading
+
+from cachetools import TTLCache
+
+
+class ReferenceCache:
+    '''In-process cache for data that rarely changes (branches, blood types, roles, ...).
+
+    Entries expire after `ttl` seconds and the least recently used entry is evicted once
+    `maxsize` entries are stored. Safe to share between request threads.
+    '''
+    def __init__(self, maxsize=256, ttl=300):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fromEnv(prefix, maxsize=256, ttl=300):
+        '''Create a cache sized by the environment variables <prefix>_SIZE and <prefix>_TTL'''
+        return ReferenceCache(
+            maxsize=int(os.getenv(f'{prefix}_SIZE', maxsize)),
+            ttl=float(os.getenv(f'{prefix}_TTL', ttl)))
+
+    def get(self, key, load):
+        '''Return the cached value for key, calling load() to fetch it on a miss.
+        None results are not cached, so missing rows are looked up again next time.
+        '''
+        with self._lock:
+            try:
+                value = self._cache[key]
+                self.hits += 1
+                return value
+            except KeyError:
+                self.misses += 1
+        value = load()
+        if value is not None:
+            with self._lock:
+                self._cache[key] = value
+        return value
+
+    def invalidate(self, key=None):
+        '''Drop one entry, or every entry if no key is given'''
+        with self._lock:
+            if key is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(key, None)
+
+    def stats(self):
+        with self._lock:
+            return {'size': len(self._cache), 'maxsize': self._cache.maxsize, 'hits': self.hits, 'misses': self.misses}
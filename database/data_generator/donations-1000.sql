@@ -1,1001 +1,1001 @@
-INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES
-(1,"S8880000C",350,"2020-01-01",10002,1,NULL),
-(2,"S7770000D",350,"2020-01-02",10004,1,NULL),
-(3,"S9990000A",650,"2020-01-03",10004,1,NULL),
-(4,"S8881111C",600,"2020-01-04",10004,1,NULL),
-(5,"S8881111C",650,"2020-01-05",10001,1,NULL),
-(6,"S7771111D",450,"2020-01-06",10001,1,NULL),
-(7,"S7770000D",950,"2020-01-07",10003,1,NULL),
-(8,"S8880000C",900,"2020-01-08",10001,1,NULL),
-(9,"S7771111D",400,"2020-01-09",10004,1,NULL),
-(10,"S7771111D",700,"2020-01-10",10003,1,NULL),
-(11,"T0000000B",550,"2020-01-11",10001,1,NULL),
-(12,"S8880000C",800,"2020-01-12",10002,1,NULL),
-(13,"S8881111C",300,"2020-01-13",10002,1,NULL),
-(14,"S8881111C",400,"2020-01-14",10001,1,NULL),
-(15,"S7770000D",650,"2020-01-15",10003,1,NULL),
-(16,"S8881111C",300,"2020-01-16",10004,1,NULL),
-(17,"T0001111B",700,"2020-01-17",10003,1,NULL),
-(18,"S9990000A",900,"2020-01-18",10004,1,NULL),
-(19,"S7770000D",750,"2020-01-19",10002,1,NULL),
-(20,"S7770000D",650,"2020-01-20",10003,1,NULL),
-(21,"T0000000B",500,"2020-01-21",10003,1,NULL),
-(22,"S9991111A",650,"2020-01-22",10003,1,NULL),
-(23,"S7770000D",350,"2020-01-23",10004,1,NULL),
-(24,"T0001111B",450,"2020-01-24",10001,1,NULL),
-(25,"S7771111D",850,"2020-01-25",10004,1,NULL),
-(26,"T0000000B",550,"2020-01-26",10001,1,NULL),
-(27,"S8880000C",400,"2020-01-27",10002,1,NULL),
-(28,"T0000000B",750,"2020-01-28",10004,1,NULL),
-(29,"S8880000C",600,"2020-01-29",10001,1,NULL),
-(30,"S7770000D",800,"2020-01-30",10003,1,NULL),
-(31,"S8881111C",600,"2020-01-31",10004,1,NULL),
-(32,"S9990000A",900,"2020-02-01",10004,1,NULL),
-(33,"T0001111B",450,"2020-02-02",10003,1,NULL),
-(34,"S7771111D",950,"2020-02-03",10003,1,NULL),
-(35,"T0001111B",600,"2020-02-04",10004,1,NULL),
-(36,"S9991111A",800,"2020-02-05",10002,1,NULL),
-(37,"T0001111B",650,"2020-02-06",10004,1,NULL),
-(38,"S7770000D",250,"2020-02-07",10003,1,NULL),
-(39,"S8880000C",650,"2020-02-08",10004,1,NULL),
-(40,"S7771111D",900,"2020-02-09",10002,1,NULL),
-(41,"S8881111C",200,"2020-02-10",10003,1,NULL),
-(42,"S7771111D",750,"2020-02-11",10003,1,NULL),
-(43,"S9990000A",250,"2020-02-12",10001,1,NULL),
-(44,"S9991111A",800,"2020-02-13",10002,1,NULL),
-(45,"S9990000A",300,"2020-02-14",10003,1,NULL),
-(46,"S9990000A",700,"2020-02-15",10002,1,NULL),
-(47,"S9991111A",350,"2020-02-16",10001,1,NULL),
-(48,"T0001111B",350,"2020-02-17",10004,1,NULL),
-(49,"S9990000A",850,"2020-02-18",10003,1,NULL),
-(50,"S7771111D",650,"2020-02-19",10001,1,NULL),
-(51,"T0000000B",700,"2020-02-20",10001,1,NULL),
-(52,"T0000000B",250,"2020-02-21",10004,1,NULL),
-(53,"S9991111A",400,"2020-02-22",10004,1,NULL),
-(54,"S8881111C",300,"2020-02-23",10002,1,NULL),
-(55,"S8881111C",200,"2020-02-24",10002,1,NULL),
-(56,"T0001111B",500,"2020-02-25",10002,1,NULL),
-(57,"S7770000D",600,"2020-02-26",10002,1,NULL),
-(58,"S7771111D",200,"2020-02-27",10002,1,NULL),
-(59,"S9991111A",650,"2020-02-28",10004,1,NULL),
-(60,"S7771111D",950,"2020-02-29",10004,1,NULL),
-(61,"S7770000D",950,"2020-03-01",10002,1,NULL),
-(62,"T0001111B",800,"2020-03-02",10004,1,NULL),
-(63,"S7771111D",250,"2020-03-03",10003,1,NULL),
-(64,"S9990000A",700,"2020-03-04",10004,1,NULL),
-(65,"S8881111C",750,"2020-03-05",10002,1,NULL),
-(66,"S8881111C",550,"2020-03-06",10003,1,NULL),
-(67,"T0000000B",350,"2020-03-07",10001,1,NULL),
-(68,"T0001111B",450,"2020-03-08",10004,1,NULL),
-(69,"S7771111D",750,"2020-03-09",10003,1,NULL),
-(70,"T0000000B",450,"2020-03-10",10002,1,NULL),
-(71,"S7770000D",650,"2020-03-11",10003,1,NULL),
-(72,"S7771111D",500,"2020-03-12",10004,1,NULL),
-(73,"S8881111C",850,"2020-03-13",10003,1,NULL),
-(74,"S8881111C",750,"2020-03-14",10001,1,NULL),
-(75,"S9990000A",200,"2020-03-15",10002,1,NULL),
-(76,"S9990000A",850,"2020-03-16",10004,1,NULL),
-(77,"T0000000B",200,"2020-03-17",10001,1,NULL),
-(78,"T0000000B",800,"2020-03-18",10002,1,NULL),
-(79,"S7770000D",600,"2020-03-19",10003,1,NULL),
-(80,"S9990000A",700,"2020-03-20",10001,1,NULL),
-(81,"S8880000C",400,"2020-03-21",10002,1,NULL),
-(82,"S9990000A",950,"2020-03-22",10002,1,NULL),
-(83,"T0000000B",450,"2020-03-23",10002,1,NULL),
-(84,"T0001111B",750,"2020-03-24",10003,1,NULL),
-(85,"S8880000C",900,"2020-03-25",10002,1,NULL),
-(86,"S9991111A",950,"2020-03-26",10003,1,NULL),
-(87,"S9991111A",850,"2020-03-27",10003,1,NULL),
-(88,"S9990000A",650,"2020-03-28",10003,1,NULL),
-(89,"S7770000D",750,"2020-03-29",10002,1,NULL),
-(90,"T0000000B",200,"2020-03-30",10003,1,NULL),
-(91,"T0000000B",250,"2020-03-31",10001,1,NULL),
-(92,"T0000000B",650,"2020-04-01",10004,1,NULL),
-(93,"T0001111B",750,"2020-04-02",10004,1,NULL),
-(94,"S8881111C",850,"2020-04-03",10001,1,NULL),
-(95,"S9990000A",750,"2020-04-04",10002,1,NULL),
-(96,"S8880000C",900,"2020-04-05",10001,1,NULL),
-(97,"T0001111B",200,"2020-04-06",10001,1,NULL),
-(98,"T0000000B",800,"2020-04-07",10002,1,NULL),
-(99,"S9991111A",250,"2020-04-08",10001,1,NULL),
-(100,"S8881111C",400,"2020-04-09",10003,1,NULL),
-(101,"S8880000C",700,"2020-04-10",10002,1,NULL),
-(102,"T0001111B",550,"2020-04-11",10004,1,NULL),
-(103,"S8880000C",200,"2020-04-12",10001,1,NULL),
-(104,"S8881111C",950,"2020-04-13",10001,1,NULL),
-(105,"S8881111C",200,"2020-04-14",10001,1,NULL),
-(106,"T0000000B",550,"2020-04-15",10001,1,NULL),
-(107,"S8881111C",750,"2020-04-16",10001,1,NULL),
-(108,"S7771111D",950,"2020-04-17",10003,1,NULL),
-(109,"S7770000D",200,"2020-04-18",10003,1,NULL),
-(110,"T0001111B",700,"2020-04-19",10003,1,NULL),
-(111,"S7771111D",350,"2020-04-20",10002,1,NULL),
-(112,"T0000000B",950,"2020-04-21",10004,1,NULL),
-(113,"S9991111A",950,"2020-04-22",10004,1,NULL),
-(114,"S7770000D",750,"2020-04-23",10004,1,NULL),
-(115,"S8880000C",800,"2020-04-24",10001,1,NULL),
-(116,"S7771111D",950,"2020-04-25",10002,1,NULL),
-(117,"S9990000A",500,"2020-04-26",10004,1,NULL),
-(118,"S9990000A",750,"2020-04-27",10004,1,NULL),
-(119,"S7770000D",450,"2020-04-28",10004,1,NULL),
-(120,"T0000000B",650,"2020-04-29",10001,1,NULL),
-(121,"S8881111C",850,"2020-04-30",10003,1,NULL),
-(122,"S8880000C",600,"2020-05-01",10004,1,NULL),
-(123,"S9991111A",650,"2020-05-02",10002,1,NULL),
-(124,"S9991111A",300,"2020-05-03",10001,1,NULL),
-(125,"S7770000D",550,"2020-05-04",10002,1,NULL),
-(126,"S8880000C",300,"2020-05-05",10003,1,NULL),
-(127,"T0001111B",700,"2020-05-06",10001,1,NULL),
-(128,"T0000000B",550,"2020-05-07",10002,1,NULL),
-(129,"S8880000C",750,"2020-05-08",10001,1,NULL),
-(130,"S9990000A",350,"2020-05-09",10003,1,NULL),
-(131,"S8880000C",250,"2020-05-10",10001,1,NULL),
-(132,"S8880000C",800,"2020-05-11",10003,1,NULL),
-(133,"S9991111A",650,"2020-05-12",10004,1,NULL),
-(134,"T0000000B",750,"2020-05-13",10001,1,NULL),
-(135,"S8881111C",900,"2020-05-14",10004,1,NULL),
-(136,"T0001111B",850,"2020-05-15",10004,1,NULL),
-(137,"S7771111D",350,"2020-05-16",10004,1,NULL),
-(138,"S9990000A",300,"2020-05-17",10004,1,NULL),
-(139,"S7771111D",200,"2020-05-18",10002,1,NULL),
-(140,"S8881111C",500,"2020-05-19",10002,1,NULL),
-(141,"T0001111B",350,"2020-05-20",10003,1,NULL),
-(142,"S8881111C",350,"2020-05-21",10001,1,NULL),
-(143,"T0000000B",850,"2020-05-22",10004,1,NULL),
-(144,"S8881111C",600,"2020-05-23",10002,1,NULL),
-(145,"S8880000C",300,"2020-05-24",10003,1,NULL),
-(146,"T0001111B",600,"2020-05-25",10003,1,NULL),
-(147,"T0000000B",800,"2020-05-26",10004,1,NULL),
-(148,"T0000000B",900,"2020-05-27",10003,1,NULL),
-(149,"S9991111A",600,"2020-05-28",10002,1,NULL),
-(150,"S9991111A",800,"2020-05-29",10001,1,NULL),
-(151,"S7771111D",250,"2020-05-30",10004,1,NULL),
-(152,"T0001111B",600,"2020-05-31",10003,1,NULL),
-(153,"S9990000A",650,"2020-06-01",10002,1,NULL),
-(154,"S9990000A",700,"2020-06-02",10004,1,NULL),
-(155,"T0000000B",600,"2020-06-03",10002,1,NULL),
-(156,"S8880000C",300,"2020-06-04",10002,1,NULL),
-(157,"S9991111A",400,"2020-06-05",10001,1,NULL),
-(158,"T0001111B",900,"2020-06-06",10001,1,NULL),
-(159,"S7771111D",450,"2020-06-07",10001,1,NULL),
-(160,"T0000000B",300,"2020-06-08",10003,1,NULL),
-(161,"S9991111A",400,"2020-06-09",10001,1,NULL),
-(162,"S9990000A",300,"2020-06-10",10003,1,NULL),
-(163,"S8881111C",650,"2020-06-11",10003,1,NULL),
-(164,"S8881111C",600,"2020-06-12",10004,1,NULL),
-(165,"S7770000D",500,"2020-06-13",10001,1,NULL),
-(166,"T0000000B",600,"2020-06-14",10001,1,NULL),
-(167,"S9991111A",650,"2020-06-15",10002,1,NULL),
-(168,"S8881111C",550,"2020-06-16",10001,1,NULL),
-(169,"S9991111A",700,"2020-06-17",10002,1,NULL),
-(170,"T0001111B",550,"2020-06-18",10002,1,NULL),
-(171,"S8880000C",300,"2020-06-19",10004,1,NULL),
-(172,"S7771111D",950,"2020-06-20",10001,1,NULL),
-(173,"S7770000D",550,"2020-06-21",10003,1,NULL),
-(174,"T0001111B",850,"2020-06-22",10001,1,NULL),
-(175,"T0000000B",550,"2020-06-23",10004,1,NULL),
-(176,"S7770000D",900,"2020-06-24",10001,1,NULL),
-(177,"S7771111D",800,"2020-06-25",10002,1,NULL),
-(178,"S8881111C",800,"2020-06-26",10003,1,NULL),
-(179,"S9990000A",200,"2020-06-27",10004,1,NULL),
-(180,"S9990000A",750,"2020-06-28",10002,1,NULL),
-(181,"T0000000B",600,"2020-06-29",10004,1,NULL),
-(182,"T0000000B",850,"2020-06-30",10003,1,NULL),
-(183,"S7770000D",450,"2020-07-01",10001,1,NULL),
-(184,"S9991111A",250,"2020-07-02",10004,1,NULL),
-(185,"T0000000B",900,"2020-07-03",10004,1,NULL),
-(186,"S9990000A",300,"2020-07-04",10002,1,NULL),
-(187,"S7771111D",250,"2020-07-05",10002,1,NULL),
-(188,"S8881111C",650,"2020-07-06",10002,1,NULL),
-(189,"S7770000D",750,"2020-07-07",10001,1,NULL),
-(190,"S9991111A",800,"2020-07-08",10002,1,NULL),
-(191,"S8881111C",700,"2020-07-09",10001,1,NULL),
-(192,"S7771111D",700,"2020-07-10",10004,1,NULL),
-(193,"S8880000C",350,"2020-07-11",10004,1,NULL),
-(194,"S7770000D",600,"2020-07-12",10004,1,NULL),
-(195,"S7771111D",950,"2020-07-13",10004,1,NULL),
-(196,"S9990000A",650,"2020-07-14",10003,1,NULL),
-(197,"S7770000D",450,"2020-07-15",10004,1,NULL),
-(198,"S7770000D",250,"2020-07-16",10001,1,NULL),
-(199,"S9990000A",550,"2020-07-17",10002,1,NULL),
-(200,"S8880000C",750,"2020-07-18",10001,1,NULL),
-(201,"S8881111C",200,"2020-07-19",10001,1,NULL),
-(202,"T0001111B",700,"2020-07-20",10004,1,NULL),
-(203,"S7771111D",200,"2020-07-21",10003,1,NULL),
-(204,"S9991111A",600,"2020-07-22",10003,1,NULL),
-(205,"S7771111D",950,"2020-07-23",10003,1,NULL),
-(206,"S7770000D",950,"2020-07-24",10002,1,NULL),
-(207,"S7771111D",450,"2020-07-25",10003,1,NULL),
-(208,"S8880000C",300,"2020-07-26",10001,1,NULL),
-(209,"S8881111C",850,"2020-07-27",10001,1,NULL),
-(210,"S8881111C",350,"2020-07-28",10001,1,NULL),
-(211,"T0000000B",850,"2020-07-29",10003,1,NULL),
-(212,"S8880000C",500,"2020-07-30",10004,1,NULL),
-(213,"S7770000D",300,"2020-07-31",10001,1,NULL),
-(214,"S8881111C",700,"2020-08-01",10004,1,NULL),
-(215,"S9991111A",800,"2020-08-02",10004,1,NULL),
-(216,"S8881111C",200,"2020-08-03",10004,1,NULL),
-(217,"S8880000C",950,"2020-08-04",10004,1,NULL),
-(218,"S9990000A",350,"2020-08-05",10002,1,NULL),
-(219,"S9990000A",450,"2020-08-06",10003,1,NULL),
-(220,"S8880000C",200,"2020-08-07",10001,1,NULL),
-(221,"T0000000B",300,"2020-08-08",10002,1,NULL),
-(222,"S7770000D",350,"2020-08-09",10001,1,NULL),
-(223,"S8880000C",500,"2020-08-10",10002,1,NULL),
-(224,"T0000000B",350,"2020-08-11",10001,1,NULL),
-(225,"T0001111B",950,"2020-08-12",10004,1,NULL),
-(226,"S9991111A",300,"2020-08-13",10003,1,NULL),
-(227,"S9990000A",450,"2020-08-14",10004,1,NULL),
-(228,"S7771111D",800,"2020-08-15",10001,1,NULL),
-(229,"T0001111B",250,"2020-08-16",10002,1,NULL),
-(230,"T0001111B",400,"2020-08-17",10002,1,NULL),
-(231,"S9991111A",250,"2020-08-18",10004,1,NULL),
-(232,"S8880000C",900,"2020-08-19",10002,1,NULL),
-(233,"S7771111D",650,"2020-08-20",10004,1,NULL),
-(234,"T0001111B",450,"2020-08-21",10004,1,NULL),
-(235,"T0001111B",300,"2020-08-22",10002,1,NULL),
-(236,"S7770000D",950,"2020-08-23",10003,1,NULL),
-(237,"S8880000C",850,"2020-08-24",10003,1,NULL),
-(238,"S7771111D",400,"2020-08-25",10001,1,NULL),
-(239,"S7771111D",500,"2020-08-26",10001,1,NULL),
-(240,"S8881111C",850,"2020-08-27",10003,1,NULL),
-(241,"S8880000C",650,"2020-08-28",10003,1,NULL),
-(242,"S9991111A",950,"2020-08-29",10004,1,NULL),
-(243,"T0000000B",750,"2020-08-30",10004,1,NULL),
-(244,"T0000000B",800,"2020-08-31",10002,1,NULL),
-(245,"S9990000A",850,"2020-09-01",10003,1,NULL),
-(246,"T0001111B",350,"2020-09-02",10001,1,NULL),
-(247,"S8880000C",700,"2020-09-03",10001,1,NULL),
-(248,"S9991111A",900,"2020-09-04",10003,1,NULL),
-(249,"T0001111B",700,"2020-09-05",10003,1,NULL),
-(250,"S9990000A",950,"2020-09-06",10003,1,NULL),
-(251,"S7770000D",700,"2020-09-07",10002,1,NULL),
-(252,"S7770000D",250,"2020-09-08",10001,1,NULL),
-(253,"T0001111B",750,"2020-09-09",10002,1,NULL),
-(254,"S9990000A",650,"2020-09-10",10003,1,NULL),
-(255,"S8881111C",950,"2020-09-11",10002,1,NULL),
-(256,"S9991111A",600,"2020-09-12",10002,1,NULL),
-(257,"S7770000D",650,"2020-09-13",10004,1,NULL),
-(258,"S7771111D",200,"2020-09-14",10001,1,NULL),
-(259,"S8880000C",200,"2020-09-15",10001,1,NULL),
-(260,"S9990000A",400,"2020-09-16",10002,1,NULL),
-(261,"S8881111C",450,"2020-09-17",10001,1,NULL),
-(262,"S8881111C",300,"2020-09-18",10003,1,NULL),
-(263,"T0000000B",800,"2020-09-19",10001,1,NULL),
-(264,"S8880000C",950,"2020-09-20",10001,1,NULL),
-(265,"T0000000B",450,"2020-09-21",10001,1,NULL),
-(266,"T0001111B",800,"2020-09-22",10002,1,NULL),
-(267,"S7770000D",300,"2020-09-23",10003,1,NULL),
-(268,"S8881111C",850,"2020-09-24",10003,1,NULL),
-(269,"T0000000B",650,"2020-09-25",10001,1,NULL),
-(270,"S8881111C",500,"2020-09-26",10002,1,NULL),
-(271,"S9991111A",700,"2020-09-27",10004,1,NULL),
-(272,"S9990000A",950,"2020-09-28",10004,1,NULL),
-(273,"S8881111C",250,"2020-09-29",10003,1,NULL),
-(274,"S8881111C",650,"2020-09-30",10001,1,NULL),
-(275,"S7771111D",600,"2020-10-01",10003,1,NULL),
-(276,"S8880000C",400,"2020-10-02",10004,1,NULL),
-(277,"T0000000B",800,"2020-10-03",10002,1,NULL),
-(278,"S7770000D",550,"2020-10-04",10001,1,NULL),
-(279,"S7771111D",600,"2020-10-05",10002,1,NULL),
-(280,"S7770000D",650,"2020-10-06",10004,1,NULL),
-(281,"S9990000A",200,"2020-10-07",10004,1,NULL),
-(282,"S8880000C",500,"2020-10-08",10004,1,NULL),
-(283,"S8881111C",650,"2020-10-09",10004,1,NULL),
-(284,"S8881111C",900,"2020-10-10",10003,1,NULL),
-(285,"T0001111B",450,"2020-10-11",10003,1,NULL),
-(286,"S8881111C",250,"2020-10-12",10003,1,NULL),
-(287,"S7770000D",850,"2020-10-13",10001,1,NULL),
-(288,"S8881111C",450,"2020-10-14",10004,1,NULL),
-(289,"S8881111C",700,"2020-10-15",10002,1,NULL),
-(290,"S8881111C",700,"2020-10-16",10004,1,NULL),
-(291,"S8880000C",450,"2020-10-17",10001,1,NULL),
-(292,"S7771111D",550,"2020-10-18",10001,1,NULL),
-(293,"T0000000B",550,"2020-10-19",10004,1,NULL),
-(294,"S7771111D",400,"2020-10-20",10003,1,NULL),
-(295,"T0000000B",850,"2020-10-21",10004,1,NULL),
-(296,"S7771111D",950,"2020-10-22",10001,1,NULL),
-(297,"S8881111C",800,"2020-10-23",10003,1,NULL),
-(298,"S7770000D",650,"2020-10-24",10003,1,NULL),
-(299,"S8881111C",850,"2020-10-25",10001,1,NULL),
-(300,"S8881111C",250,"2020-10-26",10003,1,NULL),
-(301,"T0000000B",500,"2020-10-27",10004,1,NULL),
-(302,"S8880000C",550,"2020-10-28",10003,1,NULL),
-(303,"T0001111B",200,"2020-10-29",10003,1,NULL),
-(304,"T0001111B",750,"2020-10-30",10003,1,NULL),
-(305,"S8880000C",700,"2020-10-31",10002,1,NULL),
-(306,"S9990000A",450,"2020-11-01",10001,1,NULL),
-(307,"S8881111C",450,"2020-11-02",10002,1,NULL),
-(308,"S8881111C",500,"2020-11-03",10002,1,NULL),
-(309,"S7771111D",450,"2020-11-04",10004,1,NULL),
-(310,"S8880000C",450,"2020-11-05",10001,1,NULL),
-(311,"S7770000D",500,"2020-11-06",10004,1,NULL),
-(312,"S9991111A",700,"2020-11-07",10001,1,NULL),
-(313,"S7771111D",350,"2020-11-08",10004,1,NULL),
-(314,"S7770000D",750,"2020-11-09",10004,1,NULL),
-(315,"T0001111B",250,"2020-11-10",10004,1,NULL),
-(316,"S7771111D",950,"2020-11-11",10002,1,NULL),
-(317,"S7771111D",400,"2020-11-12",10002,1,NULL),
-(318,"T0001111B",900,"2020-11-13",10003,1,NULL),
-(319,"S8881111C",650,"2020-11-14",10004,1,NULL),
-(320,"S9990000A",850,"2020-11-15",10003,1,NULL),
-(321,"S9991111A",700,"2020-11-16",10002,1,NULL),
-(322,"S7770000D",700,"2020-11-17",10002,1,NULL),
-(323,"S8880000C",950,"2020-11-18",10004,1,NULL),
-(324,"S7770000D",350,"2020-11-19",10003,1,NULL),
-(325,"T0000000B",450,"2020-11-20",10001,1,NULL),
-(326,"S8880000C",200,"2020-11-21",10003,1,NULL),
-(327,"T0001111B",900,"2020-11-22",10002,1,NULL),
-(328,"S8880000C",400,"2020-11-23",10001,1,NULL),
-(329,"S9990000A",300,"2020-11-24",10003,1,NULL),
-(330,"T0001111B",550,"2020-11-25",10004,1,NULL),
-(331,"S8881111C",750,"2020-11-26",10004,1,NULL),
-(332,"S7770000D",750,"2020-11-27",10004,1,NULL),
-(333,"T0000000B",650,"2020-11-28",10004,1,NULL),
-(334,"S7770000D",500,"2020-11-29",10001,1,NULL),
-(335,"S8880000C",750,"2020-11-30",10002,1,NULL),
-(336,"S9990000A",900,"2020-12-01",10003,1,NULL),
-(337,"S9990000A",800,"2020-12-02",10003,1,NULL),
-(338,"S7771111D",800,"2020-12-03",10002,1,NULL),
-(339,"T0001111B",950,"2020-12-04",10003,1,NULL),
-(340,"T0001111B",350,"2020-12-05",10001,1,NULL),
-(341,"S8880000C",250,"2020-12-06",10001,1,NULL),
-(342,"S9991111A",300,"2020-12-07",10003,1,NULL),
-(343,"S7771111D",250,"2020-12-08",10001,1,NULL),
-(344,"S8880000C",500,"2020-12-09",10002,1,NULL),
-(345,"S9990000A",600,"2020-12-10",10001,1,NULL),
-(346,"S9991111A",750,"2020-12-11",10001,1,NULL),
-(347,"S7771111D",800,"2020-12-12",10004,1,NULL),
-(348,"S8881111C",900,"2020-12-13",10002,1,NULL),
-(349,"S9990000A",450,"2020-12-14",10003,1,NULL),
-(350,"S7771111D",600,"2020-12-15",10002,1,NULL),
-(351,"S7771111D",550,"2020-12-16",10004,1,NULL),
-(352,"S8881111C",850,"2020-12-17",10001,1,NULL),
-(353,"S7770000D",550,"2020-12-18",10003,1,NULL),
-(354,"S8881111C",950,"2020-12-19",10001,1,NULL),
-(355,"S9990000A",950,"2020-12-20",10001,1,NULL),
-(356,"S9991111A",300,"2020-12-21",10004,1,NULL),
-(357,"T0000000B",950,"2020-12-22",10001,1,NULL),
-(358,"T0000000B",900,"2020-12-23",10001,1,NULL),
-(359,"S8880000C",200,"2020-12-24",10003,1,NULL),
-(360,"S8880000C",750,"2020-12-25",10002,1,NULL),
-(361,"S8881111C",950,"2020-12-26",10004,1,NULL),
-(362,"S7770000D",300,"2020-12-27",10003,1,NULL),
-(363,"T0001111B",950,"2020-12-28",10004,1,NULL),
-(364,"S7770000D",500,"2020-12-29",10004,1,NULL),
-(365,"T0001111B",750,"2020-12-30",10002,1,NULL),
-(366,"S9991111A",300,"2020-12-31",10004,1,NULL),
-(367,"T0000000B",950,"2021-01-01",10002,1,NULL),
-(368,"T0001111B",750,"2021-01-02",10002,1,NULL),
-(369,"S7770000D",700,"2021-01-03",10002,1,NULL),
-(370,"S8880000C",650,"2021-01-04",10001,1,NULL),
-(371,"S7770000D",550,"2021-01-05",10001,1,NULL),
-(372,"S9990000A",550,"2021-01-06",10003,1,NULL),
-(373,"S8880000C",300,"2021-01-07",10001,1,NULL),
-(374,"T0001111B",700,"2021-01-08",10003,1,NULL),
-(375,"S9990000A",250,"2021-01-09",10001,1,NULL),
-(376,"T0000000B",250,"2021-01-10",10004,1,NULL),
-(377,"S7770000D",500,"2021-01-11",10003,1,NULL),
-(378,"S8880000C",200,"2021-01-12",10003,1,NULL),
-(379,"S7771111D",750,"2021-01-13",10002,1,NULL),
-(380,"S7770000D",900,"2021-01-14",10004,1,NULL),
-(381,"S9991111A",400,"2021-01-15",10001,1,NULL),
-(382,"T0001111B",750,"2021-01-16",10003,1,NULL),
-(383,"S7771111D",300,"2021-01-17",10003,1,NULL),
-(384,"S7771111D",850,"2021-01-18",10002,1,NULL),
-(385,"S8880000C",550,"2021-01-19",10002,1,NULL),
-(386,"T0000000B",800,"2021-01-20",10003,1,NULL),
-(387,"S8880000C",500,"2021-01-21",10001,1,NULL),
-(388,"S9990000A",850,"2021-01-22",10001,1,NULL),
-(389,"S7770000D",950,"2021-01-23",10001,1,NULL),
-(390,"T0000000B",700,"2021-01-24",10003,1,NULL),
-(391,"S7770000D",450,"2021-01-25",10004,1,NULL),
-(392,"S7771111D",200,"2021-01-26",10002,1,NULL),
-(393,"S7771111D",200,"2021-01-27",10002,1,NULL),
-(394,"S8880000C",300,"2021-01-28",10002,1,NULL),
-(395,"T0000000B",650,"2021-01-29",10001,1,NULL),
-(396,"S7771111D",250,"2021-01-30",10003,1,NULL),
-(397,"T0000000B",350,"2021-01-31",10004,1,NULL),
-(398,"S7771111D",600,"2021-02-01",10002,1,NULL),
-(399,"T0001111B",800,"2021-02-02",10004,1,NULL),
-(400,"T0000000B",650,"2021-02-03",10001,1,NULL),
-(401,"S8881111C",450,"2021-02-04",10001,1,NULL),
-(402,"S7770000D",700,"2021-02-05",10004,1,NULL),
-(403,"T0000000B",650,"2021-02-06",10001,1,NULL),
-(404,"T0000000B",700,"2021-02-07",10001,1,NULL),
-(405,"S7770000D",950,"2021-02-08",10002,1,NULL),
-(406,"S7770000D",900,"2021-02-09",10004,1,NULL),
-(407,"S8880000C",900,"2021-02-10",10003,1,NULL),
-(408,"S9991111A",550,"2021-02-11",10004,1,NULL),
-(409,"S7771111D",550,"2021-02-12",10003,1,NULL),
-(410,"S7770000D",200,"2021-02-13",10003,1,NULL),
-(411,"S8881111C",950,"2021-02-14",10002,1,NULL),
-(412,"T0001111B",450,"2021-02-15",10001,1,NULL),
-(413,"S8880000C",700,"2021-02-16",10002,1,NULL),
-(414,"S8881111C",450,"2021-02-17",10004,1,NULL),
-(415,"S9991111A",200,"2021-02-18",10002,1,NULL),
-(416,"S7771111D",900,"2021-02-19",10002,1,NULL),
-(417,"S7770000D",250,"2021-02-20",10004,1,NULL),
-(418,"T0001111B",750,"2021-02-21",10001,1,NULL),
-(419,"S8881111C",900,"2021-02-22",10002,1,NULL),
-(420,"S9991111A",700,"2021-02-23",10001,1,NULL),
-(421,"S8880000C",750,"2021-02-24",10002,1,NULL),
-(422,"S7770000D",200,"2021-02-25",10004,1,NULL),
-(423,"S8881111C",750,"2021-02-26",10004,1,NULL),
-(424,"T0000000B",350,"2021-02-27",10001,1,NULL),
-(425,"T0000000B",750,"2021-02-28",10003,1,NULL),
-(426,"S8880000C",700,"2021-03-01",10004,1,NULL),
-(427,"S8880000C",600,"2021-03-02",10002,1,NULL),
-(428,"T0000000B",700,"2021-03-03",10004,1,NULL),
-(429,"S7770000D",850,"2021-03-04",10002,1,NULL),
-(430,"T0000000B",650,"2021-03-05",10004,1,NULL),
-(431,"T0001111B",900,"2021-03-06",10004,1,NULL),
-(432,"S8881111C",200,"2021-03-07",10002,1,NULL),
-(433,"S7771111D",550,"2021-03-08",10003,1,NULL),
-(434,"S9990000A",850,"2021-03-09",10002,1,NULL),
-(435,"S8881111C",300,"2021-03-10",10003,1,NULL),
-(436,"S9990000A",900,"2021-03-11",10004,1,NULL),
-(437,"S9991111A",650,"2021-03-12",10003,1,NULL),
-(438,"T0000000B",800,"2021-03-13",10002,1,NULL),
-(439,"S7771111D",650,"2021-03-14",10002,1,NULL),
-(440,"S8880000C",250,"2021-03-15",10001,1,NULL),
-(441,"S8880000C",600,"2021-03-16",10003,1,NULL),
-(442,"S8881111C",650,"2021-03-17",10002,1,NULL),
-(443,"T0000000B",600,"2021-03-18",10004,1,NULL),
-(444,"S8880000C",750,"2021-03-19",10003,1,NULL),
-(445,"S7770000D",600,"2021-03-20",10003,1,NULL),
-(446,"S9990000A",250,"2021-03-21",10002,1,NULL),
-(447,"S8880000C",700,"2021-03-22",10003,1,NULL),
-(448,"S9990000A",650,"2021-03-23",10004,1,NULL),
-(449,"S7771111D",600,"2021-03-24",10004,1,NULL),
-(450,"T0000000B",250,"2021-03-25",10001,1,NULL),
-(451,"S9991111A",600,"2021-03-26",10003,1,NULL),
-(452,"S7771111D",400,"2021-03-27",10003,1,NULL),
-(453,"S7770000D",250,"2021-03-28",10002,1,NULL),
-(454,"S9990000A",950,"2021-03-29",10001,1,NULL),
-(455,"S7771111D",400,"2021-03-30",10002,1,NULL),
-(456,"S9990000A",400,"2021-03-31",10001,1,NULL),
-(457,"S9991111A",250,"2021-04-01",10003,1,NULL),
-(458,"S7770000D",900,"2021-04-02",10004,1,NULL),
-(459,"S8881111C",400,"2021-04-03",10003,1,NULL),
-(460,"S9990000A",350,"2021-04-04",10004,1,NULL),
-(461,"S7770000D",200,"2021-04-05",10004,1,NULL),
-(462,"S7771111D",250,"2021-04-06",10004,1,NULL),
-(463,"S7770000D",450,"2021-04-07",10001,1,NULL),
-(464,"S8880000C",900,"2021-04-08",10003,1,NULL),
-(465,"T0001111B",250,"2021-04-09",10002,1,NULL),
-(466,"S7770000D",550,"2021-04-10",10003,1,NULL),
-(467,"T0000000B",450,"2021-04-11",10004,1,NULL),
-(468,"S9991111A",900,"2021-04-12",10002,1,NULL),
-(469,"T0000000B",450,"2021-04-13",10001,1,NULL),
-(470,"S8881111C",650,"2021-04-14",10002,1,NULL),
-(471,"T0001111B",400,"2021-04-15",10001,1,NULL),
-(472,"S7771111D",500,"2021-04-16",10001,1,NULL),
-(473,"S9991111A",650,"2021-04-17",10004,1,NULL),
-(474,"S7771111D",300,"2021-04-18",10003,1,NULL),
-(475,"S9990000A",400,"2021-04-19",10004,1,NULL),
-(476,"S7771111D",750,"2021-04-20",10002,1,NULL),
-(477,"T0001111B",900,"2021-04-21",10001,1,NULL),
-(478,"S8881111C",650,"2021-04-22",10002,1,NULL),
-(479,"S8881111C",800,"2021-04-23",10003,1,NULL),
-(480,"S7770000D",350,"2021-04-24",10003,1,NULL),
-(481,"S8880000C",650,"2021-04-25",10004,1,NULL),
-(482,"S8881111C",300,"2021-04-26",10004,1,NULL),
-(483,"T0000000B",600,"2021-04-27",10002,1,NULL),
-(484,"S7770000D",500,"2021-04-28",10002,1,NULL),
-(485,"S8880000C",550,"2021-04-29",10001,1,NULL),
-(486,"S9990000A",450,"2021-04-30",10001,1,NULL),
-(487,"S7770000D",900,"2021-05-01",10001,1,NULL),
-(488,"S9990000A",250,"2021-05-02",10001,1,NULL),
-(489,"S9991111A",450,"2021-05-03",10003,1,NULL),
-(490,"T0000000B",900,"2021-05-04",10001,1,NULL),
-(491,"T0000000B",450,"2021-05-05",10003,1,NULL),
-(492,"S7770000D",950,"2021-05-06",10004,1,NULL),
-(493,"T0000000B",650,"2021-05-07",10002,1,NULL),
-(494,"S9991111A",450,"2021-05-08",10001,1,NULL),
-(495,"T0001111B",700,"2021-05-09",10001,1,NULL),
-(496,"T0001111B",850,"2021-05-10",10004,1,NULL),
-(497,"S9990000A",500,"2021-05-11",10002,1,NULL),
-(498,"S8881111C",800,"2021-05-12",10001,1,NULL),
-(499,"S8880000C",700,"2021-05-13",10003,1,NULL),
-(500,"T0001111B",200,"2021-05-14",10003,1,NULL),
-(501,"T0000000B",250,"2021-05-15",10004,1,NULL),
-(502,"T0000000B",550,"2021-05-16",10003,1,NULL),
-(503,"T0001111B",200,"2021-05-17",10004,1,NULL),
-(504,"S9991111A",750,"2021-05-18",10002,1,NULL),
-(505,"S8881111C",900,"2021-05-19",10001,1,NULL),
-(506,"T0000000B",350,"2021-05-20",10003,1,NULL),
-(507,"S9990000A",800,"2021-05-21",10001,1,NULL),
-(508,"S8881111C",750,"2021-05-22",10001,1,NULL),
-(509,"T0001111B",850,"2021-05-23",10002,1,NULL),
-(510,"T0001111B",500,"2021-05-24",10001,1,NULL),
-(511,"S9990000A",850,"2021-05-25",10003,1,NULL),
-(512,"S9991111A",600,"2021-05-26",10001,1,NULL),
-(513,"S9991111A",550,"2021-05-27",10003,1,NULL),
-(514,"S8881111C",750,"2021-05-28",10001,1,NULL),
-(515,"S9991111A",400,"2021-05-29",10004,1,NULL),
-(516,"T0000000B",400,"2021-05-30",10002,1,NULL),
-(517,"T0001111B",250,"2021-05-31",10003,1,NULL),
-(518,"S8881111C",750,"2021-06-01",10001,1,NULL),
-(519,"S8880000C",750,"2021-06-02",10001,1,NULL),
-(520,"T0001111B",650,"2021-06-03",10002,1,NULL),
-(521,"S8881111C",350,"2021-06-04",10003,1,NULL),
-(522,"T0000000B",250,"2021-06-05",10003,1,NULL),
-(523,"T0001111B",300,"2021-06-06",10002,1,NULL),
-(524,"T0000000B",250,"2021-06-07",10004,1,NULL),
-(525,"S9990000A",900,"2021-06-08",10001,1,NULL),
-(526,"S8881111C",900,"2021-06-09",10001,1,NULL),
-(527,"S8881111C",200,"2021-06-10",10001,1,NULL),
-(528,"S8881111C",600,"2021-06-11",10004,1,NULL),
-(529,"T0000000B",550,"2021-06-12",10003,1,NULL),
-(530,"S8881111C",700,"2021-06-13",10001,1,NULL),
-(531,"S8881111C",650,"2021-06-14",10003,1,NULL),
-(532,"S9990000A",500,"2021-06-15",10003,1,NULL),
-(533,"S8880000C",450,"2021-06-16",10003,1,NULL),
-(534,"T0001111B",200,"2021-06-17",10002,1,NULL),
-(535,"S8881111C",500,"2021-06-18",10004,1,NULL),
-(536,"T0001111B",400,"2021-06-19",10004,1,NULL),
-(537,"S8881111C",900,"2021-06-20",10004,1,NULL),
-(538,"S8880000C",350,"2021-06-21",10002,1,NULL),
-(539,"T0001111B",950,"2021-06-22",10003,1,NULL),
-(540,"S9991111A",400,"2021-06-23",10003,1,NULL),
-(541,"T0000000B",950,"2021-06-24",10002,1,NULL),
-(542,"S7771111D",750,"2021-06-25",10004,1,NULL),
-(543,"T0000000B",550,"2021-06-26",10004,1,NULL),
-(544,"S9991111A",800,"2021-06-27",10003,1,NULL),
-(545,"S8880000C",250,"2021-06-28",10004,1,NULL),
-(546,"S8881111C",650,"2021-06-29",10002,1,NULL),
-(547,"S7770000D",350,"2021-06-30",10001,1,NULL),
-(548,"T0001111B",500,"2021-07-01",10001,1,NULL),
-(549,"S7771111D",500,"2021-07-02",10004,1,NULL),
-(550,"T0001111B",750,"2021-07-03",10004,1,NULL),
-(551,"S8880000C",950,"2021-07-04",10002,1,NULL),
-(552,"S9990000A",800,"2021-07-05",10001,1,NULL),
-(553,"T0000000B",650,"2021-07-06",10003,1,NULL),
-(554,"T0001111B",700,"2021-07-07",10004,1,NULL),
-(555,"S8881111C",250,"2021-07-08",10002,1,NULL),
-(556,"S8881111C",800,"2021-07-09",10002,1,NULL),
-(557,"S7771111D",350,"2021-07-10",10003,1,NULL),
-(558,"S7770000D",800,"2021-07-11",10002,1,NULL),
-(559,"S9991111A",800,"2021-07-12",10002,1,NULL),
-(560,"T0001111B",500,"2021-07-13",10004,1,NULL),
-(561,"T0001111B",650,"2021-07-14",10001,1,NULL),
-(562,"T0000000B",600,"2021-07-15",10001,1,NULL),
-(563,"S7770000D",200,"2021-07-16",10003,1,NULL),
-(564,"S8880000C",550,"2021-07-17",10004,1,NULL),
-(565,"S7770000D",550,"2021-07-18",10001,1,NULL),
-(566,"S7771111D",600,"2021-07-19",10003,1,NULL),
-(567,"T0001111B",650,"2021-07-20",10004,1,NULL),
-(568,"T0000000B",750,"2021-07-21",10003,1,NULL),
-(569,"S8880000C",800,"2021-07-22",10004,1,NULL),
-(570,"S8880000C",400,"2021-07-23",10004,1,NULL),
-(571,"S8881111C",200,"2021-07-24",10004,1,NULL),
-(572,"S8880000C",450,"2021-07-25",10002,1,NULL),
-(573,"S8880000C",250,"2021-07-26",10004,1,NULL),
-(574,"S9991111A",400,"2021-07-27",10003,1,NULL),
-(575,"S9990000A",900,"2021-07-28",10004,1,NULL),
-(576,"S9991111A",400,"2021-07-29",10002,1,NULL),
-(577,"T0001111B",200,"2021-07-30",10003,1,NULL),
-(578,"S8880000C",300,"2021-07-31",10004,1,NULL),
-(579,"S7770000D",500,"2021-08-01",10001,1,NULL),
-(580,"S8880000C",550,"2021-08-02",10003,1,NULL),
-(581,"T0000000B",450,"2021-08-03",10003,1,NULL),
-(582,"T0001111B",250,"2021-08-04",10004,1,NULL),
-(583,"T0001111B",500,"2021-08-05",10003,1,NULL),
-(584,"S7770000D",800,"2021-08-06",10004,1,NULL),
-(585,"S8880000C",700,"2021-08-07",10001,1,NULL),
-(586,"S8881111C",900,"2021-08-08",10003,1,NULL),
-(587,"T0001111B",750,"2021-08-09",10002,1,NULL),
-(588,"T0000000B",300,"2021-08-10",10003,1,NULL),
-(589,"T0001111B",550,"2021-08-11",10004,1,NULL),
-(590,"S8881111C",600,"2021-08-12",10002,1,NULL),
-(591,"S7770000D",700,"2021-08-13",10003,1,NULL),
-(592,"T0000000B",250,"2021-08-14",10001,1,NULL),
-(593,"S7771111D",350,"2021-08-15",10001,1,NULL),
-(594,"S8881111C",550,"2021-08-16",10004,1,NULL),
-(595,"S9991111A",900,"2021-08-17",10001,1,NULL),
-(596,"S9991111A",350,"2021-08-18",10002,1,NULL),
-(597,"S9991111A",300,"2021-08-19",10004,1,NULL),
-(598,"T0001111B",700,"2021-08-20",10001,1,NULL),
-(599,"S7771111D",900,"2021-08-21",10001,1,NULL),
-(600,"S9991111A",600,"2021-08-22",10001,1,NULL),
-(601,"T0000000B",600,"2021-08-23",10004,1,NULL),
-(602,"S8881111C",500,"2021-08-24",10001,1,NULL),
-(603,"S8881111C",850,"2021-08-25",10001,1,NULL),
-(604,"T0001111B",500,"2021-08-26",10001,1,NULL),
-(605,"S8881111C",650,"2021-08-27",10002,1,NULL),
-(606,"S7770000D",800,"2021-08-28",10004,1,NULL),
-(607,"T0001111B",750,"2021-08-29",10002,1,NULL),
-(608,"T0001111B",500,"2021-08-30",10002,1,NULL),
-(609,"S8880000C",650,"2021-08-31",10002,1,NULL),
-(610,"S7771111D",800,"2021-09-01",10003,1,NULL),
-(611,"S7771111D",500,"2021-09-02",10002,1,NULL),
-(612,"S9990000A",900,"2021-09-03",10004,1,NULL),
-(613,"S8880000C",900,"2021-09-04",10002,1,NULL),
-(614,"S7770000D",750,"2021-09-05",10004,1,NULL),
-(615,"S9990000A",300,"2021-09-06",10004,1,NULL),
-(616,"S7771111D",950,"2021-09-07",10003,1,NULL),
-(617,"S9991111A",550,"2021-09-08",10001,1,NULL),
-(618,"S8881111C",450,"2021-09-09",10002,1,NULL),
-(619,"S8881111C",900,"2021-09-10",10002,1,NULL),
-(620,"S7771111D",450,"2021-09-11",10002,1,NULL),
-(621,"S7770000D",450,"2021-09-12",10002,1,NULL),
-(622,"S9990000A",850,"2021-09-13",10004,1,NULL),
-(623,"S7770000D",700,"2021-09-14",10004,1,NULL),
-(624,"S7770000D",900,"2021-09-15",10003,1,NULL),
-(625,"S7771111D",500,"2021-09-16",10004,1,NULL),
-(626,"S9991111A",600,"2021-09-17",10004,1,NULL),
-(627,"S7771111D",650,"2021-09-18",10003,1,NULL),
-(628,"S7771111D",350,"2021-09-19",10002,1,NULL),
-(629,"S8880000C",750,"2021-09-20",10003,1,NULL),
-(630,"T0000000B",350,"2021-09-21",10001,1,NULL),
-(631,"S7771111D",600,"2021-09-22",10001,1,NULL),
-(632,"S7771111D",750,"2021-09-23",10002,1,NULL),
-(633,"S9991111A",600,"2021-09-24",10003,1,NULL),
-(634,"S9991111A",850,"2021-09-25",10002,1,NULL),
-(635,"S9990000A",400,"2021-09-26",10001,1,NULL),
-(636,"S8881111C",200,"2021-09-27",10001,1,NULL),
-(637,"S8881111C",850,"2021-09-28",10003,1,NULL),
-(638,"S7771111D",650,"2021-09-29",10001,1,NULL),
-(639,"S8881111C",200,"2021-09-30",10001,1,NULL),
-(640,"T0000000B",900,"2021-10-01",10002,1,NULL),
-(641,"T0000000B",850,"2021-10-02",10004,1,NULL),
-(642,"S9990000A",400,"2021-10-03",10001,1,NULL),
-(643,"S9990000A",300,"2021-10-04",10001,1,NULL),
-(644,"S8881111C",750,"2021-10-05",10003,1,NULL),
-(645,"S7770000D",450,"2021-10-06",10004,1,NULL),
-(646,"T0001111B",300,"2021-10-07",10003,1,NULL),
-(647,"S7770000D",700,"2021-10-08",10004,1,NULL),
-(648,"S8880000C",550,"2021-10-09",10004,1,NULL),
-(649,"T0000000B",200,"2021-10-10",10002,1,NULL),
-(650,"S7770000D",450,"2021-10-11",10002,1,NULL),
-(651,"S9991111A",700,"2021-10-12",10001,1,NULL),
-(652,"S9990000A",800,"2021-10-13",10004,1,NULL),
-(653,"S9990000A",250,"2021-10-14",10004,1,NULL),
-(654,"S7770000D",950,"2021-10-15",10001,1,NULL),
-(655,"S8881111C",450,"2021-10-16",10002,1,NULL),
-(656,"S9991111A",250,"2021-10-17",10003,1,NULL),
-(657,"S8881111C",700,"2021-10-18",10001,1,NULL),
-(658,"S7771111D",200,"2021-10-19",10002,1,NULL),
-(659,"S8881111C",450,"2021-10-20",10002,1,NULL),
-(660,"S9991111A",650,"2021-10-21",10004,1,NULL),
-(661,"S8880000C",800,"2021-10-22",10003,1,NULL),
-(662,"S7770000D",850,"2021-10-23",10004,1,NULL),
-(663,"S8880000C",200,"2021-10-24",10004,1,NULL),
-(664,"S7770000D",400,"2021-10-25",10002,1,NULL),
-(665,"S8880000C",400,"2021-10-26",10002,1,NULL),
-(666,"T0000000B",950,"2021-10-27",10001,1,NULL),
-(667,"S8881111C",250,"2021-10-28",10003,1,NULL),
-(668,"S8880000C",900,"2021-10-29",10003,1,NULL),
-(669,"S7770000D",500,"2021-10-30",10003,1,NULL),
-(670,"S8881111C",400,"2021-10-31",10002,1,NULL),
-(671,"S8881111C",400,"2021-11-01",10003,1,NULL),
-(672,"S9990000A",600,"2021-11-02",10002,1,NULL),
-(673,"S8880000C",400,"2021-11-03",10004,1,NULL),
-(674,"S9990000A",500,"2021-11-04",10001,1,NULL),
-(675,"S7770000D",650,"2021-11-05",10003,1,NULL),
-(676,"S9990000A",200,"2021-11-06",10004,1,NULL),
-(677,"S9991111A",850,"2021-11-07",10004,1,NULL),
-(678,"T0001111B",450,"2021-11-08",10002,1,NULL),
-(679,"T0000000B",750,"2021-11-09",10001,1,NULL),
-(680,"S9991111A",600,"2021-11-10",10004,1,NULL),
-(681,"S8880000C",600,"2021-11-11",10004,1,NULL),
-(682,"S8881111C",250,"2021-11-12",10004,1,NULL),
-(683,"S7770000D",750,"2021-11-13",10001,1,NULL),
-(684,"S8880000C",300,"2021-11-14",10001,1,NULL),
-(685,"T0001111B",350,"2021-11-15",10002,1,NULL),
-(686,"T0000000B",250,"2021-11-16",10004,1,NULL),
-(687,"S8881111C",450,"2021-11-17",10001,1,NULL),
-(688,"S9990000A",450,"2021-11-18",10002,1,NULL),
-(689,"S7771111D",350,"2021-11-19",10001,1,NULL),
-(690,"T0000000B",750,"2021-11-20",10002,1,NULL),
-(691,"S8881111C",350,"2021-11-21",10004,1,NULL),
-(692,"T0000000B",500,"2021-11-22",10003,1,NULL),
-(693,"S9990000A",800,"2021-11-23",10002,1,NULL),
-(694,"S9990000A",800,"2021-11-24",10003,1,NULL),
-(695,"T0000000B",250,"2021-11-25",10003,1,NULL),
-(696,"S7771111D",750,"2021-11-26",10003,1,NULL),
-(697,"S7771111D",300,"2021-11-27",10002,1,NULL),
-(698,"S8880000C",600,"2021-11-28",10001,1,NULL),
-(699,"S7770000D",450,"2021-11-29",10002,1,NULL),
-(700,"S8881111C",750,"2021-11-30",10004,1,NULL),
-(701,"S8880000C",800,"2021-12-01",10001,1,NULL),
-(702,"S7771111D",850,"2021-12-02",10001,1,NULL),
-(703,"S9990000A",500,"2021-12-03",10004,1,NULL),
-(704,"S8881111C",700,"2021-12-04",10003,1,NULL),
-(705,"T0001111B",300,"2021-12-05",10003,1,NULL),
-(706,"S7770000D",350,"2021-12-06",10002,1,NULL),
-(707,"S8881111C",950,"2021-12-07",10002,1,NULL),
-(708,"S8881111C",250,"2021-12-08",10002,1,NULL),
-(709,"T0001111B",250,"2021-12-09",10004,1,NULL),
-(710,"S9990000A",350,"2021-12-10",10003,1,NULL),
-(711,"S7770000D",350,"2021-12-11",10002,1,NULL),
-(712,"S7770000D",850,"2021-12-12",10004,1,NULL),
-(713,"S8880000C",950,"2021-12-13",10004,1,NULL),
-(714,"S8880000C",650,"2021-12-14",10002,1,NULL),
-(715,"S8880000C",400,"2021-12-15",10002,1,NULL),
-(716,"S7771111D",400,"2021-12-16",10004,1,NULL),
-(717,"S9991111A",950,"2021-12-17",10002,1,NULL),
-(718,"S9991111A",950,"2021-12-18",10001,1,NULL),
-(719,"S7771111D",450,"2021-12-19",10002,1,NULL),
-(720,"S8880000C",250,"2021-12-20",10003,1,NULL),
-(721,"T0000000B",700,"2021-12-21",10004,1,NULL),
-(722,"T0000000B",450,"2021-12-22",10003,1,NULL),
-(723,"S9990000A",900,"2021-12-23",10003,1,NULL),
-(724,"S7771111D",950,"2021-12-24",10002,1,NULL),
-(725,"S9991111A",900,"2021-12-25",10003,1,NULL),
-(726,"S7771111D",550,"2021-12-26",10003,1,NULL),
-(727,"S7770000D",200,"2021-12-27",10004,1,NULL),
-(728,"S8880000C",400,"2021-12-28",10002,1,NULL),
-(729,"S8881111C",700,"2021-12-29",10004,1,NULL),
-(730,"S7771111D",500,"2021-12-30",10002,1,NULL),
-(731,"S7771111D",450,"2021-12-31",10003,1,NULL),
-(732,"S7771111D",650,"2022-01-01",10004,1,NULL),
-(733,"S9991111A",200,"2022-01-02",10001,1,NULL),
-(734,"T0001111B",600,"2022-01-03",10002,1,NULL),
-(735,"S9990000A",200,"2022-01-04",10004,1,NULL),
-(736,"S9990000A",650,"2022-01-05",10003,1,NULL),
-(737,"T0000000B",400,"2022-01-06",10004,1,NULL),
-(738,"T0000000B",600,"2022-01-07",10002,1,NULL),
-(739,"T0001111B",500,"2022-01-08",10002,1,NULL),
-(740,"S8881111C",950,"2022-01-09",10004,1,NULL),
-(741,"S8880000C",750,"2022-01-10",10004,1,NULL),
-(742,"S7770000D",850,"2022-01-11",10001,1,NULL),
-(743,"S8881111C",250,"2022-01-12",10001,1,NULL),
-(744,"S9991111A",750,"2022-01-13",10004,1,NULL),
-(745,"S8880000C",600,"2022-01-14",10002,1,NULL),
-(746,"S8880000C",300,"2022-01-15",10004,1,NULL),
-(747,"S9990000A",800,"2022-01-16",10001,1,NULL),
-(748,"S7770000D",500,"2022-01-17",10002,1,NULL),
-(749,"S7771111D",350,"2022-01-18",10003,1,NULL),
-(750,"T0000000B",700,"2022-01-19",10003,1,NULL),
-(751,"T0000000B",400,"2022-01-20",10001,1,NULL),
-(752,"S8881111C",450,"2022-01-21",10004,1,NULL),
-(753,"S8881111C",650,"2022-01-22",10001,1,NULL),
-(754,"S8880000C",200,"2022-01-23",10002,1,NULL),
-(755,"S7770000D",700,"2022-01-24",10004,1,NULL),
-(756,"S9991111A",200,"2022-01-25",10004,1,NULL),
-(757,"S8880000C",850,"2022-01-26",10003,1,NULL),
-(758,"S9991111A",650,"2022-01-27",10004,1,NULL),
-(759,"S9990000A",500,"2022-01-28",10001,1,NULL),
-(760,"S8880000C",850,"2022-01-29",10002,1,NULL),
-(761,"S9991111A",300,"2022-01-30",10001,1,NULL),
-(762,"T0001111B",500,"2022-01-31",10001,1,NULL),
-(763,"T0001111B",550,"2022-02-01",10004,1,NULL),
-(764,"T0000000B",350,"2022-02-02",10002,1,NULL),
-(765,"S7770000D",650,"2022-02-03",10004,1,NULL),
-(766,"S9991111A",550,"2022-02-04",10002,1,NULL),
-(767,"S7771111D",200,"2022-02-05",10004,1,NULL),
-(768,"S8881111C",600,"2022-02-06",10003,1,NULL),
-(769,"T0001111B",300,"2022-02-07",10003,1,NULL),
-(770,"S9991111A",900,"2022-02-08",10004,1,NULL),
-(771,"T0001111B",700,"2022-02-09",10002,1,NULL),
-(772,"S8880000C",850,"2022-02-10",10003,1,NULL),
-(773,"T0000000B",250,"2022-02-11",10001,1,NULL),
-(774,"S8880000C",900,"2022-02-12",10004,1,NULL),
-(775,"S7770000D",500,"2022-02-13",10001,1,NULL),
-(776,"S7770000D",350,"2022-02-14",10004,1,NULL),
-(777,"S9990000A",500,"2022-02-15",10002,1,NULL),
-(778,"S9990000A",300,"2022-02-16",10001,1,NULL),
-(779,"S8880000C",650,"2022-02-17",10004,1,NULL),
-(780,"T0000000B",750,"2022-02-18",10002,1,NULL),
-(781,"S7770000D",750,"2022-02-19",10004,1,NULL),
-(782,"S7770000D",950,"2022-02-20",10003,1,NULL),
-(783,"S9990000A",850,"2022-02-21",10001,1,NULL),
-(784,"S8880000C",900,"2022-02-22",10004,1,NULL),
-(785,"S8881111C",300,"2022-02-23",10003,1,NULL),
-(786,"S8881111C",450,"2022-02-24",10002,1,NULL),
-(787,"S9991111A",750,"2022-02-25",10002,1,NULL),
-(788,"S8880000C",650,"2022-02-26",10004,1,NULL),
-(789,"S9991111A",600,"2022-02-27",10002,1,NULL),
-(790,"T0000000B",400,"2022-02-28",10004,1,NULL),
-(791,"S9990000A",200,"2022-03-01",10004,1,NULL),
-(792,"T0001111B",950,"2022-03-02",10004,1,NULL),
-(793,"T0001111B",200,"2022-03-03",10004,1,NULL),
-(794,"S7770000D",250,"2022-03-04",10003,1,NULL),
-(795,"T0000000B",600,"2022-03-05",10003,1,NULL),
-(796,"T0001111B",300,"2022-03-06",10004,1,NULL),
-(797,"T0001111B",350,"2022-03-07",10003,1,NULL),
-(798,"T0000000B",650,"2022-03-08",10003,1,NULL),
-(799,"S9990000A",200,"2022-03-09",10001,1,NULL),
-(800,"S9990000A",350,"2022-03-10",10002,1,NULL),
-(801,"S7770000D",200,"2022-03-11",10001,1,NULL),
-(802,"S7770000D",300,"2022-03-12",10001,1,NULL),
-(803,"S9990000A",900,"2022-03-13",10002,1,NULL),
-(804,"T0001111B",550,"2022-03-14",10002,1,NULL),
-(805,"S9991111A",850,"2022-03-15",10001,1,NULL),
-(806,"T0001111B",300,"2022-03-16",10002,1,NULL),
-(807,"S9990000A",600,"2022-03-17",10004,1,NULL),
-(808,"S8880000C",400,"2022-03-18",10002,1,NULL),
-(809,"S8880000C",650,"2022-03-19",10001,1,NULL),
-(810,"S9990000A",900,"2022-03-20",10004,1,NULL),
-(811,"S8880000C",400,"2022-03-21",10002,1,NULL),
-(812,"S8880000C",750,"2022-03-22",10001,1,NULL),
-(813,"S8881111C",400,"2022-03-23",10001,1,NULL),
-(814,"S9991111A",700,"2022-03-24",10003,1,NULL),
-(815,"S7771111D",350,"2022-03-25",10004,1,NULL),
-(816,"S8880000C",700,"2022-03-26",10001,1,NULL),
-(817,"S7770000D",600,"2022-03-27",10003,1,NULL),
-(818,"S8881111C",450,"2022-03-28",10003,1,NULL),
-(819,"T0001111B",550,"2022-03-29",10003,1,NULL),
-(820,"S8881111C",550,"2022-03-30",10004,1,NULL),
-(821,"S9991111A",800,"2022-03-31",10004,1,NULL),
-(822,"S9991111A",650,"2022-04-01",10003,1,NULL),
-(823,"S7770000D",400,"2022-04-02",10002,1,NULL),
-(824,"S8881111C",400,"2022-04-03",10002,1,NULL),
-(825,"S7770000D",400,"2022-04-04",10001,1,NULL),
-(826,"T0000000B",950,"2022-04-05",10004,1,NULL),
-(827,"S7771111D",950,"2022-04-06",10003,1,NULL),
-(828,"T0000000B",400,"2022-04-07",10002,1,NULL),
-(829,"S7770000D",250,"2022-04-08",10004,1,NULL),
-(830,"S7770000D",600,"2022-04-09",10003,1,NULL),
-(831,"S7770000D",400,"2022-04-10",10001,1,NULL),
-(832,"S9991111A",900,"2022-04-11",10002,1,NULL),
-(833,"T0000000B",750,"2022-04-12",10001,1,NULL),
-(834,"S8880000C",500,"2022-04-13",10001,1,NULL),
-(835,"S8881111C",750,"2022-04-14",10001,1,NULL),
-(836,"T0000000B",350,"2022-04-15",10002,1,NULL),
-(837,"S8881111C",550,"2022-04-16",10001,1,NULL),
-(838,"S9990000A",400,"2022-04-17",10002,1,NULL),
-(839,"S9990000A",750,"2022-04-18",10001,1,NULL),
-(840,"S9991111A",450,"2022-04-19",10004,1,NULL),
-(841,"S7770000D",800,"2022-04-20",10001,1,NULL),
-(842,"S9990000A",200,"2022-04-21",10004,1,NULL),
-(843,"S8881111C",250,"2022-04-22",10004,1,NULL),
-(844,"S7770000D",500,"2022-04-23",10001,1,NULL),
-(845,"S8880000C",850,"2022-04-24",10002,1,NULL),
-(846,"S8881111C",550,"2022-04-25",10004,1,NULL),
-(847,"S7770000D",850,"2022-04-26",10003,1,NULL),
-(848,"S8880000C",500,"2022-04-27",10004,1,NULL),
-(849,"S9991111A",750,"2022-04-28",10004,1,NULL),
-(850,"S9991111A",400,"2022-04-29",10002,1,NULL),
-(851,"S8881111C",850,"2022-04-30",10001,1,NULL),
-(852,"S7770000D",550,"2022-05-01",10004,1,NULL),
-(853,"S8880000C",450,"2022-05-02",10004,1,NULL),
-(854,"S9990000A",300,"2022-05-03",10002,1,NULL),
-(855,"S9990000A",300,"2022-05-04",10002,1,NULL),
-(856,"S8881111C",800,"2022-05-05",10003,1,NULL),
-(857,"T0000000B",450,"2022-05-06",10001,1,NULL),
-(858,"T0000000B",550,"2022-05-07",10002,1,NULL),
-(859,"T0001111B",500,"2022-05-08",10004,1,NULL),
-(860,"S7770000D",300,"2022-05-09",10002,1,NULL),
-(861,"S9990000A",600,"2022-05-10",10003,1,NULL),
-(862,"S9990000A",450,"2022-05-11",10004,1,NULL),
-(863,"T0001111B",650,"2022-05-12",10004,1,NULL),
-(864,"S8881111C",500,"2022-05-13",10002,1,NULL),
-(865,"S8880000C",750,"2022-05-14",10004,1,NULL),
-(866,"S7770000D",750,"2022-05-15",10002,1,NULL),
-(867,"S8881111C",600,"2022-05-16",10004,1,NULL),
-(868,"S7771111D",800,"2022-05-17",10003,1,NULL),
-(869,"S7771111D",750,"2022-05-18",10001,1,NULL),
-(870,"S8880000C",750,"2022-05-19",10001,1,NULL),
-(871,"S9991111A",250,"2022-05-20",10002,1,NULL),
-(872,"S9990000A",450,"2022-05-21",10003,1,NULL),
-(873,"S8880000C",950,"2022-05-22",10001,1,NULL),
-(874,"S9991111A",450,"2022-05-23",10001,1,NULL),
-(875,"T0001111B",600,"2022-05-24",10002,1,NULL),
-(876,"S7771111D",750,"2022-05-25",10004,1,NULL),
-(877,"T0001111B",350,"2022-05-26",10003,1,NULL),
-(878,"T0001111B",900,"2022-05-27",10003,1,NULL),
-(879,"S7770000D",800,"2022-05-28",10002,1,NULL),
-(880,"S9991111A",750,"2022-05-29",10002,1,NULL),
-(881,"S7771111D",250,"2022-05-30",10004,1,NULL),
-(882,"S9990000A",400,"2022-05-31",10003,1,NULL),
-(883,"S7770000D",550,"2022-06-01",10003,1,NULL),
-(884,"S8881111C",600,"2022-06-02",10002,1,NULL),
-(885,"T0000000B",750,"2022-06-03",10001,1,NULL),
-(886,"S7770000D",300,"2022-06-04",10004,1,NULL),
-(887,"T0000000B",700,"2022-06-05",10002,1,NULL),
-(888,"T0000000B",800,"2022-06-06",10001,1,NULL),
-(889,"S9990000A",200,"2022-06-07",10003,1,NULL),
-(890,"T0001111B",700,"2022-06-08",10001,1,NULL),
-(891,"S9991111A",350,"2022-06-09",10002,1,NULL),
-(892,"S8881111C",700,"2022-06-10",10004,1,NULL),
-(893,"T0000000B",500,"2022-06-11",10002,1,NULL),
-(894,"S9991111A",950,"2022-06-12",10002,1,NULL),
-(895,"S7771111D",300,"2022-06-13",10002,1,NULL),
-(896,"S8881111C",600,"2022-06-14",10001,1,NULL),
-(897,"S9990000A",550,"2022-06-15",10002,1,NULL),
-(898,"S8880000C",450,"2022-06-16",10001,1,NULL),
-(899,"S8881111C",600,"2022-06-17",10002,1,NULL),
-(900,"S7770000D",600,"2022-06-18",10003,1,NULL),
-(901,"S8880000C",650,"2022-06-19",10001,1,NULL),
-(902,"T0000000B",600,"2022-06-20",10001,1,NULL),
-(903,"S9990000A",600,"2022-06-21",10004,1,NULL),
-(904,"T0001111B",500,"2022-06-22",10004,1,NULL),
-(905,"S7770000D",500,"2022-06-23",10001,1,NULL),
-(906,"S7771111D",850,"2022-06-24",10003,1,NULL),
-(907,"S8880000C",750,"2022-06-25",10001,1,NULL),
-(908,"S7770000D",550,"2022-06-26",10001,1,NULL),
-(909,"S9990000A",700,"2022-06-27",10001,1,NULL),
-(910,"S8881111C",500,"2022-06-28",10003,1,NULL),
-(911,"T0000000B",900,"2022-06-29",10001,1,NULL),
-(912,"S7770000D",200,"2022-06-30",10002,1,NULL),
-(913,"T0000000B",450,"2022-07-01",10001,1,NULL),
-(914,"S8881111C",600,"2022-07-02",10002,1,NULL),
-(915,"T0001111B",550,"2022-07-03",10004,1,NULL),
-(916,"S9991111A",650,"2022-07-04",10002,1,NULL),
-(917,"S7770000D",700,"2022-07-05",10004,1,NULL),
-(918,"S7770000D",850,"2022-07-06",10001,1,NULL),
-(919,"S9991111A",750,"2022-07-07",10003,1,NULL),
-(920,"S7770000D",550,"2022-07-08",10004,1,NULL),
-(921,"T0000000B",850,"2022-07-09",10004,1,NULL),
-(922,"T0001111B",500,"2022-07-10",10004,1,NULL),
-(923,"S9990000A",800,"2022-07-11",10001,1,NULL),
-(924,"S9991111A",800,"2022-07-12",10003,1,NULL),
-(925,"S9991111A",200,"2022-07-13",10001,1,NULL),
-(926,"S8880000C",300,"2022-07-14",10004,1,NULL),
-(927,"T0000000B",350,"2022-07-15",10004,1,NULL),
-(928,"S7770000D",750,"2022-07-16",10001,1,NULL),
-(929,"T0000000B",450,"2022-07-17",10004,1,NULL),
-(930,"S8881111C",400,"2022-07-18",10003,1,NULL),
-(931,"S9991111A",400,"2022-07-19",10004,1,NULL),
-(932,"S9991111A",400,"2022-07-20",10004,1,NULL),
-(933,"T0001111B",800,"2022-07-21",10003,1,NULL),
-(934,"T0001111B",200,"2022-07-22",10003,1,NULL),
-(935,"S7771111D",800,"2022-07-23",10002,1,NULL),
-(936,"S8881111C",750,"2022-07-24",10004,1,NULL),
-(937,"S9991111A",700,"2022-07-25",10003,1,NULL),
-(938,"S8880000C",600,"2022-07-26",10003,1,NULL),
-(939,"S8880000C",250,"2022-07-27",10004,1,NULL),
-(940,"S8881111C",950,"2022-07-28",10002,1,NULL),
-(941,"S9990000A",600,"2022-07-29",10004,1,NULL),
-(942,"S7771111D",950,"2022-07-30",10002,1,NULL),
-(943,"S8880000C",600,"2022-07-31",10003,1,NULL),
-(944,"T0001111B",350,"2022-08-01",10004,1,NULL),
-(945,"S8880000C",500,"2022-08-02",10002,1,NULL),
-(946,"T0000000B",200,"2022-08-03",10004,1,NULL),
-(947,"S7770000D",950,"2022-08-04",10002,1,NULL),
-(948,"S9991111A",300,"2022-08-05",10003,1,NULL),
-(949,"S7771111D",600,"2022-08-06",10004,1,NULL),
-(950,"S8881111C",800,"2022-08-07",10001,1,NULL),
-(951,"T0000000B",350,"2022-08-08",10002,1,NULL),
-(952,"S8880000C",950,"2022-08-09",10004,1,NULL),
-(953,"S7770000D",800,"2022-08-10",10003,1,NULL),
-(954,"S7770000D",650,"2022-08-11",10003,1,NULL),
-(955,"T0001111B",900,"2022-08-12",10004,1,NULL),
-(956,"S9991111A",950,"2022-08-13",10002,1,NULL),
-(957,"S7771111D",250,"2022-08-14",10003,1,NULL),
-(958,"S9991111A",400,"2022-08-15",10001,1,NULL),
-(959,"S7770000D",550,"2022-08-16",10004,1,NULL),
-(960,"S8880000C",200,"2022-08-17",10003,1,NULL),
-(961,"S7770000D",250,"2022-08-18",10004,1,NULL),
-(962,"S9991111A",900,"2022-08-19",10003,1,NULL),
-(963,"T0001111B",300,"2022-08-20",10001,1,NULL),
-(964,"T0000000B",950,"2022-08-21",10002,1,NULL),
-(965,"T0001111B",750,"2022-08-22",10003,1,NULL),
-(966,"T0001111B",950,"2022-08-23",10002,1,NULL),
-(967,"S9990000A",900,"2022-08-24",10004,1,NULL),
-(968,"T0000000B",950,"2022-08-25",10001,1,NULL),
-(969,"T0001111B",550,"2022-08-26",10004,1,NULL),
-(970,"S8881111C",350,"2022-08-27",10004,1,NULL),
-(971,"S9991111A",850,"2022-08-28",10001,1,NULL),
-(972,"S8880000C",900,"2022-08-29",10004,1,NULL),
-(973,"T0000000B",550,"2022-08-30",10002,1,NULL),
-(974,"S9990000A",700,"2022-08-31",10002,1,NULL),
-(975,"S7771111D",850,"2022-09-01",10004,1,NULL),
-(976,"S7771111D",550,"2022-09-02",10003,1,NULL),
-(977,"S8881111C",950,"2022-09-03",10002,1,NULL),
-(978,"S8880000C",450,"2022-09-04",10003,1,NULL),
-(979,"S8880000C",450,"2022-09-05",10002,1,NULL),
-(980,"S9990000A",650,"2022-09-06",10002,1,NULL),
-(981,"T0001111B",300,"2022-09-07",10001,1,NULL),
-(982,"S8880000C",800,"2022-09-08",10004,1,NULL),
-(983,"T0000000B",700,"2022-09-09",10001,1,NULL),
-(984,"S7771111D",300,"2022-09-10",10003,1,NULL),
-(985,"S7771111D",550,"2022-09-11",10002,1,NULL),
-(986,"S9990000A",500,"2022-09-12",10003,1,NULL),
-(987,"S7771111D",900,"2022-09-13",10001,1,NULL),
-(988,"T0000000B",400,"2022-09-14",10003,1,NULL),
-(989,"S8880000C",400,"2022-09-15",10001,1,NULL),
-(990,"S9990000A",200,"2022-09-16",10002,1,NULL),
-(991,"S7770000D",250,"2022-09-17",10003,1,NULL),
-(992,"S7770000D",250,"2022-09-18",10001,1,NULL),
-(993,"T0000000B",300,"2022-09-19",10003,1,NULL),
-(994,"S8880000C",850,"2022-09-20",10003,1,NULL),
-(995,"S9991111A",400,"2022-09-21",10001,1,NULL),
-(996,"S8881111C",250,"2022-09-22",10003,1,NULL),
-(997,"T0001111B",300,"2022-09-23",10004,1,NULL),
-(998,"S7770000D",950,"2022-09-24",10001,1,NULL),
-(999,"T0000000B",850,"2022-09-25",10001,1,NULL),
-(1000,"T0001111B",500,"2022-09-26",10004,1,NULL);
+INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`, `bloodTypeId`) VALUES
+(17,"S8880000C",350,"2020-01-01",10002,1,NULL,5),
+(18,"S7770000D",350,"2020-01-02",10004,1,NULL,7),
+(19,"S9990000A",650,"2020-01-03",10004,1,NULL,1),
+(20,"S8881111C",600,"2020-01-04",10004,1,NULL,6),
+(21,"S8881111C",650,"2020-01-05",10001,1,NULL,6),
+(22,"S7771111D",450,"2020-01-06",10001,1,NULL,8),
+(23,"S7770000D",950,"2020-01-07",10003,1,NULL,7),
+(24,"S8880000C",900,"2020-01-08",10001,1,NULL,5),
+(25,"S7771111D",400,"2020-01-09",10004,1,NULL,8),
+(26,"S7771111D",700,"2020-01-10",10003,1,NULL,8),
+(27,"T0000000B",550,"2020-01-11",10001,1,NULL,3),
+(28,"S8880000C",800,"2020-01-12",10002,1,NULL,5),
+(29,"S8881111C",300,"2020-01-13",10002,1,NULL,6),
+(30,"S8881111C",400,"2020-01-14",10001,1,NULL,6),
+(31,"S7770000D",650,"2020-01-15",10003,1,NULL,7),
+(32,"S8881111C",300,"2020-01-16",10004,1,NULL,6),
+(33,"T0001111B",700,"2020-01-17",10003,1,NULL,4),
+(34,"S9990000A",900,"2020-01-18",10004,1,NULL,1),
+(35,"S7770000D",750,"2020-01-19",10002,1,NULL,7),
+(36,"S7770000D",650,"2020-01-20",10003,1,NULL,7),
+(37,"T0000000B",500,"2020-01-21",10003,1,NULL,3),
+(38,"S9991111A",650,"2020-01-22",10003,1,NULL,2),
+(39,"S7770000D",350,"2020-01-23",10004,1,NULL,7),
+(40,"T0001111B",450,"2020-01-24",10001,1,NULL,4),
+(41,"S7771111D",850,"2020-01-25",10004,1,NULL,8),
+(42,"T0000000B",550,"2020-01-26",10001,1,NULL,3),
+(43,"S8880000C",400,"2020-01-27",10002,1,NULL,5),
+(44,"T0000000B",750,"2020-01-28",10004,1,NULL,3),
+(45,"S8880000C",600,"2020-01-29",10001,1,NULL,5),
+(46,"S7770000D",800,"2020-01-30",10003,1,NULL,7),
+(47,"S8881111C",600,"2020-01-31",10004,1,NULL,6),
+(48,"S9990000A",900,"2020-02-01",10004,1,NULL,1),
+(49,"T0001111B",450,"2020-02-02",10003,1,NULL,4),
+(50,"S7771111D",950,"2020-02-03",10003,1,NULL,8),
+(51,"T0001111B",600,"2020-02-04",10004,1,NULL,4),
+(52,"S9991111A",800,"2020-02-05",10002,1,NULL,2),
+(53,"T0001111B",650,"2020-02-06",10004,1,NULL,4),
+(54,"S7770000D",250,"2020-02-07",10003,1,NULL,7),
+(55,"S8880000C",650,"2020-02-08",10004,1,NULL,5),
+(56,"S7771111D",900,"2020-02-09",10002,1,NULL,8),
+(57,"S8881111C",200,"2020-02-10",10003,1,NULL,6),
+(58,"S7771111D",750,"2020-02-11",10003,1,NULL,8),
+(59,"S9990000A",250,"2020-02-12",10001,1,NULL,1),
+(60,"S9991111A",800,"2020-02-13",10002,1,NULL,2),
+(61,"S9990000A",300,"2020-02-14",10003,1,NULL,1),
+(62,"S9990000A",700,"2020-02-15",10002,1,NULL,1),
+(63,"S9991111A",350,"2020-02-16",10001,1,NULL,2),
+(64,"T0001111B",350,"2020-02-17",10004,1,NULL,4),
+(65,"S9990000A",850,"2020-02-18",10003,1,NULL,1),
+(66,"S7771111D",650,"2020-02-19",10001,1,NULL,8),
+(67,"T0000000B",700,"2020-02-20",10001,1,NULL,3),
+(68,"T0000000B",250,"2020-02-21",10004,1,NULL,3),
+(69,"S9991111A",400,"2020-02-22",10004,1,NULL,2),
+(70,"S8881111C",300,"2020-02-23",10002,1,NULL,6),
+(71,"S8881111C",200,"2020-02-24",10002,1,NULL,6),
+(72,"T0001111B",500,"2020-02-25",10002,1,NULL,4),
+(73,"S7770000D",600,"2020-02-26",10002,1,NULL,7),
+(74,"S7771111D",200,"2020-02-27",10002,1,NULL,8),
+(75,"S9991111A",650,"2020-02-28",10004,1,NULL,2),
+(76,"S7771111D",950,"2020-02-29",10004,1,NULL,8),
+(77,"S7770000D",950,"2020-03-01",10002,1,NULL,7),
+(78,"T0001111B",800,"2020-03-02",10004,1,NULL,4),
+(79,"S7771111D",250,"2020-03-03",10003,1,NULL,8),
+(80,"S9990000A",700,"2020-03-04",10004,1,NULL,1),
+(81,"S8881111C",750,"2020-03-05",10002,1,NULL,6),
+(82,"S8881111C",550,"2020-03-06",10003,1,NULL,6),
+(83,"T0000000B",350,"2020-03-07",10001,1,NULL,3),
+(84,"T0001111B",450,"2020-03-08",10004,1,NULL,4),
+(85,"S7771111D",750,"2020-03-09",10003,1,NULL,8),
+(86,"T0000000B",450,"2020-03-10",10002,1,NULL,3),
+(87,"S7770000D",650,"2020-03-11",10003,1,NULL,7),
+(88,"S7771111D",500,"2020-03-12",10004,1,NULL,8),
+(89,"S8881111C",850,"2020-03-13",10003,1,NULL,6),
+(90,"S8881111C",750,"2020-03-14",10001,1,NULL,6),
+(91,"S9990000A",200,"2020-03-15",10002,1,NULL,1),
+(92,"S9990000A",850,"2020-03-16",10004,1,NULL,1),
+(93,"T0000000B",200,"2020-03-17",10001,1,NULL,3),
+(94,"T0000000B",800,"2020-03-18",10002,1,NULL,3),
+(95,"S7770000D",600,"2020-03-19",10003,1,NULL,7),
+(96,"S9990000A",700,"2020-03-20",10001,1,NULL,1),
+(97,"S8880000C",400,"2020-03-21",10002,1,NULL,5),
+(98,"S9990000A",950,"2020-03-22",10002,1,NULL,1),
+(99,"T0000000B",450,"2020-03-23",10002,1,NULL,3),
+(100,"T0001111B",750,"2020-03-24",10003,1,NULL,4),
+(101,"S8880000C",900,"2020-03-25",10002,1,NULL,5),
+(102,"S9991111A",950,"2020-03-26",10003,1,NULL,2),
+(103,"S9991111A",850,"2020-03-27",10003,1,NULL,2),
+(104,"S9990000A",650,"2020-03-28",10003,1,NULL,1),
+(105,"S7770000D",750,"2020-03-29",10002,1,NULL,7),
+(106,"T0000000B",200,"2020-03-30",10003,1,NULL,3),
+(107,"T0000000B",250,"2020-03-31",10001,1,NULL,3),
+(108,"T0000000B",650,"2020-04-01",10004,1,NULL,3),
+(109,"T0001111B",750,"2020-04-02",10004,1,NULL,4),
+(110,"S8881111C",850,"2020-04-03",10001,1,NULL,6),
+(111,"S9990000A",750,"2020-04-04",10002,1,NULL,1),
+(112,"S8880000C",900,"2020-04-05",10001,1,NULL,5),
+(113,"T0001111B",200,"2020-04-06",10001,1,NULL,4),
+(114,"T0000000B",800,"2020-04-07",10002,1,NULL,3),
+(115,"S9991111A",250,"2020-04-08",10001,1,NULL,2),
+(116,"S8881111C",400,"2020-04-09",10003,1,NULL,6),
+(117,"S8880000C",700,"2020-04-10",10002,1,NULL,5),
+(118,"T0001111B",550,"2020-04-11",10004,1,NULL,4),
+(119,"S8880000C",200,"2020-04-12",10001,1,NULL,5),
+(120,"S8881111C",950,"2020-04-13",10001,1,NULL,6),
+(121,"S8881111C",200,"2020-04-14",10001,1,NULL,6),
+(122,"T0000000B",550,"2020-04-15",10001,1,NULL,3),
+(123,"S8881111C",750,"2020-04-16",10001,1,NULL,6),
+(124,"S7771111D",950,"2020-04-17",10003,1,NULL,8),
+(125,"S7770000D",200,"2020-04-18",10003,1,NULL,7),
+(126,"T0001111B",700,"2020-04-19",10003,1,NULL,4),
+(127,"S7771111D",350,"2020-04-20",10002,1,NULL,8),
+(128,"T0000000B",950,"2020-04-21",10004,1,NULL,3),
+(129,"S9991111A",950,"2020-04-22",10004,1,NULL,2),
+(130,"S7770000D",750,"2020-04-23",10004,1,NULL,7),
+(131,"S8880000C",800,"2020-04-24",10001,1,NULL,5),
+(132,"S7771111D",950,"2020-04-25",10002,1,NULL,8),
+(133,"S9990000A",500,"2020-04-26",10004,1,NULL,1),
+(134,"S9990000A",750,"2020-04-27",10004,1,NULL,1),
+(135,"S7770000D",450,"2020-04-28",10004,1,NULL,7),
+(136,"T0000000B",650,"2020-04-29",10001,1,NULL,3),
+(137,"S8881111C",850,"2020-04-30",10003,1,NULL,6),
+(138,"S8880000C",600,"2020-05-01",10004,1,NULL,5),
+(139,"S9991111A",650,"2020-05-02",10002,1,NULL,2),
+(140,"S9991111A",300,"2020-05-03",10001,1,NULL,2),
+(141,"S7770000D",550,"2020-05-04",10002,1,NULL,7),
+(142,"S8880000C",300,"2020-05-05",10003,1,NULL,5),
+(143,"T0001111B",700,"2020-05-06",10001,1,NULL,4),
+(144,"T0000000B",550,"2020-05-07",10002,1,NULL,3),
+(145,"S8880000C",750,"2020-05-08",10001,1,NULL,5),
+(146,"S9990000A",350,"2020-05-09",10003,1,NULL,1),
+(147,"S8880000C",250,"2020-05-10",10001,1,NULL,5),
+(148,"S8880000C",800,"2020-05-11",10003,1,NULL,5),
+(149,"S9991111A",650,"2020-05-12",10004,1,NULL,2),
+(150,"T0000000B",750,"2020-05-13",10001,1,NULL,3),
+(151,"S8881111C",900,"2020-05-14",10004,1,NULL,6),
+(152,"T0001111B",850,"2020-05-15",10004,1,NULL,4),
+(153,"S7771111D",350,"2020-05-16",10004,1,NULL,8),
+(154,"S9990000A",300,"2020-05-17",10004,1,NULL,1),
+(155,"S7771111D",200,"2020-05-18",10002,1,NULL,8),
+(156,"S8881111C",500,"2020-05-19",10002,1,NULL,6),
+(157,"T0001111B",350,"2020-05-20",10003,1,NULL,4),
+(158,"S8881111C",350,"2020-05-21",10001,1,NULL,6),
+(159,"T0000000B",850,"2020-05-22",10004,1,NULL,3),
+(160,"S8881111C",600,"2020-05-23",10002,1,NULL,6),
+(161,"S8880000C",300,"2020-05-24",10003,1,NULL,5),
+(162,"T0001111B",600,"2020-05-25",10003,1,NULL,4),
+(163,"T0000000B",800,"2020-05-26",10004,1,NULL,3),
+(164,"T0000000B",900,"2020-05-27",10003,1,NULL,3),
+(165,"S9991111A",600,"2020-05-28",10002,1,NULL,2),
+(166,"S9991111A",800,"2020-05-29",10001,1,NULL,2),
+(167,"S7771111D",250,"2020-05-30",10004,1,NULL,8),
+(168,"T0001111B",600,"2020-05-31",10003,1,NULL,4),
+(169,"S9990000A",650,"2020-06-01",10002,1,NULL,1),
+(170,"S9990000A",700,"2020-06-02",10004,1,NULL,1),
+(171,"T0000000B",600,"2020-06-03",10002,1,NULL,3),
+(172,"S8880000C",300,"2020-06-04",10002,1,NULL,5),
+(173,"S9991111A",400,"2020-06-05",10001,1,NULL,2),
+(174,"T0001111B",900,"2020-06-06",10001,1,NULL,4),
+(175,"S7771111D",450,"2020-06-07",10001,1,NULL,8),
+(176,"T0000000B",300,"2020-06-08",10003,1,NULL,3),
+(177,"S9991111A",400,"2020-06-09",10001,1,NULL,2),
+(178,"S9990000A",300,"2020-06-10",10003,1,NULL,1),
+(179,"S8881111C",650,"2020-06-11",10003,1,NULL,6),
+(180,"S8881111C",600,"2020-06-12",10004,1,NULL,6),
+(181,"S7770000D",500,"2020-06-13",10001,1,NULL,7),
+(182,"T0000000B",600,"2020-06-14",10001,1,NULL,3),
+(183,"S9991111A",650,"2020-06-15",10002,1,NULL,2),
+(184,"S8881111C",550,"2020-06-16",10001,1,NULL,6),
+(185,"S9991111A",700,"2020-06-17",10002,1,NULL,2),
+(186,"T0001111B",550,"2020-06-18",10002,1,NULL,4),
+(187,"S8880000C",300,"2020-06-19",10004,1,NULL,5),
+(188,"S7771111D",950,"2020-06-20",10001,1,NULL,8),
+(189,"S7770000D",550,"2020-06-21",10003,1,NULL,7),
+(190,"T0001111B",850,"2020-06-22",10001,1,NULL,4),
+(191,"T0000000B",550,"2020-06-23",10004,1,NULL,3),
+(192,"S7770000D",900,"2020-06-24",10001,1,NULL,7),
+(193,"S7771111D",800,"2020-06-25",10002,1,NULL,8),
+(194,"S8881111C",800,"2020-06-26",10003,1,NULL,6),
+(195,"S9990000A",200,"2020-06-27",10004,1,NULL,1),
+(196,"S9990000A",750,"2020-06-28",10002,1,NULL,1),
+(197,"T0000000B",600,"2020-06-29",10004,1,NULL,3),
+(198,"T0000000B",850,"2020-06-30",10003,1,NULL,3),
+(199,"S7770000D",450,"2020-07-01",10001,1,NULL,7),
+(200,"S9991111A",250,"2020-07-02",10004,1,NULL,2),
+(201,"T0000000B",900,"2020-07-03",10004,1,NULL,3),
+(202,"S9990000A",300,"2020-07-04",10002,1,NULL,1),
+(203,"S7771111D",250,"2020-07-05",10002,1,NULL,8),
+(204,"S8881111C",650,"2020-07-06",10002,1,NULL,6),
+(205,"S7770000D",750,"2020-07-07",10001,1,NULL,7),
+(206,"S9991111A",800,"2020-07-08",10002,1,NULL,2),
+(207,"S8881111C",700,"2020-07-09",10001,1,NULL,6),
+(208,"S7771111D",700,"2020-07-10",10004,1,NULL,8),
+(209,"S8880000C",350,"2020-07-11",10004,1,NULL,5),
+(210,"S7770000D",600,"2020-07-12",10004,1,NULL,7),
+(211,"S7771111D",950,"2020-07-13",10004,1,NULL,8),
+(212,"S9990000A",650,"2020-07-14",10003,1,NULL,1),
+(213,"S7770000D",450,"2020-07-15",10004,1,NULL,7),
+(214,"S7770000D",250,"2020-07-16",10001,1,NULL,7),
+(215,"S9990000A",550,"2020-07-17",10002,1,NULL,1),
+(216,"S8880000C",750,"2020-07-18",10001,1,NULL,5),
+(217,"S8881111C",200,"2020-07-19",10001,1,NULL,6),
+(218,"T0001111B",700,"2020-07-20",10004,1,NULL,4),
+(219,"S7771111D",200,"2020-07-21",10003,1,NULL,8),
+(220,"S9991111A",600,"2020-07-22",10003,1,NULL,2),
+(221,"S7771111D",950,"2020-07-23",10003,1,NULL,8),
+(222,"S7770000D",950,"2020-07-24",10002,1,NULL,7),
+(223,"S7771111D",450,"2020-07-25",10003,1,NULL,8),
+(224,"S8880000C",300,"2020-07-26",10001,1,NULL,5),
+(225,"S8881111C",850,"2020-07-27",10001,1,NULL,6),
+(226,"S8881111C",350,"2020-07-28",10001,1,NULL,6),
+(227,"T0000000B",850,"2020-07-29",10003,1,NULL,3),
+(228,"S8880000C",500,"2020-07-30",10004,1,NULL,5),
+(229,"S7770000D",300,"2020-07-31",10001,1,NULL,7),
+(230,"S8881111C",700,"2020-08-01",10004,1,NULL,6),
+(231,"S9991111A",800,"2020-08-02",10004,1,NULL,2),
+(232,"S8881111C",200,"2020-08-03",10004,1,NULL,6),
+(233,"S8880000C",950,"2020-08-04",10004,1,NULL,5),
+(234,"S9990000A",350,"2020-08-05",10002,1,NULL,1),
+(235,"S9990000A",450,"2020-08-06",10003,1,NULL,1),
+(236,"S8880000C",200,"2020-08-07",10001,1,NULL,5),
+(237,"T0000000B",300,"2020-08-08",10002,1,NULL,3),
+(238,"S7770000D",350,"2020-08-09",10001,1,NULL,7),
+(239,"S8880000C",500,"2020-08-10",10002,1,NULL,5),
+(240,"T0000000B",350,"2020-08-11",10001,1,NULL,3),
+(241,"T0001111B",950,"2020-08-12",10004,1,NULL,4),
+(242,"S9991111A",300,"2020-08-13",10003,1,NULL,2),
+(243,"S9990000A",450,"2020-08-14",10004,1,NULL,1),
+(244,"S7771111D",800,"2020-08-15",10001,1,NULL,8),
+(245,"T0001111B",250,"2020-08-16",10002,1,NULL,4),
+(246,"T0001111B",400,"2020-08-17",10002,1,NULL,4),
+(247,"S9991111A",250,"2020-08-18",10004,1,NULL,2),
+(248,"S8880000C",900,"2020-08-19",10002,1,NULL,5),
+(249,"S7771111D",650,"2020-08-20",10004,1,NULL,8),
+(250,"T0001111B",450,"2020-08-21",10004,1,NULL,4),
+(251,"T0001111B",300,"2020-08-22",10002,1,NULL,4),
+(252,"S7770000D",950,"2020-08-23",10003,1,NULL,7),
+(253,"S8880000C",850,"2020-08-24",10003,1,NULL,5),
+(254,"S7771111D",400,"2020-08-25",10001,1,NULL,8),
+(255,"S7771111D",500,"2020-08-26",10001,1,NULL,8),
+(256,"S8881111C",850,"2020-08-27",10003,1,NULL,6),
+(257,"S8880000C",650,"2020-08-28",10003,1,NULL,5),
+(258,"S9991111A",950,"2020-08-29",10004,1,NULL,2),
+(259,"T0000000B",750,"2020-08-30",10004,1,NULL,3),
+(260,"T0000000B",800,"2020-08-31",10002,1,NULL,3),
+(261,"S9990000A",850,"2020-09-01",10003,1,NULL,1),
+(262,"T0001111B",350,"2020-09-02",10001,1,NULL,4),
+(263,"S8880000C",700,"2020-09-03",10001,1,NULL,5),
+(264,"S9991111A",900,"2020-09-04",10003,1,NULL,2),
+(265,"T0001111B",700,"2020-09-05",10003,1,NULL,4),
+(266,"S9990000A",950,"2020-09-06",10003,1,NULL,1),
+(267,"S7770000D",700,"2020-09-07",10002,1,NULL,7),
+(268,"S7770000D",250,"2020-09-08",10001,1,NULL,7),
+(269,"T0001111B",750,"2020-09-09",10002,1,NULL,4),
+(270,"S9990000A",650,"2020-09-10",10003,1,NULL,1),
+(271,"S8881111C",950,"2020-09-11",10002,1,NULL,6),
+(272,"S9991111A",600,"2020-09-12",10002,1,NULL,2),
+(273,"S7770000D",650,"2020-09-13",10004,1,NULL,7),
+(274,"S7771111D",200,"2020-09-14",10001,1,NULL,8),
+(275,"S8880000C",200,"2020-09-15",10001,1,NULL,5),
+(276,"S9990000A",400,"2020-09-16",10002,1,NULL,1),
+(277,"S8881111C",450,"2020-09-17",10001,1,NULL,6),
+(278,"S8881111C",300,"2020-09-18",10003,1,NULL,6),
+(279,"T0000000B",800,"2020-09-19",10001,1,NULL,3),
+(280,"S8880000C",950,"2020-09-20",10001,1,NULL,5),
+(281,"T0000000B",450,"2020-09-21",10001,1,NULL,3),
+(282,"T0001111B",800,"2020-09-22",10002,1,NULL,4),
+(283,"S7770000D",300,"2020-09-23",10003,1,NULL,7),
+(284,"S8881111C",850,"2020-09-24",10003,1,NULL,6),
+(285,"T0000000B",650,"2020-09-25",10001,1,NULL,3),
+(286,"S8881111C",500,"2020-09-26",10002,1,NULL,6),
+(287,"S9991111A",700,"2020-09-27",10004,1,NULL,2),
+(288,"S9990000A",950,"2020-09-28",10004,1,NULL,1),
+(289,"S8881111C",250,"2020-09-29",10003,1,NULL,6),
+(290,"S8881111C",650,"2020-09-30",10001,1,NULL,6),
+(291,"S7771111D",600,"2020-10-01",10003,1,NULL,8),
+(292,"S8880000C",400,"2020-10-02",10004,1,NULL,5),
+(293,"T0000000B",800,"2020-10-03",10002,1,NULL,3),
+(294,"S7770000D",550,"2020-10-04",10001,1,NULL,7),
+(295,"S7771111D",600,"2020-10-05",10002,1,NULL,8),
+(296,"S7770000D",650,"2020-10-06",10004,1,NULL,7),
+(297,"S9990000A",200,"2020-10-07",10004,1,NULL,1),
+(298,"S8880000C",500,"2020-10-08",10004,1,NULL,5),
+(299,"S8881111C",650,"2020-10-09",10004,1,NULL,6),
+(300,"S8881111C",900,"2020-10-10",10003,1,NULL,6),
+(301,"T0001111B",450,"2020-10-11",10003,1,NULL,4),
+(302,"S8881111C",250,"2020-10-12",10003,1,NULL,6),
+(303,"S7770000D",850,"2020-10-13",10001,1,NULL,7),
+(304,"S8881111C",450,"2020-10-14",10004,1,NULL,6),
+(305,"S8881111C",700,"2020-10-15",10002,1,NULL,6),
+(306,"S8881111C",700,"2020-10-16",10004,1,NULL,6),
+(307,"S8880000C",450,"2020-10-17",10001,1,NULL,5),
+(308,"S7771111D",550,"2020-10-18",10001,1,NULL,8),
+(309,"T0000000B",550,"2020-10-19",10004,1,NULL,3),
+(310,"S7771111D",400,"2020-10-20",10003,1,NULL,8),
+(311,"T0000000B",850,"2020-10-21",10004,1,NULL,3),
+(312,"S7771111D",950,"2020-10-22",10001,1,NULL,8),
+(313,"S8881111C",800,"2020-10-23",10003,1,NULL,6),
+(314,"S7770000D",650,"2020-10-24",10003,1,NULL,7),
+(315,"S8881111C",850,"2020-10-25",10001,1,NULL,6),
+(316,"S8881111C",250,"2020-10-26",10003,1,NULL,6),
+(317,"T0000000B",500,"2020-10-27",10004,1,NULL,3),
+(318,"S8880000C",550,"2020-10-28",10003,1,NULL,5),
+(319,"T0001111B",200,"2020-10-29",10003,1,NULL,4),
+(320,"T0001111B",750,"2020-10-30",10003,1,NULL,4),
+(321,"S8880000C",700,"2020-10-31",10002,1,NULL,5),
+(322,"S9990000A",450,"2020-11-01",10001,1,NULL,1),
+(323,"S8881111C",450,"2020-11-02",10002,1,NULL,6),
+(324,"S8881111C",500,"2020-11-03",10002,1,NULL,6),
+(325,"S7771111D",450,"2020-11-04",10004,1,NULL,8),
+(326,"S8880000C",450,"2020-11-05",10001,1,NULL,5),
+(327,"S7770000D",500,"2020-11-06",10004,1,NULL,7),
+(328,"S9991111A",700,"2020-11-07",10001,1,NULL,2),
+(329,"S7771111D",350,"2020-11-08",10004,1,NULL,8),
+(330,"S7770000D",750,"2020-11-09",10004,1,NULL,7),
+(331,"T0001111B",250,"2020-11-10",10004,1,NULL,4),
+(332,"S7771111D",950,"2020-11-11",10002,1,NULL,8),
+(333,"S7771111D",400,"2020-11-12",10002,1,NULL,8),
+(334,"T0001111B",900,"2020-11-13",10003,1,NULL,4),
+(335,"S8881111C",650,"2020-11-14",10004,1,NULL,6),
+(336,"S9990000A",850,"2020-11-15",10003,1,NULL,1),
+(337,"S9991111A",700,"2020-11-16",10002,1,NULL,2),
+(338,"S7770000D",700,"2020-11-17",10002,1,NULL,7),
+(339,"S8880000C",950,"2020-11-18",10004,1,NULL,5),
+(340,"S7770000D",350,"2020-11-19",10003,1,NULL,7),
+(341,"T0000000B",450,"2020-11-20",10001,1,NULL,3),
+(342,"S8880000C",200,"2020-11-21",10003,1,NULL,5),
+(343,"T0001111B",900,"2020-11-22",10002,1,NULL,4),
+(344,"S8880000C",400,"2020-11-23",10001,1,NULL,5),
+(345,"S9990000A",300,"2020-11-24",10003,1,NULL,1),
+(346,"T0001111B",550,"2020-11-25",10004,1,NULL,4),
+(347,"S8881111C",750,"2020-11-26",10004,1,NULL,6),
+(348,"S7770000D",750,"2020-11-27",10004,1,NULL,7),
+(349,"T0000000B",650,"2020-11-28",10004,1,NULL,3),
+(350,"S7770000D",500,"2020-11-29",10001,1,NULL,7),
+(351,"S8880000C",750,"2020-11-30",10002,1,NULL,5),
+(352,"S9990000A",900,"2020-12-01",10003,1,NULL,1),
+(353,"S9990000A",800,"2020-12-02",10003,1,NULL,1),
+(354,"S7771111D",800,"2020-12-03",10002,1,NULL,8),
+(355,"T0001111B",950,"2020-12-04",10003,1,NULL,4),
+(356,"T0001111B",350,"2020-12-05",10001,1,NULL,4),
+(357,"S8880000C",250,"2020-12-06",10001,1,NULL,5),
+(358,"S9991111A",300,"2020-12-07",10003,1,NULL,2),
+(359,"S7771111D",250,"2020-12-08",10001,1,NULL,8),
+(360,"S8880000C",500,"2020-12-09",10002,1,NULL,5),
+(361,"S9990000A",600,"2020-12-10",10001,1,NULL,1),
+(362,"S9991111A",750,"2020-12-11",10001,1,NULL,2),
+(363,"S7771111D",800,"2020-12-12",10004,1,NULL,8),
+(364,"S8881111C",900,"2020-12-13",10002,1,NULL,6),
+(365,"S9990000A",450,"2020-12-14",10003,1,NULL,1),
+(366,"S7771111D",600,"2020-12-15",10002,1,NULL,8),
+(367,"S7771111D",550,"2020-12-16",10004,1,NULL,8),
+(368,"S8881111C",850,"2020-12-17",10001,1,NULL,6),
+(369,"S7770000D",550,"2020-12-18",10003,1,NULL,7),
+(370,"S8881111C",950,"2020-12-19",10001,1,NULL,6),
+(371,"S9990000A",950,"2020-12-20",10001,1,NULL,1),
+(372,"S9991111A",300,"2020-12-21",10004,1,NULL,2),
+(373,"T0000000B",950,"2020-12-22",10001,1,NULL,3),
+(374,"T0000000B",900,"2020-12-23",10001,1,NULL,3),
+(375,"S8880000C",200,"2020-12-24",10003,1,NULL,5),
+(376,"S8880000C",750,"2020-12-25",10002,1,NULL,5),
+(377,"S8881111C",950,"2020-12-26",10004,1,NULL,6),
+(378,"S7770000D",300,"2020-12-27",10003,1,NULL,7),
+(379,"T0001111B",950,"2020-12-28",10004,1,NULL,4),
+(380,"S7770000D",500,"2020-12-29",10004,1,NULL,7),
+(381,"T0001111B",750,"2020-12-30",10002,1,NULL,4),
+(382,"S9991111A",300,"2020-12-31",10004,1,NULL,2),
+(383,"T0000000B",950,"2021-01-01",10002,1,NULL,3),
+(384,"T0001111B",750,"2021-01-02",10002,1,NULL,4),
+(385,"S7770000D",700,"2021-01-03",10002,1,NULL,7),
+(386,"S8880000C",650,"2021-01-04",10001,1,NULL,5),
+(387,"S7770000D",550,"2021-01-05",10001,1,NULL,7),
+(388,"S9990000A",550,"2021-01-06",10003,1,NULL,1),
+(389,"S8880000C",300,"2021-01-07",10001,1,NULL,5),
+(390,"T0001111B",700,"2021-01-08",10003,1,NULL,4),
+(391,"S9990000A",250,"2021-01-09",10001,1,NULL,1),
+(392,"T0000000B",250,"2021-01-10",10004,1,NULL,3),
+(393,"S7770000D",500,"2021-01-11",10003,1,NULL,7),
+(394,"S8880000C",200,"2021-01-12",10003,1,NULL,5),
+(395,"S7771111D",750,"2021-01-13",10002,1,NULL,8),
+(396,"S7770000D",900,"2021-01-14",10004,1,NULL,7),
+(397,"S9991111A",400,"2021-01-15",10001,1,NULL,2),
+(398,"T0001111B",750,"2021-01-16",10003,1,NULL,4),
+(399,"S7771111D",300,"2021-01-17",10003,1,NULL,8),
+(400,"S7771111D",850,"2021-01-18",10002,1,NULL,8),
+(401,"S8880000C",550,"2021-01-19",10002,1,NULL,5),
+(402,"T0000000B",800,"2021-01-20",10003,1,NULL,3),
+(403,"S8880000C",500,"2021-01-21",10001,1,NULL,5),
+(404,"S9990000A",850,"2021-01-22",10001,1,NULL,1),
+(405,"S7770000D",950,"2021-01-23",10001,1,NULL,7),
+(406,"T0000000B",700,"2021-01-24",10003,1,NULL,3),
+(407,"S7770000D",450,"2021-01-25",10004,1,NULL,7),
+(408,"S7771111D",200,"2021-01-26",10002,1,NULL,8),
+(409,"S7771111D",200,"2021-01-27",10002,1,NULL,8),
+(410,"S8880000C",300,"2021-01-28",10002,1,NULL,5),
+(411,"T0000000B",650,"2021-01-29",10001,1,NULL,3),
+(412,"S7771111D",250,"2021-01-30",10003,1,NULL,8),
+(413,"T0000000B",350,"2021-01-31",10004,1,NULL,3),
+(414,"S7771111D",600,"2021-02-01",10002,1,NULL,8),
+(415,"T0001111B",800,"2021-02-02",10004,1,NULL,4),
+(416,"T0000000B",650,"2021-02-03",10001,1,NULL,3),
+(417,"S8881111C",450,"2021-02-04",10001,1,NULL,6),
+(418,"S7770000D",700,"2021-02-05",10004,1,NULL,7),
+(419,"T0000000B",650,"2021-02-06",10001,1,NULL,3),
+(420,"T0000000B",700,"2021-02-07",10001,1,NULL,3),
+(421,"S7770000D",950,"2021-02-08",10002,1,NULL,7),
+(422,"S7770000D",900,"2021-02-09",10004,1,NULL,7),
+(423,"S8880000C",900,"2021-02-10",10003,1,NULL,5),
+(424,"S9991111A",550,"2021-02-11",10004,1,NULL,2),
+(425,"S7771111D",550,"2021-02-12",10003,1,NULL,8),
+(426,"S7770000D",200,"2021-02-13",10003,1,NULL,7),
+(427,"S8881111C",950,"2021-02-14",10002,1,NULL,6),
+(428,"T0001111B",450,"2021-02-15",10001,1,NULL,4),
+(429,"S8880000C",700,"2021-02-16",10002,1,NULL,5),
+(430,"S8881111C",450,"2021-02-17",10004,1,NULL,6),
+(431,"S9991111A",200,"2021-02-18",10002,1,NULL,2),
+(432,"S7771111D",900,"2021-02-19",10002,1,NULL,8),
+(433,"S7770000D",250,"2021-02-20",10004,1,NULL,7),
+(434,"T0001111B",750,"2021-02-21",10001,1,NULL,4),
+(435,"S8881111C",900,"2021-02-22",10002,1,NULL,6),
+(436,"S9991111A",700,"2021-02-23",10001,1,NULL,2),
+(437,"S8880000C",750,"2021-02-24",10002,1,NULL,5),
+(438,"S7770000D",200,"2021-02-25",10004,1,NULL,7),
+(439,"S8881111C",750,"2021-02-26",10004,1,NULL,6),
+(440,"T0000000B",350,"2021-02-27",10001,1,NULL,3),
+(441,"T0000000B",750,"2021-02-28",10003,1,NULL,3),
+(442,"S8880000C",700,"2021-03-01",10004,1,NULL,5),
+(443,"S8880000C",600,"2021-03-02",10002,1,NULL,5),
+(444,"T0000000B",700,"2021-03-03",10004,1,NULL,3),
+(445,"S7770000D",850,"2021-03-04",10002,1,NULL,7),
+(446,"T0000000B",650,"2021-03-05",10004,1,NULL,3),
+(447,"T0001111B",900,"2021-03-06",10004,1,NULL,4),
+(448,"S8881111C",200,"2021-03-07",10002,1,NULL,6),
+(449,"S7771111D",550,"2021-03-08",10003,1,NULL,8),
+(450,"S9990000A",850,"2021-03-09",10002,1,NULL,1),
+(451,"S8881111C",300,"2021-03-10",10003,1,NULL,6),
+(452,"S9990000A",900,"2021-03-11",10004,1,NULL,1),
+(453,"S9991111A",650,"2021-03-12",10003,1,NULL,2),
+(454,"T0000000B",800,"2021-03-13",10002,1,NULL,3),
+(455,"S7771111D",650,"2021-03-14",10002,1,NULL,8),
+(456,"S8880000C",250,"2021-03-15",10001,1,NULL,5),
+(457,"S8880000C",600,"2021-03-16",10003,1,NULL,5),
+(458,"S8881111C",650,"2021-03-17",10002,1,NULL,6),
+(459,"T0000000B",600,"2021-03-18",10004,1,NULL,3),
+(460,"S8880000C",750,"2021-03-19",10003,1,NULL,5),
+(461,"S7770000D",600,"2021-03-20",10003,1,NULL,7),
+(462,"S9990000A",250,"2021-03-21",10002,1,NULL,1),
+(463,"S8880000C",700,"2021-03-22",10003,1,NULL,5),
+(464,"S9990000A",650,"2021-03-23",10004,1,NULL,1),
+(465,"S7771111D",600,"2021-03-24",10004,1,NULL,8),
+(466,"T0000000B",250,"2021-03-25",10001,1,NULL,3),
+(467,"S9991111A",600,"2021-03-26",10003,1,NULL,2),
+(468,"S7771111D",400,"2021-03-27",10003,1,NULL,8),
+(469,"S7770000D",250,"2021-03-28",10002,1,NULL,7),
+(470,"S9990000A",950,"2021-03-29",10001,1,NULL,1),
+(471,"S7771111D",400,"2021-03-30",10002,1,NULL,8),
+(472,"S9990000A",400,"2021-03-31",10001,1,NULL,1),
+(473,"S9991111A",250,"2021-04-01",10003,1,NULL,2),
+(474,"S7770000D",900,"2021-04-02",10004,1,NULL,7),
+(475,"S8881111C",400,"2021-04-03",10003,1,NULL,6),
+(476,"S9990000A",350,"2021-04-04",10004,1,NULL,1),
+(477,"S7770000D",200,"2021-04-05",10004,1,NULL,7),
+(478,"S7771111D",250,"2021-04-06",10004,1,NULL,8),
+(479,"S7770000D",450,"2021-04-07",10001,1,NULL,7),
+(480,"S8880000C",900,"2021-04-08",10003,1,NULL,5),
+(481,"T0001111B",250,"2021-04-09",10002,1,NULL,4),
+(482,"S7770000D",550,"2021-04-10",10003,1,NULL,7),
+(483,"T0000000B",450,"2021-04-11",10004,1,NULL,3),
+(484,"S9991111A",900,"2021-04-12",10002,1,NULL,2),
+(485,"T0000000B",450,"2021-04-13",10001,1,NULL,3),
+(486,"S8881111C",650,"2021-04-14",10002,1,NULL,6),
+(487,"T0001111B",400,"2021-04-15",10001,1,NULL,4),
+(488,"S7771111D",500,"2021-04-16",10001,1,NULL,8),
+(489,"S9991111A",650,"2021-04-17",10004,1,NULL,2),
+(490,"S7771111D",300,"2021-04-18",10003,1,NULL,8),
+(491,"S9990000A",400,"2021-04-19",10004,1,NULL,1),
+(492,"S7771111D",750,"2021-04-20",10002,1,NULL,8),
+(493,"T0001111B",900,"2021-04-21",10001,1,NULL,4),
+(494,"S8881111C",650,"2021-04-22",10002,1,NULL,6),
+(495,"S8881111C",800,"2021-04-23",10003,1,NULL,6),
+(496,"S7770000D",350,"2021-04-24",10003,1,NULL,7),
+(497,"S8880000C",650,"2021-04-25",10004,1,NULL,5),
+(498,"S8881111C",300,"2021-04-26",10004,1,NULL,6),
+(499,"T0000000B",600,"2021-04-27",10002,1,NULL,3),
+(500,"S7770000D",500,"2021-04-28",10002,1,NULL,7),
+(501,"S8880000C",550,"2021-04-29",10001,1,NULL,5),
+(502,"S9990000A",450,"2021-04-30",10001,1,NULL,1),
+(503,"S7770000D",900,"2021-05-01",10001,1,NULL,7),
+(504,"S9990000A",250,"2021-05-02",10001,1,NULL,1),
+(505,"S9991111A",450,"2021-05-03",10003,1,NULL,2),
+(506,"T0000000B",900,"2021-05-04",10001,1,NULL,3),
+(507,"T0000000B",450,"2021-05-05",10003,1,NULL,3),
+(508,"S7770000D",950,"2021-05-06",10004,1,NULL,7),
+(509,"T0000000B",650,"2021-05-07",10002,1,NULL,3),
+(510,"S9991111A",450,"2021-05-08",10001,1,NULL,2),
+(511,"T0001111B",700,"2021-05-09",10001,1,NULL,4),
+(512,"T0001111B",850,"2021-05-10",10004,1,NULL,4),
+(513,"S9990000A",500,"2021-05-11",10002,1,NULL,1),
+(514,"S8881111C",800,"2021-05-12",10001,1,NULL,6),
+(515,"S8880000C",700,"2021-05-13",10003,1,NULL,5),
+(516,"T0001111B",200,"2021-05-14",10003,1,NULL,4),
+(517,"T0000000B",250,"2021-05-15",10004,1,NULL,3),
+(518,"T0000000B",550,"2021-05-16",10003,1,NULL,3),
+(519,"T0001111B",200,"2021-05-17",10004,1,NULL,4),
+(520,"S9991111A",750,"2021-05-18",10002,1,NULL,2),
+(521,"S8881111C",900,"2021-05-19",10001,1,NULL,6),
+(522,"T0000000B",350,"2021-05-20",10003,1,NULL,3),
+(523,"S9990000A",800,"2021-05-21",10001,1,NULL,1),
+(524,"S8881111C",750,"2021-05-22",10001,1,NULL,6),
+(525,"T0001111B",850,"2021-05-23",10002,1,NULL,4),
+(526,"T0001111B",500,"2021-05-24",10001,1,NULL,4),
+(527,"S9990000A",850,"2021-05-25",10003,1,NULL,1),
+(528,"S9991111A",600,"2021-05-26",10001,1,NULL,2),
+(529,"S9991111A",550,"2021-05-27",10003,1,NULL,2),
+(530,"S8881111C",750,"2021-05-28",10001,1,NULL,6),
+(531,"S9991111A",400,"2021-05-29",10004,1,NULL,2),
+(532,"T0000000B",400,"2021-05-30",10002,1,NULL,3),
+(533,"T0001111B",250,"2021-05-31",10003,1,NULL,4),
+(534,"S8881111C",750,"2021-06-01",10001,1,NULL,6),
+(535,"S8880000C",750,"2021-06-02",10001,1,NULL,5),
+(536,"T0001111B",650,"2021-06-03",10002,1,NULL,4),
+(537,"S8881111C",350,"2021-06-04",10003,1,NULL,6),
+(538,"T0000000B",250,"2021-06-05",10003,1,NULL,3),
+(539,"T0001111B",300,"2021-06-06",10002,1,NULL,4),
+(540,"T0000000B",250,"2021-06-07",10004,1,NULL,3),
+(541,"S9990000A",900,"2021-06-08",10001,1,NULL,1),
+(542,"S8881111C",900,"2021-06-09",10001,1,NULL,6),
+(543,"S8881111C",200,"2021-06-10",10001,1,NULL,6),
+(544,"S8881111C",600,"2021-06-11",10004,1,NULL,6),
+(545,"T0000000B",550,"2021-06-12",10003,1,NULL,3),
+(546,"S8881111C",700,"2021-06-13",10001,1,NULL,6),
+(547,"S8881111C",650,"2021-06-14",10003,1,NULL,6),
+(548,"S9990000A",500,"2021-06-15",10003,1,NULL,1),
+(549,"S8880000C",450,"2021-06-16",10003,1,NULL,5),
+(550,"T0001111B",200,"2021-06-17",10002,1,NULL,4),
+(551,"S8881111C",500,"2021-06-18",10004,1,NULL,6),
+(552,"T0001111B",400,"2021-06-19",10004,1,NULL,4),
+(553,"S8881111C",900,"2021-06-20",10004,1,NULL,6),
+(554,"S8880000C",350,"2021-06-21",10002,1,NULL,5),
+(555,"T0001111B",950,"2021-06-22",10003,1,NULL,4),
+(556,"S9991111A",400,"2021-06-23",10003,1,NULL,2),
+(557,"T0000000B",950,"2021-06-24",10002,1,NULL,3),
+(558,"S7771111D",750,"2021-06-25",10004,1,NULL,8),
+(559,"T0000000B",550,"2021-06-26",10004,1,NULL,3),
+(560,"S9991111A",800,"2021-06-27",10003,1,NULL,2),
+(561,"S8880000C",250,"2021-06-28",10004,1,NULL,5),
+(562,"S8881111C",650,"2021-06-29",10002,1,NULL,6),
+(563,"S7770000D",350,"2021-06-30",10001,1,NULL,7),
+(564,"T0001111B",500,"2021-07-01",10001,1,NULL,4),
+(565,"S7771111D",500,"2021-07-02",10004,1,NULL,8),
+(566,"T0001111B",750,"2021-07-03",10004,1,NULL,4),
+(567,"S8880000C",950,"2021-07-04",10002,1,NULL,5),
+(568,"S9990000A",800,"2021-07-05",10001,1,NULL,1),
+(569,"T0000000B",650,"2021-07-06",10003,1,NULL,3),
+(570,"T0001111B",700,"2021-07-07",10004,1,NULL,4),
+(571,"S8881111C",250,"2021-07-08",10002,1,NULL,6),
+(572,"S8881111C",800,"2021-07-09",10002,1,NULL,6),
+(573,"S7771111D",350,"2021-07-10",10003,1,NULL,8),
+(574,"S7770000D",800,"2021-07-11",10002,1,NULL,7),
+(575,"S9991111A",800,"2021-07-12",10002,1,NULL,2),
+(576,"T0001111B",500,"2021-07-13",10004,1,NULL,4),
+(577,"T0001111B",650,"2021-07-14",10001,1,NULL,4),
+(578,"T0000000B",600,"2021-07-15",10001,1,NULL,3),
+(579,"S7770000D",200,"2021-07-16",10003,1,NULL,7),
+(580,"S8880000C",550,"2021-07-17",10004,1,NULL,5),
+(581,"S7770000D",550,"2021-07-18",10001,1,NULL,7),
+(582,"S7771111D",600,"2021-07-19",10003,1,NULL,8),
+(583,"T0001111B",650,"2021-07-20",10004,1,NULL,4),
+(584,"T0000000B",750,"2021-07-21",10003,1,NULL,3),
+(585,"S8880000C",800,"2021-07-22",10004,1,NULL,5),
+(586,"S8880000C",400,"2021-07-23",10004,1,NULL,5),
+(587,"S8881111C",200,"2021-07-24",10004,1,NULL,6),
+(588,"S8880000C",450,"2021-07-25",10002,1,NULL,5),
+(589,"S8880000C",250,"2021-07-26",10004,1,NULL,5),
+(590,"S9991111A",400,"2021-07-27",10003,1,NULL,2),
+(591,"S9990000A",900,"2021-07-28",10004,1,NULL,1),
+(592,"S9991111A",400,"2021-07-29",10002,1,NULL,2),
+(593,"T0001111B",200,"2021-07-30",10003,1,NULL,4),
+(594,"S8880000C",300,"2021-07-31",10004,1,NULL,5),
+(595,"S7770000D",500,"2021-08-01",10001,1,NULL,7),
+(596,"S8880000C",550,"2021-08-02",10003,1,NULL,5),
+(597,"T0000000B",450,"2021-08-03",10003,1,NULL,3),
+(598,"T0001111B",250,"2021-08-04",10004,1,NULL,4),
+(599,"T0001111B",500,"2021-08-05",10003,1,NULL,4),
+(600,"S7770000D",800,"2021-08-06",10004,1,NULL,7),
+(601,"S8880000C",700,"2021-08-07",10001,1,NULL,5),
+(602,"S8881111C",900,"2021-08-08",10003,1,NULL,6),
+(603,"T0001111B",750,"2021-08-09",10002,1,NULL,4),
+(604,"T0000000B",300,"2021-08-10",10003,1,NULL,3),
+(605,"T0001111B",550,"2021-08-11",10004,1,NULL,4),
+(606,"S8881111C",600,"2021-08-12",10002,1,NULL,6),
+(607,"S7770000D",700,"2021-08-13",10003,1,NULL,7),
+(608,"T0000000B",250,"2021-08-14",10001,1,NULL,3),
+(609,"S7771111D",350,"2021-08-15",10001,1,NULL,8),
+(610,"S8881111C",550,"2021-08-16",10004,1,NULL,6),
+(611,"S9991111A",900,"2021-08-17",10001,1,NULL,2),
+(612,"S9991111A",350,"2021-08-18",10002,1,NULL,2),
+(613,"S9991111A",300,"2021-08-19",10004,1,NULL,2),
+(614,"T0001111B",700,"2021-08-20",10001,1,NULL,4),
+(615,"S7771111D",900,"2021-08-21",10001,1,NULL,8),
+(616,"S9991111A",600,"2021-08-22",10001,1,NULL,2),
+(617,"T0000000B",600,"2021-08-23",10004,1,NULL,3),
+(618,"S8881111C",500,"2021-08-24",10001,1,NULL,6),
+(619,"S8881111C",850,"2021-08-25",10001,1,NULL,6),
+(620,"T0001111B",500,"2021-08-26",10001,1,NULL,4),
+(621,"S8881111C",650,"2021-08-27",10002,1,NULL,6),
+(622,"S7770000D",800,"2021-08-28",10004,1,NULL,7),
+(623,"T0001111B",750,"2021-08-29",10002,1,NULL,4),
+(624,"T0001111B",500,"2021-08-30",10002,1,NULL,4),
+(625,"S8880000C",650,"2021-08-31",10002,1,NULL,5),
+(626,"S7771111D",800,"2021-09-01",10003,1,NULL,8),
+(627,"S7771111D",500,"2021-09-02",10002,1,NULL,8),
+(628,"S9990000A",900,"2021-09-03",10004,1,NULL,1),
+(629,"S8880000C",900,"2021-09-04",10002,1,NULL,5),
+(630,"S7770000D",750,"2021-09-05",10004,1,NULL,7),
+(631,"S9990000A",300,"2021-09-06",10004,1,NULL,1),
+(632,"S7771111D",950,"2021-09-07",10003,1,NULL,8),
+(633,"S9991111A",550,"2021-09-08",10001,1,NULL,2),
+(634,"S8881111C",450,"2021-09-09",10002,1,NULL,6),
+(635,"S8881111C",900,"2021-09-10",10002,1,NULL,6),
+(636,"S7771111D",450,"2021-09-11",10002,1,NULL,8),
+(637,"S7770000D",450,"2021-09-12",10002,1,NULL,7),
+(638,"S9990000A",850,"2021-09-13",10004,1,NULL,1),
+(639,"S7770000D",700,"2021-09-14",10004,1,NULL,7),
+(640,"S7770000D",900,"2021-09-15",10003,1,NULL,7),
+(641,"S7771111D",500,"2021-09-16",10004,1,NULL,8),
+(642,"S9991111A",600,"2021-09-17",10004,1,NULL,2),
+(643,"S7771111D",650,"2021-09-18",10003,1,NULL,8),
+(644,"S7771111D",350,"2021-09-19",10002,1,NULL,8),
+(645,"S8880000C",750,"2021-09-20",10003,1,NULL,5),
+(646,"T0000000B",350,"2021-09-21",10001,1,NULL,3),
+(647,"S7771111D",600,"2021-09-22",10001,1,NULL,8),
+(648,"S7771111D",750,"2021-09-23",10002,1,NULL,8),
+(649,"S9991111A",600,"2021-09-24",10003,1,NULL,2),
+(650,"S9991111A",850,"2021-09-25",10002,1,NULL,2),
+(651,"S9990000A",400,"2021-09-26",10001,1,NULL,1),
+(652,"S8881111C",200,"2021-09-27",10001,1,NULL,6),
+(653,"S8881111C",850,"2021-09-28",10003,1,NULL,6),
+(654,"S7771111D",650,"2021-09-29",10001,1,NULL,8),
+(655,"S8881111C",200,"2021-09-30",10001,1,NULL,6),
+(656,"T0000000B",900,"2021-10-01",10002,1,NULL,3),
+(657,"T0000000B",850,"2021-10-02",10004,1,NULL,3),
+(658,"S9990000A",400,"2021-10-03",10001,1,NULL,1),
+(659,"S9990000A",300,"2021-10-04",10001,1,NULL,1),
+(660,"S8881111C",750,"2021-10-05",10003,1,NULL,6),
+(661,"S7770000D",450,"2021-10-06",10004,1,NULL,7),
+(662,"T0001111B",300,"2021-10-07",10003,1,NULL,4),
+(663,"S7770000D",700,"2021-10-08",10004,1,NULL,7),
+(664,"S8880000C",550,"2021-10-09",10004,1,NULL,5),
+(665,"T0000000B",200,"2021-10-10",10002,1,NULL,3),
+(666,"S7770000D",450,"2021-10-11",10002,1,NULL,7),
+(667,"S9991111A",700,"2021-10-12",10001,1,NULL,2),
+(668,"S9990000A",800,"2021-10-13",10004,1,NULL,1),
+(669,"S9990000A",250,"2021-10-14",10004,1,NULL,1),
+(670,"S7770000D",950,"2021-10-15",10001,1,NULL,7),
+(671,"S8881111C",450,"2021-10-16",10002,1,NULL,6),
+(672,"S9991111A",250,"2021-10-17",10003,1,NULL,2),
+(673,"S8881111C",700,"2021-10-18",10001,1,NULL,6),
+(674,"S7771111D",200,"2021-10-19",10002,1,NULL,8),
+(675,"S8881111C",450,"2021-10-20",10002,1,NULL,6),
+(676,"S9991111A",650,"2021-10-21",10004,1,NULL,2),
+(677,"S8880000C",800,"2021-10-22",10003,1,NULL,5),
+(678,"S7770000D",850,"2021-10-23",10004,1,NULL,7),
+(679,"S8880000C",200,"2021-10-24",10004,1,NULL,5),
+(680,"S7770000D",400,"2021-10-25",10002,1,NULL,7),
+(681,"S8880000C",400,"2021-10-26",10002,1,NULL,5),
+(682,"T0000000B",950,"2021-10-27",10001,1,NULL,3),
+(683,"S8881111C",250,"2021-10-28",10003,1,NULL,6),
+(684,"S8880000C",900,"2021-10-29",10003,1,NULL,5),
+(685,"S7770000D",500,"2021-10-30",10003,1,NULL,7),
+(686,"S8881111C",400,"2021-10-31",10002,1,NULL,6),
+(687,"S8881111C",400,"2021-11-01",10003,1,NULL,6),
+(688,"S9990000A",600,"2021-11-02",10002,1,NULL,1),
+(689,"S8880000C",400,"2021-11-03",10004,1,NULL,5),
+(690,"S9990000A",500,"2021-11-04",10001,1,NULL,1),
+(691,"S7770000D",650,"2021-11-05",10003,1,NULL,7),
+(692,"S9990000A",200,"2021-11-06",10004,1,NULL,1),
+(693,"S9991111A",850,"2021-11-07",10004,1,NULL,2),
+(694,"T0001111B",450,"2021-11-08",10002,1,NULL,4),
+(695,"T0000000B",750,"2021-11-09",10001,1,NULL,3),
+(696,"S9991111A",600,"2021-11-10",10004,1,NULL,2),
+(697,"S8880000C",600,"2021-11-11",10004,1,NULL,5),
+(698,"S8881111C",250,"2021-11-12",10004,1,NULL,6),
+(699,"S7770000D",750,"2021-11-13",10001,1,NULL,7),
+(700,"S8880000C",300,"2021-11-14",10001,1,NULL,5),
+(701,"T0001111B",350,"2021-11-15",10002,1,NULL,4),
+(702,"T0000000B",250,"2021-11-16",10004,1,NULL,3),
+(703,"S8881111C",450,"2021-11-17",10001,1,NULL,6),
+(704,"S9990000A",450,"2021-11-18",10002,1,NULL,1),
+(705,"S7771111D",350,"2021-11-19",10001,1,NULL,8),
+(706,"T0000000B",750,"2021-11-20",10002,1,NULL,3),
+(707,"S8881111C",350,"2021-11-21",10004,1,NULL,6),
+(708,"T0000000B",500,"2021-11-22",10003,1,NULL,3),
+(709,"S9990000A",800,"2021-11-23",10002,1,NULL,1),
+(710,"S9990000A",800,"2021-11-24",10003,1,NULL,1),
+(711,"T0000000B",250,"2021-11-25",10003,1,NULL,3),
+(712,"S7771111D",750,"2021-11-26",10003,1,NULL,8),
+(713,"S7771111D",300,"2021-11-27",10002,1,NULL,8),
+(714,"S8880000C",600,"2021-11-28",10001,1,NULL,5),
+(715,"S7770000D",450,"2021-11-29",10002,1,NULL,7),
+(716,"S8881111C",750,"2021-11-30",10004,1,NULL,6),
+(717,"S8880000C",800,"2021-12-01",10001,1,NULL,5),
+(718,"S7771111D",850,"2021-12-02",10001,1,NULL,8),
+(719,"S9990000A",500,"2021-12-03",10004,1,NULL,1),
+(720,"S8881111C",700,"2021-12-04",10003,1,NULL,6),
+(721,"T0001111B",300,"2021-12-05",10003,1,NULL,4),
+(722,"S7770000D",350,"2021-12-06",10002,1,NULL,7),
+(723,"S8881111C",950,"2021-12-07",10002,1,NULL,6),
+(724,"S8881111C",250,"2021-12-08",10002,1,NULL,6),
+(725,"T0001111B",250,"2021-12-09",10004,1,NULL,4),
+(726,"S9990000A",350,"2021-12-10",10003,1,NULL,1),
+(727,"S7770000D",350,"2021-12-11",10002,1,NULL,7),
+(728,"S7770000D",850,"2021-12-12",10004,1,NULL,7),
+(729,"S8880000C",950,"2021-12-13",10004,1,NULL,5),
+(730,"S8880000C",650,"2021-12-14",10002,1,NULL,5),
+(731,"S8880000C",400,"2021-12-15",10002,1,NULL,5),
+(732,"S7771111D",400,"2021-12-16",10004,1,NULL,8),
+(733,"S9991111A",950,"2021-12-17",10002,1,NULL,2),
+(734,"S9991111A",950,"2021-12-18",10001,1,NULL,2),
+(735,"S7771111D",450,"2021-12-19",10002,1,NULL,8),
+(736,"S8880000C",250,"2021-12-20",10003,1,NULL,5),
+(737,"T0000000B",700,"2021-12-21",10004,1,NULL,3),
+(738,"T0000000B",450,"2021-12-22",10003,1,NULL,3),
+(739,"S9990000A",900,"2021-12-23",10003,1,NULL,1),
+(740,"S7771111D",950,"2021-12-24",10002,1,NULL,8),
+(741,"S9991111A",900,"2021-12-25",10003,1,NULL,2),
+(742,"S7771111D",550,"2021-12-26",10003,1,NULL,8),
+(743,"S7770000D",200,"2021-12-27",10004,1,NULL,7),
+(744,"S8880000C",400,"2021-12-28",10002,1,NULL,5),
+(745,"S8881111C",700,"2021-12-29",10004,1,NULL,6),
+(746,"S7771111D",500,"2021-12-30",10002,1,NULL,8),
+(747,"S7771111D",450,"2021-12-31",10003,1,NULL,8),
+(748,"S7771111D",650,"2022-01-01",10004,1,NULL,8),
+(749,"S9991111A",200,"2022-01-02",10001,1,NULL,2),
+(750,"T0001111B",600,"2022-01-03",10002,1,NULL,4),
+(751,"S9990000A",200,"2022-01-04",10004,1,NULL,1),
+(752,"S9990000A",650,"2022-01-05",10003,1,NULL,1),
+(753,"T0000000B",400,"2022-01-06",10004,1,NULL,3),
+(754,"T0000000B",600,"2022-01-07",10002,1,NULL,3),
+(755,"T0001111B",500,"2022-01-08",10002,1,NULL,4),
+(756,"S8881111C",950,"2022-01-09",10004,1,NULL,6),
+(757,"S8880000C",750,"2022-01-10",10004,1,NULL,5),
+(758,"S7770000D",850,"2022-01-11",10001,1,NULL,7),
+(759,"S8881111C",250,"2022-01-12",10001,1,NULL,6),
+(760,"S9991111A",750,"2022-01-13",10004,1,NULL,2),
+(761,"S8880000C",600,"2022-01-14",10002,1,NULL,5),
+(762,"S8880000C",300,"2022-01-15",10004,1,NULL,5),
+(763,"S9990000A",800,"2022-01-16",10001,1,NULL,1),
+(764,"S7770000D",500,"2022-01-17",10002,1,NULL,7),
+(765,"S7771111D",350,"2022-01-18",10003,1,NULL,8),
+(766,"T0000000B",700,"2022-01-19",10003,1,NULL,3),
+(767,"T0000000B",400,"2022-01-20",10001,1,NULL,3),
+(768,"S8881111C",450,"2022-01-21",10004,1,NULL,6),
+(769,"S8881111C",650,"2022-01-22",10001,1,NULL,6),
+(770,"S8880000C",200,"2022-01-23",10002,1,NULL,5),
+(771,"S7770000D",700,"2022-01-24",10004,1,NULL,7),
+(772,"S9991111A",200,"2022-01-25",10004,1,NULL,2),
+(773,"S8880000C",850,"2022-01-26",10003,1,NULL,5),
+(774,"S9991111A",650,"2022-01-27",10004,1,NULL,2),
+(775,"S9990000A",500,"2022-01-28",10001,1,NULL,1),
+(776,"S8880000C",850,"2022-01-29",10002,1,NULL,5),
+(777,"S9991111A",300,"2022-01-30",10001,1,NULL,2),
+(778,"T0001111B",500,"2022-01-31",10001,1,NULL,4),
+(779,"T0001111B",550,"2022-02-01",10004,1,NULL,4),
+(780,"T0000000B",350,"2022-02-02",10002,1,NULL,3),
+(781,"S7770000D",650,"2022-02-03",10004,1,NULL,7),
+(782,"S9991111A",550,"2022-02-04",10002,1,NULL,2),
+(783,"S7771111D",200,"2022-02-05",10004,1,NULL,8),
+(784,"S8881111C",600,"2022-02-06",10003,1,NULL,6),
+(785,"T0001111B",300,"2022-02-07",10003,1,NULL,4),
+(786,"S9991111A",900,"2022-02-08",10004,1,NULL,2),
+(787,"T0001111B",700,"2022-02-09",10002,1,NULL,4),
+(788,"S8880000C",850,"2022-02-10",10003,1,NULL,5),
+(789,"T0000000B",250,"2022-02-11",10001,1,NULL,3),
+(790,"S8880000C",900,"2022-02-12",10004,1,NULL,5),
+(791,"S7770000D",500,"2022-02-13",10001,1,NULL,7),
+(792,"S7770000D",350,"2022-02-14",10004,1,NULL,7),
+(793,"S9990000A",500,"2022-02-15",10002,1,NULL,1),
+(794,"S9990000A",300,"2022-02-16",10001,1,NULL,1),
+(795,"S8880000C",650,"2022-02-17",10004,1,NULL,5),
+(796,"T0000000B",750,"2022-02-18",10002,1,NULL,3),
+(797,"S7770000D",750,"2022-02-19",10004,1,NULL,7),
+(798,"S7770000D",950,"2022-02-20",10003,1,NULL,7),
+(799,"S9990000A",850,"2022-02-21",10001,1,NULL,1),
+(800,"S8880000C",900,"2022-02-22",10004,1,NULL,5),
+(801,"S8881111C",300,"2022-02-23",10003,1,NULL,6),
+(802,"S8881111C",450,"2022-02-24",10002,1,NULL,6),
+(803,"S9991111A",750,"2022-02-25",10002,1,NULL,2),
+(804,"S8880000C",650,"2022-02-26",10004,1,NULL,5),
+(805,"S9991111A",600,"2022-02-27",10002,1,NULL,2),
+(806,"T0000000B",400,"2022-02-28",10004,1,NULL,3),
+(807,"S9990000A",200,"2022-03-01",10004,1,NULL,1),
+(808,"T0001111B",950,"2022-03-02",10004,1,NULL,4),
+(809,"T0001111B",200,"2022-03-03",10004,1,NULL,4),
+(810,"S7770000D",250,"2022-03-04",10003,1,NULL,7),
+(811,"T0000000B",600,"2022-03-05",10003,1,NULL,3),
+(812,"T0001111B",300,"2022-03-06",10004,1,NULL,4),
+(813,"T0001111B",350,"2022-03-07",10003,1,NULL,4),
+(814,"T0000000B",650,"2022-03-08",10003,1,NULL,3),
+(815,"S9990000A",200,"2022-03-09",10001,1,NULL,1),
+(816,"S9990000A",350,"2022-03-10",10002,1,NULL,1),
+(817,"S7770000D",200,"2022-03-11",10001,1,NULL,7),
+(818,"S7770000D",300,"2022-03-12",10001,1,NULL,7),
+(819,"S9990000A",900,"2022-03-13",10002,1,NULL,1),
+(820,"T0001111B",550,"2022-03-14",10002,1,NULL,4),
+(821,"S9991111A",850,"2022-03-15",10001,1,NULL,2),
+(822,"T0001111B",300,"2022-03-16",10002,1,NULL,4),
+(823,"S9990000A",600,"2022-03-17",10004,1,NULL,1),
+(824,"S8880000C",400,"2022-03-18",10002,1,NULL,5),
+(825,"S8880000C",650,"2022-03-19",10001,1,NULL,5),
+(826,"S9990000A",900,"2022-03-20",10004,1,NULL,1),
+(827,"S8880000C",400,"2022-03-21",10002,1,NULL,5),
+(828,"S8880000C",750,"2022-03-22",10001,1,NULL,5),
+(829,"S8881111C",400,"2022-03-23",10001,1,NULL,6),
+(830,"S9991111A",700,"2022-03-24",10003,1,NULL,2),
+(831,"S7771111D",350,"2022-03-25",10004,1,NULL,8),
+(832,"S8880000C",700,"2022-03-26",10001,1,NULL,5),
+(833,"S7770000D",600,"2022-03-27",10003,1,NULL,7),
+(834,"S8881111C",450,"2022-03-28",10003,1,NULL,6),
+(835,"T0001111B",550,"2022-03-29",10003,1,NULL,4),
+(836,"S8881111C",550,"2022-03-30",10004,1,NULL,6),
+(837,"S9991111A",800,"2022-03-31",10004,1,NULL,2),
+(838,"S9991111A",650,"2022-04-01",10003,1,NULL,2),
+(839,"S7770000D",400,"2022-04-02",10002,1,NULL,7),
+(840,"S8881111C",400,"2022-04-03",10002,1,NULL,6),
+(841,"S7770000D",400,"2022-04-04",10001,1,NULL,7),
+(842,"T0000000B",950,"2022-04-05",10004,1,NULL,3),
+(843,"S7771111D",950,"2022-04-06",10003,1,NULL,8),
+(844,"T0000000B",400,"2022-04-07",10002,1,NULL,3),
+(845,"S7770000D",250,"2022-04-08",10004,1,NULL,7),
+(846,"S7770000D",600,"2022-04-09",10003,1,NULL,7),
+(847,"S7770000D",400,"2022-04-10",10001,1,NULL,7),
+(848,"S9991111A",900,"2022-04-11",10002,1,NULL,2),
+(849,"T0000000B",750,"2022-04-12",10001,1,NULL,3),
+(850,"S8880000C",500,"2022-04-13",10001,1,NULL,5),
+(851,"S8881111C",750,"2022-04-14",10001,1,NULL,6),
+(852,"T0000000B",350,"2022-04-15",10002,1,NULL,3),
+(853,"S8881111C",550,"2022-04-16",10001,1,NULL,6),
+(854,"S9990000A",400,"2022-04-17",10002,1,NULL,1),
+(855,"S9990000A",750,"2022-04-18",10001,1,NULL,1),
+(856,"S9991111A",450,"2022-04-19",10004,1,NULL,2),
+(857,"S7770000D",800,"2022-04-20",10001,1,NULL,7),
+(858,"S9990000A",200,"2022-04-21",10004,1,NULL,1),
+(859,"S8881111C",250,"2022-04-22",10004,1,NULL,6),
+(860,"S7770000D",500,"2022-04-23",10001,1,NULL,7),
+(861,"S8880000C",850,"2022-04-24",10002,1,NULL,5),
+(862,"S8881111C",550,"2022-04-25",10004,1,NULL,6),
+(863,"S7770000D",850,"2022-04-26",10003,1,NULL,7),
+(864,"S8880000C",500,"2022-04-27",10004,1,NULL,5),
+(865,"S9991111A",750,"2022-04-28",10004,1,NULL,2),
+(866,"S9991111A",400,"2022-04-29",10002,1,NULL,2),
+(867,"S8881111C",850,"2022-04-30",10001,1,NULL,6),
+(868,"S7770000D",550,"2022-05-01",10004,1,NULL,7),
+(869,"S8880000C",450,"2022-05-02",10004,1,NULL,5),
+(870,"S9990000A",300,"2022-05-03",10002,1,NULL,1),
+(871,"S9990000A",300,"2022-05-04",10002,1,NULL,1),
+(872,"S8881111C",800,"2022-05-05",10003,1,NULL,6),
+(873,"T0000000B",450,"2022-05-06",10001,1,NULL,3),
+(874,"T0000000B",550,"2022-05-07",10002,1,NULL,3),
+(875,"T0001111B",500,"2022-05-08",10004,1,NULL,4),
+(876,"S7770000D",300,"2022-05-09",10002,1,NULL,7),
+(877,"S9990000A",600,"2022-05-10",10003,1,NULL,1),
+(878,"S9990000A",450,"2022-05-11",10004,1,NULL,1),
+(879,"T0001111B",650,"2022-05-12",10004,1,NULL,4),
+(880,"S8881111C",500,"2022-05-13",10002,1,NULL,6),
+(881,"S8880000C",750,"2022-05-14",10004,1,NULL,5),
+(882,"S7770000D",750,"2022-05-15",10002,1,NULL,7),
+(883,"S8881111C",600,"2022-05-16",10004,1,NULL,6),
+(884,"S7771111D",800,"2022-05-17",10003,1,NULL,8),
+(885,"S7771111D",750,"2022-05-18",10001,1,NULL,8),
+(886,"S8880000C",750,"2022-05-19",10001,1,NULL,5),
+(887,"S9991111A",250,"2022-05-20",10002,1,NULL,2),
+(888,"S9990000A",450,"2022-05-21",10003,1,NULL,1),
+(889,"S8880000C",950,"2022-05-22",10001,1,NULL,5),
+(890,"S9991111A",450,"2022-05-23",10001,1,NULL,2),
+(891,"T0001111B",600,"2022-05-24",10002,1,NULL,4),
+(892,"S7771111D",750,"2022-05-25",10004,1,NULL,8),
+(893,"T0001111B",350,"2022-05-26",10003,1,NULL,4),
+(894,"T0001111B",900,"2022-05-27",10003,1,NULL,4),
+(895,"S7770000D",800,"2022-05-28",10002,1,NULL,7),
+(896,"S9991111A",750,"2022-05-29",10002,1,NULL,2),
+(897,"S7771111D",250,"2022-05-30",10004,1,NULL,8),
+(898,"S9990000A",400,"2022-05-31",10003,1,NULL,1),
+(899,"S7770000D",550,"2022-06-01",10003,1,NULL,7),
+(900,"S8881111C",600,"2022-06-02",10002,1,NULL,6),
+(901,"T0000000B",750,"2022-06-03",10001,1,NULL,3),
+(902,"S7770000D",300,"2022-06-04",10004,1,NULL,7),
+(903,"T0000000B",700,"2022-06-05",10002,1,NULL,3),
+(904,"T0000000B",800,"2022-06-06",10001,1,NULL,3),
+(905,"S9990000A",200,"2022-06-07",10003,1,NULL,1),
+(906,"T0001111B",700,"2022-06-08",10001,1,NULL,4),
+(907,"S9991111A",350,"2022-06-09",10002,1,NULL,2),
+(908,"S8881111C",700,"2022-06-10",10004,1,NULL,6),
+(909,"T0000000B",500,"2022-06-11",10002,1,NULL,3),
+(910,"S9991111A",950,"2022-06-12",10002,1,NULL,2),
+(911,"S7771111D",300,"2022-06-13",10002,1,NULL,8),
+(912,"S8881111C",600,"2022-06-14",10001,1,NULL,6),
+(913,"S9990000A",550,"2022-06-15",10002,1,NULL,1),
+(914,"S8880000C",450,"2022-06-16",10001,1,NULL,5),
+(915,"S8881111C",600,"2022-06-17",10002,1,NULL,6),
+(916,"S7770000D",600,"2022-06-18",10003,1,NULL,7),
+(917,"S8880000C",650,"2022-06-19",10001,1,NULL,5),
+(918,"T0000000B",600,"2022-06-20",10001,1,NULL,3),
+(919,"S9990000A",600,"2022-06-21",10004,1,NULL,1),
+(920,"T0001111B",500,"2022-06-22",10004,1,NULL,4),
+(921,"S7770000D",500,"2022-06-23",10001,1,NULL,7),
+(922,"S7771111D",850,"2022-06-24",10003,1,NULL,8),
+(923,"S8880000C",750,"2022-06-25",10001,1,NULL,5),
+(924,"S7770000D",550,"2022-06-26",10001,1,NULL,7),
+(925,"S9990000A",700,"2022-06-27",10001,1,NULL,1),
+(926,"S8881111C",500,"2022-06-28",10003,1,NULL,6),
+(927,"T0000000B",900,"2022-06-29",10001,1,NULL,3),
+(928,"S7770000D",200,"2022-06-30",10002,1,NULL,7),
+(929,"T0000000B",450,"2022-07-01",10001,1,NULL,3),
+(930,"S8881111C",600,"2022-07-02",10002,1,NULL,6),
+(931,"T0001111B",550,"2022-07-03",10004,1,NULL,4),
+(932,"S9991111A",650,"2022-07-04",10002,1,NULL,2),
+(933,"S7770000D",700,"2022-07-05",10004,1,NULL,7),
+(934,"S7770000D",850,"2022-07-06",10001,1,NULL,7),
+(935,"S9991111A",750,"2022-07-07",10003,1,NULL,2),
+(936,"S7770000D",550,"2022-07-08",10004,1,NULL,7),
+(937,"T0000000B",850,"2022-07-09",10004,1,NULL,3),
+(938,"T0001111B",500,"2022-07-10",10004,1,NULL,4),
+(939,"S9990000A",800,"2022-07-11",10001,1,NULL,1),
+(940,"S9991111A",800,"2022-07-12",10003,1,NULL,2),
+(941,"S9991111A",200,"2022-07-13",10001,1,NULL,2),
+(942,"S8880000C",300,"2022-07-14",10004,1,NULL,5),
+(943,"T0000000B",350,"2022-07-15",10004,1,NULL,3),
+(944,"S7770000D",750,"2022-07-16",10001,1,NULL,7),
+(945,"T0000000B",450,"2022-07-17",10004,1,NULL,3),
+(946,"S8881111C",400,"2022-07-18",10003,1,NULL,6),
+(947,"S9991111A",400,"2022-07-19",10004,1,NULL,2),
+(948,"S9991111A",400,"2022-07-20",10004,1,NULL,2),
+(949,"T0001111B",800,"2022-07-21",10003,1,NULL,4),
+(950,"T0001111B",200,"2022-07-22",10003,1,NULL,4),
+(951,"S7771111D",800,"2022-07-23",10002,1,NULL,8),
+(952,"S8881111C",750,"2022-07-24",10004,1,NULL,6),
+(953,"S9991111A",700,"2022-07-25",10003,1,NULL,2),
+(954,"S8880000C",600,"2022-07-26",10003,1,NULL,5),
+(955,"S8880000C",250,"2022-07-27",10004,1,NULL,5),
+(956,"S8881111C",950,"2022-07-28",10002,1,NULL,6),
+(957,"S9990000A",600,"2022-07-29",10004,1,NULL,1),
+(958,"S7771111D",950,"2022-07-30",10002,1,NULL,8),
+(959,"S8880000C",600,"2022-07-31",10003,1,NULL,5),
+(960,"T0001111B",350,"2022-08-01",10004,1,NULL,4),
+(961,"S8880000C",500,"2022-08-02",10002,1,NULL,5),
+(962,"T0000000B",200,"2022-08-03",10004,1,NULL,3),
+(963,"S7770000D",950,"2022-08-04",10002,1,NULL,7),
+(964,"S9991111A",300,"2022-08-05",10003,1,NULL,2),
+(965,"S7771111D",600,"2022-08-06",10004,1,NULL,8),
+(966,"S8881111C",800,"2022-08-07",10001,1,NULL,6),
+(967,"T0000000B",350,"2022-08-08",10002,1,NULL,3),
+(968,"S8880000C",950,"2022-08-09",10004,1,NULL,5),
+(969,"S7770000D",800,"2022-08-10",10003,1,NULL,7),
+(970,"S7770000D",650,"2022-08-11",10003,1,NULL,7),
+(971,"T0001111B",900,"2022-08-12",10004,1,NULL,4),
+(972,"S9991111A",950,"2022-08-13",10002,1,NULL,2),
+(973,"S7771111D",250,"2022-08-14",10003,1,NULL,8),
+(974,"S9991111A",400,"2022-08-15",10001,1,NULL,2),
+(975,"S7770000D",550,"2022-08-16",10004,1,NULL,7),
+(976,"S8880000C",200,"2022-08-17",10003,1,NULL,5),
+(977,"S7770000D",250,"2022-08-18",10004,1,NULL,7),
+(978,"S9991111A",900,"2022-08-19",10003,1,NULL,2),
+(979,"T0001111B",300,"2022-08-20",10001,1,NULL,4),
+(980,"T0000000B",950,"2022-08-21",10002,1,NULL,3),
+(981,"T0001111B",750,"2022-08-22",10003,1,NULL,4),
+(982,"T0001111B",950,"2022-08-23",10002,1,NULL,4),
+(983,"S9990000A",900,"2022-08-24",10004,1,NULL,1),
+(984,"T0000000B",950,"2022-08-25",10001,1,NULL,3),
+(985,"T0001111B",550,"2022-08-26",10004,1,NULL,4),
+(986,"S8881111C",350,"2022-08-27",10004,1,NULL,6),
+(987,"S9991111A",850,"2022-08-28",10001,1,NULL,2),
+(988,"S8880000C",900,"2022-08-29",10004,1,NULL,5),
+(989,"T0000000B",550,"2022-08-30",10002,1,NULL,3),
+(990,"S9990000A",700,"2022-08-31",10002,1,NULL,1),
+(991,"S7771111D",850,"2022-09-01",10004,1,NULL,8),
+(992,"S7771111D",550,"2022-09-02",10003,1,NULL,8),
+(993,"S8881111C",950,"2022-09-03",10002,1,NULL,6),
+(994,"S8880000C",450,"2022-09-04",10003,1,NULL,5),
+(995,"S8880000C",450,"2022-09-05",10002,1,NULL,5),
+(996,"S9990000A",650,"2022-09-06",10002,1,NULL,1),
+(997,"T0001111B",300,"2022-09-07",10001,1,NULL,4),
+(998,"S8880000C",800,"2022-09-08",10004,1,NULL,5),
+(999,"T0000000B",700,"2022-09-09",10001,1,NULL,3),
+(1000,"S7771111D",300,"2022-09-10",10003,1,NULL,8),
+(1001,"S7771111D",550,"2022-09-11",10002,1,NULL,8),
+(1002,"S9990000A",500,"2022-09-12",10003,1,NULL,1),
+(1003,"S7771111D",900,"2022-09-13",10001,1,NULL,8),
+(1004,"T0000000B",400,"2022-09-14",10003,1,NULL,3),
+(1005,"S8880000C",400,"2022-09-15",10001,1,NULL,5),
+(1006,"S9990000A",200,"2022-09-16",10002,1,NULL,1),
+(1007,"S7770000D",250,"2022-09-17",10003,1,NULL,7),
+(1008,"S7770000D",250,"2022-09-18",10001,1,NULL,7),
+(1009,"T0000000B",300,"2022-09-19",10003,1,NULL,3),
+(1010,"S8880000C",850,"2022-09-20",10003,1,NULL,5),
+(1011,"S9991111A",400,"2022-09-21",10001,1,NULL,2),
+(1012,"S8881111C",250,"2022-09-22",10003,1,NULL,6),
+(1013,"T0001111B",300,"2022-09-23",10004,1,NULL,4),
+(1014,"S7770000D",950,"2022-09-24",10001,1,NULL,7),
+(1015,"T0000000B",850,"2022-09-25",10001,1,NULL,3),
+(1016,"T0001111B",500,"2022-09-26",10004,1,NULL,4);
@@ -1,14 +1,33 @@
+import argparse
 import csv
-from datetime import datetime, timedelta
+import hashlib
+import json
+import os
 import random
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from itertools import accumulate, islice
 
-# This python script generates donation records and write to CSV format and SQL INSERT statements.
+# This python script generates donors, blood requests and donation records for load testing.
+# Rows are produced by generators and written in chunks, so memory use does not grow with the row count.
+#
+# Output formats:
+#   sql        chunked multi-row INSERT statements (<base>.sql)
+#   csv        one CSV per table plus a LOAD DATA script (<base>-<table>.csv, <base>-load.sql)
+#   firestore  JSON lines, one Firestore batch (at most 500 writes) per line (<base>-firestore.jsonl),
+#              loaded with `python manage.py --backend firebase load-firestore <file>`
+#
+# Generated request and donation ids start after those of generate_database.sql, so the output can be
+# loaded into a seeded database.
+#
+# Example: python generate_donations.py --donors 100000 --donations 1000000 --requests 50000 --format csv --seed 1
 
-filename_base = 'donations'
+SCHEMA = 'bloodmanagementsystem'
+# Run after loading, so the ETags and cached responses of /query change with the data
+BUMP_VERSIONS = f"UPDATE `{SCHEMA}`.`DataVersion` SET `version`=`version` + 1, `updatedAt`=UTC_TIMESTAMP();\n"
 
-count = int(input("Enter number of donations to generate: "))
-
-donors = [
+# Donors already in generate_database.sql, used when no donors are generated
+SEED_DONORS = [
     'S9990000A',
     'S9991111A',
     'T0000000B',
@@ -18,51 +37,313 @@ donors = [
     'S7770000D',
     'S7771111D',
 ]
+# The seeded donors have blood type ids 1 to 8, in order
+SEED_DONOR_BLOOD_TYPES = {nric: i + 1 for i, nric in enumerate(SEED_DONORS)}
+# Highest request and donation ids in generate_database.sql; generated ids follow them
+SEED_MAX_REQUEST_ID = 8
+SEED_MAX_DONATION_ID = 16
+
+# Blood type id (as in the BloodType table) -> (type, share of population)
+BLOOD_TYPES = {
+    1: ('A+', 0.34),
+    2: ('A-', 0.06),
+    3: ('B+', 0.09),
+    4: ('B-', 0.02),
+    5: ('O+', 0.38),
+    6: ('O-', 0.07),
+    7: ('AB+', 0.03),
+    8: ('AB-', 0.01),
+}
+
+# Branch id -> (share of donations, staff user id recording them)
+BRANCHES = {
+    10001: (0.40, 1),
+    10002: (0.30, 2),
+    10003: (0.20, 3),
+    10004: (0.10, 4),
+}
+# Names of the seeded branches and staff users, embedded in Firestore donation documents
+BRANCH_NAMES = {
+    10001: 'Woodlands Branch',
+    10002: 'Jurong Branch',
+    10003: 'Changi Branch',
+    10004: 'Marina Branch',
+}
+STAFF_USERNAMES = {1: 'user1', 2: 'user2', 3: 'user3', 4: 'user4'}
+
+HEALTHCARE_USER_ID = 5
+HOSPITALS = ['TTSH', 'KPTH', 'NTFGH', 'KKWOMEN', 'SGH', 'CGH', 'NUH']
+DONATION_QUANTITIES = list(range(200, 1000, 50)) # 200 - 950
+REQUEST_QUANTITIES = list(range(200, 2050, 50))
+
+# Cumulative population shares of BLOOD_TYPES, for weighted picks
+BLOOD_TYPE_IDS = list(BLOOD_TYPES)
+BLOOD_TYPE_CUM_WEIGHTS = list(accumulate(share for _, share in BLOOD_TYPES.values()))
+
+# Firestore rejects batches with more than 500 writes
+FIRESTORE_BATCH_SIZE = 500
+# Fields written as ISO 8601 strings to the JSON output and stored as Timestamps, by collection
+FIRESTORE_TIMESTAMP_FIELDS = {
+    'donors': ('dateOfBirth', 'registrationDate'),
+    'donations': ('date',),
+}
+
+
+def donorNric(i):
+    '''NRIC of the i-th generated donor. The G prefix keeps them apart from the seeded donors.'''
+    return f'G{i:07d}X'
+
+
+def donorBloodTypeId(i, bloodTypeSeed):
+    '''Blood type id of the i-th generated donor, picked by a hash of the donor index keyed with bloodTypeSeed,
+    so the donations of a donor get the same blood type without keeping a table of all donors.
+    '''
+    digest = hashlib.blake2b(i.to_bytes(8, 'little'), digest_size=8, key=bloodTypeSeed.to_bytes(8, 'little')).digest()
+    point = int.from_bytes(digest, 'little') / 2 ** 64 * BLOOD_TYPE_CUM_WEIGHTS[-1]
+    return BLOOD_TYPE_IDS[bisect_right(BLOOD_TYPE_CUM_WEIGHTS, point)]
+
+
+def generateDonors(rng: random.Random, count, start: datetime, bloodTypeSeed=0):
+    '''Yield (nric, name, dateOfBirth, contactNo, bloodTypeId, registrationDate).
+    bloodTypeSeed: seed of the donor blood types, the same as given to generateDonations
+    '''
+    for i in range(count):
+        dateOfBirth = date(1950, 1, 1) + timedelta(days=rng.randrange(365 * 55))
+        yield (
+            donorNric(i + 1),
+            f'Donor {i + 1}',
+            dateOfBirth,
+            f'9{rng.randrange(10 ** 7):07d}',
+            donorBloodTypeId(i + 1, bloodTypeSeed),
+            start + timedelta(days=rng.randrange(365)),
+        )
+
+
+def generateRequests(rng: random.Random, count, fulfilledCount, start: datetime, end: datetime):
+    '''Yield (id, requesterId, bloodTypeId, quantity, date, address, status, fulfilled).
+    Ids start after SEED_MAX_REQUEST_ID. The oldest fulfilledCount requests are fulfilled.
+    '''
+    step = (end - start) / max(count, 1)
+    for i in range(count):
+        fulfilled = i < fulfilledCount
+        yield (
+            SEED_MAX_REQUEST_ID + i + 1,
+            HEALTHCARE_USER_ID,
+            rng.choices(BLOOD_TYPE_IDS, cum_weights=BLOOD_TYPE_CUM_WEIGHTS)[0],
+            rng.choice(REQUEST_QUANTITIES),
+            (start + step * i).date(),
+            rng.choice(HOSPITALS),
+            'Delivered' if fulfilled else 'Pending',
+            1 if fulfilled else 0,
+        )
 
-quantities = list(range(200, 1000, 50)) # 200 - 950
-branches = [ 10001, 10002, 10003, 10004 ]
-
-earliestDate = datetime(2020, 1, 1)
-today = datetime.today()
-
-hrIncrement = 24 # Date increment per record, in hours
-deltaDays = (today - earliestDate).days
-if count > deltaDays:
-    hrIncrement = 24 / (count / deltaDays)
-
-# CSV format
-# with open(f'{filename_base}-{count}.csv', 'w', newline='') as csvfile:
-#     writer = csv.writer(csvfile, delimiter=',')
-#     for i in range(count):
-#         writer.writerow([
-#             i + 1, # ID
-#             random.choice(donors), # NRIC
-#             random.choice(quantities), # Quantity
-#             (earliestDate + timedelta(hours=hrIncrement * i)).strftime('%Y-%m-%d'), # Date
-#             random.choice(branches), # Branch Id
-#             1, # recordedBy
-#             'NULL'
-#         ])
-
-# SQL INSERT statements
-with open(f'{filename_base}-{count}.sql', 'w') as f:
-    f.write(
-        'INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES\n'
-    )
 
+def generateDonations(rng: random.Random, count, donorCount, fulfilledCount, usedRatio, start: datetime, end: datetime,
+                      bloodTypeSeed=0):
+    '''Yield (id, nric, quantity, date, branchId, recordedBy, usedBy, bloodTypeId) in date order.
+    Ids start after SEED_MAX_DONATION_ID. A usedRatio share of donations is used by a random fulfilled request.
+    bloodTypeSeed: seed the donors were generated with, which gives their blood types
+    '''
+    branchIds = list(BRANCHES)
+    weights = [share for share, _ in BRANCHES.values()]
+    step = (end - start) / max(count, 1)
     for i in range(count):
-        data = [
-            i + 1, # ID
-            f'\"{random.choice(donors)}\"', # NRIC
-            random.choice(quantities), # Quantity
-            (earliestDate + timedelta(hours=hrIncrement * i)).strftime('\"%Y-%m-%d\"'), # Date
-            random.choice(branches), # Branch Id
-            1, # recordedBy
-            'NULL'
-        ]
-        data = [str(d) for d in data]
-        f.write(f'({",".join(data)})')
-        if i == count - 1:
-            f.write(';\n')
+        branchId = rng.choices(branchIds, weights)[0]
+        if donorCount:
+            donor = rng.randrange(donorCount) + 1
+            nric = donorNric(donor)
+            bloodTypeId = donorBloodTypeId(donor, bloodTypeSeed)
+        else:
+            nric = rng.choice(SEED_DONORS)
+            bloodTypeId = SEED_DONOR_BLOOD_TYPES[nric]
+        usedBy = None
+        if fulfilledCount and rng.random() < usedRatio:
+            usedBy = SEED_MAX_REQUEST_ID + rng.randrange(fulfilledCount) + 1
+        yield (
+            SEED_MAX_DONATION_ID + i + 1,
+            nric,
+            rng.choice(DONATION_QUANTITIES),
+            (start + step * i).replace(microsecond=0),
+            branchId,
+            BRANCHES[branchId][1],
+            usedBy,
+            bloodTypeId,
+        )
+
+
+def chunks(rows, size):
+    '''Split an iterable into lists of at most size items'''
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+TABLES = [
+    ('Donor', ['nric', 'name', 'dateOfBirth', 'contactNo', 'bloodTypeId', 'registrationDate']),
+    ('BloodRequest', ['id', 'requesterId', 'bloodTypeId', 'quantity', 'date', 'address', 'status', 'fulfilled']),
+    ('BloodDonation', ['id', 'nric', 'quantity', 'date', 'branchId', 'recordedBy', 'usedBy', 'bloodTypeId']),
+]
+
+
+def sqlValue(value):
+    if value is None:
+        return 'NULL'
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        value = value.isoformat(sep=' ') if isinstance(value, datetime) else value.isoformat()
+    return "'" + str(value).replace("\\", "\\\\").replace("'", "''") + "'"
+
+
+def writeSql(path, tableRows, chunkSize):
+    '''Write multi-row INSERT statements of at most chunkSize rows each'''
+    with open(path, 'w') as f:
+        f.write('START TRANSACTION;\n')
+        for (table, columns), rows in tableRows:
+            header = f"INSERT INTO `{SCHEMA}`.`{table}` ({', '.join(f'`{c}`' for c in columns)}) VALUES\n"
+            for chunk in chunks(rows, chunkSize):
+                f.write(header)
+                f.write(',\n'.join(f"({','.join(sqlValue(v) for v in row)})" for row in chunk))
+                f.write(';\n')
+        f.write(BUMP_VERSIONS)
+        f.write('COMMIT;\n')
+
+
+def csvValue(value):
+    if value is None:
+        return '\\N' # NULL for LOAD DATA INFILE
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ')
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def writeCsv(base, tableRows, chunkSize):
+    '''Write one CSV per table (with header row) and a script loading them with LOAD DATA'''
+    loadStatements = []
+    for (table, columns), rows in tableRows:
+        path = f'{base}-{table}.csv'
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for chunk in chunks(rows, chunkSize):
+                writer.writerows([csvValue(v) for v in row] for row in chunk)
+        loadStatements.append(
+            f"LOAD DATA LOCAL INFILE '{os.path.abspath(path)}' INTO TABLE `{SCHEMA}`.`{table}`\n"
+            f"  FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' LINES TERMINATED BY '\\r\\n'\n"
+            f"  IGNORE 1 LINES ({', '.join(f'`{c}`' for c in columns)});\n")
+    with open(f'{base}-load.sql', 'w') as f:
+        f.write('SET FOREIGN_KEY_CHECKS=0;\n')
+        f.writelines(loadStatements)
+        f.write(BUMP_VERSIONS)
+        f.write('SET FOREIGN_KEY_CHECKS=1;\n')
+        f.write('-- Afterwards, run `python manage.py rebuild-inventory` to refresh the dashboard aggregates\n')
+
+
+def firestoreWrites(table, columns, rows):
+    '''Yield (document path, data) for the Firestore data model. Dates are ISO 8601 strings,
+    converted back to Timestamps by firestoreDocument when loaded.'''
+    for row in rows:
+        data = dict(zip(columns, row))
+        if table == 'Donor':
+            data['bloodType'] = BLOOD_TYPES[data.pop('bloodTypeId')][0]
+            data['dateOfBirth'] = data['dateOfBirth'].isoformat()
+            data['registrationDate'] = data['registrationDate'].isoformat()
+            yield f"donors/{data['nric']}", data
+        elif table == 'BloodRequest':
+            id = data.pop('id')
+            data['bloodType'] = BLOOD_TYPES[data.pop('bloodTypeId')][0]
+            data['date'] = str(data['date'])
+            yield f'bloodrequest/{id}', data
         else:
-            f.write(',\n')
\ No newline at end of file
+            id = data.pop('id')
+            data['bloodType'] = BLOOD_TYPES[data.pop('bloodTypeId')][0]
+            data['branchName'] = BRANCH_NAMES[data['branchId']]
+            data['staffUsername'] = STAFF_USERNAMES[data['recordedBy']]
+            data['branchId'] = str(data['branchId'])
+            data['date'] = data['date'].isoformat()
+            data['usedBy'] = str(data['usedBy']) if data['usedBy'] is not None else None
+            yield f'donations/{id}', data
+
+
+def firestoreDocument(path, data):
+    '''Turn a write of the JSON output back into the document data to store: the FIRESTORE_TIMESTAMP_FIELDS
+    are converted from ISO 8601 strings to datetimes, which Firestore stores as Timestamps (in UTC)
+    Returns: (document path, data)
+    '''
+    for field in FIRESTORE_TIMESTAMP_FIELDS.get(path.split('/', 1)[0], ()):
+        if data.get(field) is not None:
+            data[field] = datetime.fromisoformat(data[field])
+    return path, data
+
+
+def readFirestoreBatches(lines):
+    '''Yield the batches of a JSON lines output file, as lists of (document path, data) to store'''
+    for line in lines:
+        if line.strip():
+            yield [firestoreDocument(write['path'], write['data']) for write in json.loads(line)['writes']]
+
+
+def writeFirestore(base, tableRows, chunkSize):
+    '''Write JSON lines of {"writes": [{"path": ..., "data": ...}, ...]}, one Firestore batch per line'''
+    with open(f'{base}-firestore.jsonl', 'w') as f:
+        for (table, columns), rows in tableRows:
+            for chunk in chunks(firestoreWrites(table, columns, rows), min(chunkSize, FIRESTORE_BATCH_SIZE)):
+                f.write(json.dumps({'writes': [{'path': path, 'data': data} for path, data in chunk]}))
+                f.write('\n')
+
+
+WRITERS = {
+    'sql': lambda base, tableRows, chunkSize: writeSql(f'{base}.sql', tableRows, chunkSize),
+    'csv': writeCsv,
+    'firestore': writeFirestore,
+}
+
+
+def generateTables(rng: random.Random, donors, donations, requests, fulfilledRatio=0.8, usedRatio=0.6,
+                   start=datetime(2020, 1, 1), end=datetime(2022, 11, 30)):
+    '''Row generators of every table, in load order
+    Returns: list of ((table, columns), rows)
+    '''
+    fulfilledCount = int(requests * fulfilledRatio)
+    bloodTypeSeed = rng.getrandbits(32)
+    return [
+        (TABLES[0], generateDonors(rng, donors, start, bloodTypeSeed)),
+        (TABLES[1], generateRequests(rng, requests, fulfilledCount, start, end)),
+        (TABLES[2], generateDonations(rng, donations, donors, fulfilledCount, usedRatio, start, end, bloodTypeSeed)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate donors, blood requests and donations for load testing')
+    parser.add_argument('--donations', type=int, required=True, help='number of donations')
+    parser.add_argument('--donors', type=int, default=0, help='number of donors (0 uses the donors seeded by generate_database.sql)')
+    parser.add_argument('--requests', type=int, default=0, help='number of blood requests')
+    parser.add_argument('--fulfilled-ratio', type=float, default=0.8, help='share of requests that are fulfilled')
+    parser.add_argument('--used-ratio', type=float, default=0.6, help='share of donations used by a fulfilled request')
+    parser.add_argument('--start', type=date.fromisoformat, default=date(2020, 1, 1), help='date of the first donation')
+    parser.add_argument('--end', type=date.fromisoformat, default=date.today(), help='date of the last donation (set it for reproducible output)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    parser.add_argument('--format', choices=WRITERS, action='append', help='output format, can be repeated (default sql)')
+    parser.add_argument('--chunk-size', type=int, default=1000, help='rows per INSERT statement / write chunk')
+    parser.add_argument('--out', default='.', help='output directory')
+    args = parser.parse_args()
+
+    start = datetime.combine(args.start, datetime.min.time())
+    end = datetime.combine(args.end, datetime.min.time())
+    base = os.path.join(args.out, f'donations-{args.donations}')
+
+    for format in args.format or ['sql']:
+        # Every format regenerates the rows from the same seed, so all outputs hold the same data
+        tableRows = generateTables(random.Random(args.seed), args.donors, args.donations, args.requests,
+                                   args.fulfilled_ratio, args.used_ratio, start, end)
+        WRITERS[format](base, tableRows, args.chunk_size)
+        print(f'Wrote {format} output to {base}*')
+
+
+if __name__ == '__main__':
+    main()
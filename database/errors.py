@@ -0,0 +1,6 @@
+class FulfillmentConflictError(Exception):
+    '''Raised when a blood request cannot be fulfilled because some of the chosen
+    donations are missing or were already used by another request'''
+    def __init__(self, message, donationIds=()):
+        super().__init__(message)
+        self.donationIds = list(donationIds)
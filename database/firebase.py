@@ -1,21 +1,41 @@
 
 import google.cloud.firestore_v1 as gcloudfirestore
+from google.api_core.exceptions import AlreadyExists
 from firebase_admin import credentials, firestore, initialize_app
 
-from database.models import BloodDonation, BloodInventory, BloodRequest, Branch, DashboardData, Donor, User
-from datetime import datetime, timezone
-
-
-class FirebaseBackend:
+from database.backend import DatabaseBackend
+from database.cache import ReferenceCache
+from database.errors import FulfillmentConflictError
+from database.instrumentation import instrumentation
+from database.models import BloodDonation, BloodInventory, BloodRequest, Branch, Donor, User
+from database.paging import PAGE_SIZE
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+# Maximum number of values Firestore accepts in an 'in' filter
+IN_QUERY_LIMIT = 10
+# Maximum number of writes Firestore accepts in one batch
+BATCH_LIMIT = 500
+# Collection -> name of its version in DATA_VERSIONS
+VERSIONED_COLLECTIONS = {'donors': 'donor', 'donations': 'donation', 'bloodrequest': 'request'}
+
+
+class FirebaseBackend(DatabaseBackend):
     def __init__(self):
         self.creds = credentials.Certificate('database/serviceAccountKey.json')
         self.app = initialize_app(self.creds)
         self.db: gcloudfirestore.Client = firestore.client()
+        instrumentation.instrumentFirestore(self.db)
+        self.refCache = ReferenceCache.fromEnv('BLOODMGT_REFCACHE') # Branches
         super().__init__()
 
     def commit(self):
         pass
 
+    def release(self):
+        pass
+
     @property
     def users_ref(self):
         return self.db.collection('users')
@@ -28,10 +48,56 @@ class FirebaseBackend:
     def bloodrequest_ref(self):
         return self.db.collection('bloodrequest')
 
+    @property
+    def donations_ref(self):
+        '''Blood donations, with the donor's blood type, the branch name and the staff username embedded
+        so that listings need no joins'''
+        return self.db.collection('donations')
+
+    @property
+    def donations_archive_ref(self):
+        '''Donations used by a request and older than the retention window, moved out of donations by archiveDonations'''
+        return self.db.collection('donations_archive')
+
+    @property
+    def versions_ref(self):
+        '''Version of each collection served by /query, one document per DATA_VERSIONS name'''
+        return self.db.collection('versions')
+
+    def _donationCollections(self, includeArchive):
+        '''Donation collections to query: donations, or donations and the archive'''
+        return [self.donations_ref, self.donations_archive_ref] if includeArchive else [self.donations_ref]
+
     @property
     def branches_ref(self):
         return self.db.collection('branches')
 
+    @property
+    def inventory_ref(self):
+        '''Materialized unused blood quantity per blood type, one document per branch'''
+        return self.db.collection('inventory')
+
+    @property
+    def weeklystats_ref(self):
+        '''Donation count and quantity per week, one document per week keyed by its Monday'''
+        return self.db.collection('weeklystats')
+
+    def _donationRef(self, id: str):
+        '''Document reference of a donation from its id. Ids of the legacy schema
+        ("<donor document id>/<donation document id>") are accepted, as migrated donations keep their document id.'''
+        return self.donations_ref.document(id.rsplit('/', 1)[-1])
+
+    @staticmethod
+    def _toUTC(date: datetime):
+        '''Donation time as stored: Firestore assumes datetime in UTC. Naive times are local
+        (queued donations keep the time they were recorded at, imports the time in the file); None is now.'''
+        return date.astimezone(timezone.utc) if date else datetime.now(timezone.utc)
+
+    @staticmethod
+    def _weekKey(date: datetime):
+        '''Key of the weekly stats document for the week containing the date'''
+        return (date - timedelta(days=date.weekday())).date().isoformat()
+
     def login(self, username, password):
         '''User authentication. Return the user if successful or None'''
         userDocs = self.users_ref.where('username', '==', username).where(
@@ -54,14 +120,26 @@ class FirebaseBackend:
             return User.fromDict(doc)
         return None
 
-    def getAllDonors(self):
-        '''Query list of all donors'''
-        donorList = []
-        donorDocs = self.donors_ref.stream()
-        for doc in donorDocs:
-            donorDict = doc.to_dict()
-            donorList.append(Donor.fromDict(donorDict))
-        return donorList
+    @staticmethod
+    def _page(items, after, serialized):
+        # Documents are read into model objects anyway, so serialized pages are built from them
+        if serialized:
+            return [i.serialize() for i in items], after
+        return items, after
+
+    def getDonorsPage(self, after=None, pageSize=PAGE_SIZE, serialized=False):
+        '''Query one page of donors ordered by NRIC, starting after the given cursor
+        Returns: (list of Donor, next page cursor or None)
+        '''
+        query = self.donors_ref.order_by('nric')
+        if after:
+            query = query.start_after({'nric': after})
+        donorList = [Donor.fromDict(doc.to_dict()) for doc in query.limit(pageSize + 1).stream()]
+        after = None
+        if len(donorList) > pageSize:
+            donorList = donorList[:pageSize]
+            after = donorList[-1].nric
+        return self._page(donorList, after, serialized)
 
     def getDonorByNRIC(self, nric: str):
         '''Query one donor by NRIC'''
@@ -71,11 +149,21 @@ class FirebaseBackend:
             return Donor.fromDict(donorDict)
         return None
 
-    def insertDonor(self, donor: Donor):
+    def insertDonor(self, donor: Donor, idempotencyKey=None):
         '''Insert new Donor'''
         data = donor.serialize()
-        data['dateOfBirth'] = donor.dateOfBirth  # Don't serialize date
-        self.donors_ref.add(data)
+        data['dateOfBirth'] = donor.dateOfBirth  # Don't serialize dates
+        data['registrationDate'] = donor.registrationDate
+        if idempotencyKey is None:
+            self.donors_ref.add(data)
+            self._bumpVersions('donor')
+            return
+        # A replayed write creates the same document again, which Firestore rejects
+        try:
+            self.donors_ref.document(idempotencyKey).create(data)
+        except AlreadyExists:
+            return
+        self._bumpVersions('donor')
 
     def updateDonor(self, donor: Donor):
         '''Update existing Donor'''
@@ -89,89 +177,212 @@ class FirebaseBackend:
             'contactNo': donor.contactNo,
             'bloodType': donor.bloodType}
         self.donors_ref.document(donorDict['id']).update(data)
+        if donorDict.get('bloodType') != donor.bloodType:
+            # Update the blood type embedded in the donor's donations, and move their unused blood in the inventory
+            writes = []
+            for doc in (doc for ref in self._donationCollections(True) for doc in ref.where('nric', '==', donor.nric).get()):
+                writes.append((doc.reference, {'bloodType': donor.bloodType}))
+                if doc.get('usedBy') is None:
+                    writes.append((self.inventory_ref.document(str(doc.get('branchId'))), {
+                        donorDict.get('bloodType'): gcloudfirestore.Increment(-int(doc.get('quantity'))),
+                        donor.bloodType: gcloudfirestore.Increment(int(doc.get('quantity')))}))
+            self._writeInBatches(writes, merge=True)
+        self._bumpVersions('donor', 'donation') # Donation listings show the donor's blood type
 
     def deleteDonorByNRIC(self, nric: str):
-        '''Delete donor by NRIC'''
+        '''Delete donor and their donations by NRIC'''
         donorDocs = self.donors_ref.where('nric', '==', nric).get()
         if donorDocs[0].exists:
-            self.donors_ref.document(donorDocs[0].id).delete()
+            writes = [(self.donors_ref.document(donorDocs[0].id), None)]
+            for doc in (doc for ref in self._donationCollections(True) for doc in ref.where('nric', '==', nric).get()):
+                quantity = int(doc.get('quantity'))
+                writes.append((doc.reference, None))
+                if doc.get('usedBy') is None:
+                    writes.append((self.inventory_ref.document(str(doc.get('branchId'))), {
+                        doc.get('bloodType'): gcloudfirestore.Increment(-quantity)}))
+                writes.append((self.weeklystats_ref.document(self._weekKey(doc.get('date'))), {
+                    'donationCount': gcloudfirestore.Increment(-1),
+                    'quantity': gcloudfirestore.Increment(-quantity)}))
+            self._writeInBatches(writes, merge=True)
+            self._bumpVersions('donor', 'donation')
+
+    def getDonationsPage(self, after=None, pageSize=PAGE_SIZE, serialized=False):
+        '''Query one page of blood donations, newest first, starting after the given cursor.
+        The cursor holds the sort values (date|id) of the last donation of the previous page,
+        so the next page starts after them without reading that donation again.
+        Returns: (list of BloodDonation, next page cursor or None)
+        '''
+        query = self.donations_ref.order_by(
+            'date', direction=gcloudfirestore.Query.DESCENDING).order_by(gcloudfirestore.FieldPath.document_id())
+        if after:
+            afterDate, afterId = after.rsplit('|', 1)
+            query = query.start_after({
+                'date': datetime.fromisoformat(afterDate),
+                gcloudfirestore.FieldPath.document_id(): self._donationRef(afterId)})
+        donationDocs = query.limit(pageSize + 1).get()
+        donationList = [self._toDonation(doc) for doc in donationDocs[:pageSize]]
+        after = None
+        if len(donationDocs) > pageSize:
+            last = donationDocs[pageSize - 1]
+            after = f"{last.get('date').isoformat()}|{last.id}"
+        return self._page(donationList, after, serialized)
+
+    @staticmethod
+    def _toDonation(doc):
+        '''BloodDonation from its document, which embeds the blood type, branch name and staff username'''
+        donationDict = doc.to_dict()
+        donationDict['id'] = doc.id
+        return BloodDonation.fromDict(donationDict)
+
+    def _getBloodTypes(self, donorRefs, transaction=None):
+        '''Query the blood type of each donor in one batched read
+        Returns: dict { donor document path: blood type }
+        '''
+        donorRefs = {ref.path: ref for ref in donorRefs}
+        if not donorRefs:
+            return {}
+        donorDocs = self.db.get_all(list(donorRefs.values()), field_paths=['bloodType'], transaction=transaction)
+        return {doc.reference.path: doc.get('bloodType') for doc in donorDocs if doc.exists}
+
+    def _getBranchNames(self, branchIds):
+        '''Query branch names by branch id from the cached branch list
+        Returns: dict { branchId: name }
+        '''
+        return {branch.id: branch.name for branch in self.getAllBranches() if branch.id in branchIds}
 
-    def getAllDonations(self):
-        '''Query list of all blood donations'''
-        donationList = []
-        donationDocs = self.db.collection_group(u'blooddonations').get()
-        for doc in donationDocs:
-            donationDict = doc.to_dict()
-            donationDict["id"] = doc.id
-            # Retrieve matching blood type
-            donorDoc = doc.reference.parent.parent.get()
-            donationDict["bloodType"] = donorDoc.get("bloodType")
-            # Retrieve matching branch name
-            branchDoc = self.branches_ref.document(
-                donationDict['branchId']).get()
-            donationDict["branchName"] = branchDoc.get("name")
-            # Retrieve matching branch username
-            userDoc = self.users_ref.where(
-                'id', '==', int(donationDict["recordedBy"])).get()
-            donationDict["staffUsername"] = userDoc[0].get("username")
-            donationList.append(BloodDonation.fromDict(donationDict))
-            donationList.sort(key=lambda d: d.date, reverse=True)
-        return donationList
-
-    def getDonationsIdsByRequestId(self, id):
+    def _getUsernames(self, userIds):
+        '''Query usernames by user id, IN_QUERY_LIMIT ids per query
+        Returns: dict { userId: username }
+        '''
+        userIds = sorted(userIds)
+        usernames = {}
+        for i in range(0, len(userIds), IN_QUERY_LIMIT):
+            userDocs = self.users_ref.where('id', 'in', userIds[i:i + IN_QUERY_LIMIT]).get()
+            for doc in userDocs:
+                usernames[doc.get("id")] = doc.get("username")
+        return usernames
+
+    def getDonationsIdsByRequestId(self, id, includeArchive=False):
         '''Query all blood donation ids used to fulfill the request with given id.'''
-        donationList = []
-        donationDocs = self.db.collection_group(u'blooddonations').get()
-        for doc in donationDocs:
-            donationDict = doc.to_dict()
-            donationDict["id"] = doc.id
-            if donationList["id"] == id:
-                donationList.append(donationList["id"])
-        return donationList
-
-    def getAvailableDonationsByBloodType(self, bloodType: str):
-        '''Query donation records not yet used for request fulfillment by blood type'''
-        donationList = []
-        donationDocs = self.db.collection_group(
-            u'blooddonations').where('usedBy', '==', None).get()
-        for doc in donationDocs:
-            donationDict = doc.to_dict()
-            donationDict["id"] = doc.id
-            branchDoc = self.branches_ref.document(
-                donationDict['branchId']).get()
-            branchDict = branchDoc.to_dict()
-            donationDict["branchName"] = branchDict["name"]
-            # Retrieve matching branch username
-            userDoc = self.users_ref.where(
-                'id', '==', int(donationDict["recordedBy"])).get()
-            donationDict["staffUsername"] = userDoc[0].to_dict()["username"]
-            # filter by bloodtype
-            parentRef = doc.reference.parent.parent.get()
-            parentDict = parentRef.to_dict()
-            if parentDict['bloodType'] == bloodType:
-                donationList.append(BloodDonation.fromDict(donationDict))
-        return donationList
-
-    def insertDonation(self, donation: BloodDonation):
-        donation.date = datetime.utcnow()  # Firestore assumes datetime in UTC
-        # Get donor id
+        return [doc.id for ref in self._donationCollections(includeArchive)
+                for doc in ref.where('usedBy', '==', str(id)).get()]
+
+    def getAvailableDonations(self, bloodTypes=None):
+        '''Query donation records not yet used for request fulfillment, oldest first, with their blood type.
+        bloodTypes: only return donations of these blood types (default all)
+        '''
+        query = self.donations_ref.where('usedBy', '==', None)
+        if bloodTypes is not None:
+            query = query.where('bloodType', 'in', list(bloodTypes))
+        return [self._toDonation(doc) for doc in query.order_by('date').get()]
+
+    def insertDonation(self, donation: BloodDonation, idempotencyKey=None):
+        donation.date = self._toUTC(donation.date)
+        quantity = int(donation.quantity) # Form values arrive as strings; stored as a number, like bulk imports
+        # Get donor blood type
         donorDocs = self.donors_ref.where('nric', '==', donation.nric).get()
+        bloodType = donorDocs[0].get('bloodType')
         # Insert donation
         data = {
             'nric': donation.nric,
             'branchId': donation.branchId,
             'date': donation.date,
-            'quantity': donation.quantity,
+            'quantity': quantity,
             'recordedBy': donation.recordedBy,
-            'usedBy': None}
-        self.donors_ref.document(donorDocs[0].id).collection(
-            'blooddonations').add(data)
-
-    def getAllRequests(self):
-        '''Query list of all blood requests'''
+            'usedBy': None,
+            'bloodType': bloodType,
+            'branchName': self._getBranchNames({str(donation.branchId)}).get(str(donation.branchId)),
+            'staffUsername': self._getUsernames({int(donation.recordedBy)}).get(int(donation.recordedBy))
+                if donation.recordedBy is not None else None}
+        # Insert donation and update the inventory and weekly counters atomically
+        # A replayed write creates the same document again, which fails the whole batch
+        donationRef = self.donations_ref.document(idempotencyKey)
+        batch = self.db.batch()
+        batch.create(donationRef, data)
+        batch.set(self.inventory_ref.document(str(donation.branchId)), {
+            bloodType: gcloudfirestore.Increment(quantity)}, merge=True)
+        batch.set(self.weeklystats_ref.document(self._weekKey(donation.date)), {
+            'donationCount': gcloudfirestore.Increment(1),
+            'quantity': gcloudfirestore.Increment(quantity)}, merge=True)
+        self._bumpVersions('donation', batch=batch)
+        try:
+            batch.commit()
+        except AlreadyExists:
+            return None
+        return donationRef.id
+
+    def bulkInsertDonations(self, donations, chunkSize=BATCH_LIMIT):
+        '''Insert many donations through a BulkWriter, looking up donors chunkSize donations at a time.
+        donations can be any iterable (e.g. a generator over a CSV file); it is consumed lazily.
+        Unlike MariaDB the import is not atomic: donations written before an error are kept.
+        Returns: number of donations inserted
+        '''
+        donors = {} # { nric: blood type }
+        usernames = {} # { user id: username }
+        branchNames = {branch.id: branch.name for branch in self.getAllBranches()}
+        inventory = Counter() # { (branchId, blood type): unused quantity }
+        weeklyCount = Counter() # { week key: donations }
+        weeklyQty = Counter() # { week key: quantity }
+        count = 0
+        writer = self.db.bulk_writer()
+        donations = iter(donations)
+        try:
+            while True:
+                chunk = list(islice(donations, chunkSize))
+                if not chunk:
+                    break
+                # Look up unseen donors with 'in' queries
+                unknown = sorted({d.nric for d in chunk} - donors.keys())
+                for i in range(0, len(unknown), IN_QUERY_LIMIT):
+                    for doc in self.donors_ref.where('nric', 'in', unknown[i:i + IN_QUERY_LIMIT]).get():
+                        donors[doc.get('nric')] = doc.get('bloodType')
+                usernames.update(self._getUsernames(
+                    {int(d.recordedBy) for d in chunk if d.recordedBy is not None} - usernames.keys()))
+
+                for d in chunk:
+                    if d.nric not in donors:
+                        raise ValueError(f'Unknown donor {d.nric}')
+                    bloodType = donors[d.nric]
+                    quantity = int(d.quantity)
+                    date = self._toUTC(d.date)
+                    writer.create(self.donations_ref.document(), {
+                        'nric': d.nric,
+                        'branchId': str(d.branchId),
+                        'date': date,
+                        'quantity': quantity,
+                        'recordedBy': d.recordedBy,
+                        'usedBy': str(d.usedBy) if d.usedBy is not None else None,
+                        'bloodType': bloodType,
+                        'branchName': branchNames.get(str(d.branchId)),
+                        'staffUsername': usernames.get(int(d.recordedBy)) if d.recordedBy is not None else None})
+                    if d.usedBy is None:
+                        inventory[(str(d.branchId), bloodType)] += quantity
+                    weeklyCount[self._weekKey(date)] += 1
+                    weeklyQty[self._weekKey(date)] += quantity
+                    count += 1
+        finally:
+            # Update the materialized inventory and weekly counters once per group, not per donation,
+            # including for the donations already written if the import failed part way
+            for (branchId, bloodType), quantity in inventory.items():
+                writer.set(self.inventory_ref.document(branchId), {
+                    bloodType: gcloudfirestore.Increment(quantity)}, merge=True)
+            for week in weeklyCount:
+                writer.set(self.weeklystats_ref.document(week), {
+                    'donationCount': gcloudfirestore.Increment(weeklyCount[week]),
+                    'quantity': gcloudfirestore.Increment(weeklyQty[week])}, merge=True)
+            self._bumpVersions('donation', batch=writer)
+            writer.close()
+        return count
+
+    def getRequestsPage(self, after=None, pageSize=PAGE_SIZE, serialized=False):
+        '''Query one page of blood requests ordered by document id, starting after the given cursor
+        Returns: (list of BloodRequest, next page cursor or None)
+        '''
+        query = self.bloodrequest_ref.order_by(gcloudfirestore.FieldPath.document_id())
+        if after:
+            query = query.start_after({gcloudfirestore.FieldPath.document_id(): after})
         bloodRequestList = []
-        bloodRequestDocs = self.bloodrequest_ref.stream()
-        for doc in bloodRequestDocs:
+        for doc in query.limit(pageSize + 1).stream():
             bloodRequestDict = doc.to_dict()
             bloodRequestDict["id"] = doc.id
             # Convert date string to datetime
@@ -182,159 +393,297 @@ class FirebaseBackend:
             # Retrieve matching requester username
             bloodRequestDict["requester"] = userDoc.get('username')
             bloodRequestList.append(BloodRequest.fromDict(bloodRequestDict))
+        after = None
+        if len(bloodRequestList) > pageSize:
+            bloodRequestList = bloodRequestList[:pageSize]
+            after = bloodRequestList[-1].id
+        return self._page(bloodRequestList, after, serialized)
+
+    def getPendingRequests(self):
+        '''Query blood requests that are not fulfilled yet, oldest first'''
+        bloodRequestList = []
+        for doc in self.bloodrequest_ref.where('fulfilled', '==', 0).stream():
+            bloodRequestDict = doc.to_dict()
+            bloodRequestDict["id"] = doc.id
+            bloodRequestDict["date"] = datetime.fromisoformat(bloodRequestDict["date"])
+            bloodRequestList.append(BloodRequest.fromDict(bloodRequestDict))
+        bloodRequestList.sort(key=lambda req: (req.date, req.id))
         return bloodRequestList
 
     def getRequestById(self, id):
         '''Query blood requests by request id'''
-        bloodRequestDocs = self.bloodrequest_ref.stream()
-        for doc in bloodRequestDocs:
-            bloodRequestDict = doc.to_dict()
-            bloodRequestDict["id"] = doc.id
-            if bloodRequestDict["id"] == id:
-                # Convert date string to datetime
-                bloodRequestDict["date"] = datetime.fromisoformat(
-                    bloodRequestDict["date"])
-                # Retrieve matching branch username
-                userDoc = self.users_ref.document(
-                    str(bloodRequestDict["requesterId"])).get()
-                userDict = userDoc.to_dict()
-                bloodRequestDict["requester"] = userDict["username"]
-                return BloodRequest.fromDict(bloodRequestDict)
+        doc = self.bloodrequest_ref.document(str(id)).get()
+        if not doc.exists:
+            return None
+        bloodRequestDict = doc.to_dict()
+        bloodRequestDict["id"] = doc.id
+        # Convert date string to datetime
+        bloodRequestDict["date"] = datetime.fromisoformat(
+            bloodRequestDict["date"])
+        # Retrieve matching branch username
+        userDoc = self.users_ref.document(
+            str(bloodRequestDict["requesterId"])).get()
+        userDict = userDoc.to_dict()
+        bloodRequestDict["requester"] = userDict["username"]
+        return BloodRequest.fromDict(bloodRequestDict)
 
     def insertRequest(self, req: BloodRequest):
         data = {
             'address': req.address,
             'bloodType': req.bloodType,
             'date': str(req.date),
-            'fufilled': req.fulfilled,
+            'fulfilled': req.fulfilled,
             'quantity': req.quantity,
             'requesterId': req.requesterId,
             'status': req.status}
-        self.bloodrequest_ref.add(data)
+        _, requestRef = self.bloodrequest_ref.add(data)
+        self._bumpVersions('request')
+        return requestRef.id
 
     def fulfillRequest(self, requestId: str, donationIds: list[str]):
-        '''Mark blood request as fulfilled using one or more blood donations'''
-        donationDocs = self.db.collection_group(u'blooddonations').get()
-        for doc in donationDocs:
-            donationDict = doc.to_dict()
-            donationDict["id"] = doc.id
-            for ids in donationIds:
-                if donationDict["id"] == ids:
-                    parentRef = doc.reference.parent.parent.get()
-                    parentDict = parentRef.to_dict()
-                    parentDict['id'] = parentRef.id
-                    self.donors_ref.document(parentDict['id']).collection(
-                        'blooddonations').document(donationDict['id']).update({'usedBy': requestId})
-
-        self.bloodrequest_ref.document(requestId).update(
-            {'status': 'Delivered', 'fulfilled': 1})
+        '''Mark blood request as fulfilled using one or more blood donations.
+        All updates are applied in one transaction; raises FulfillmentConflictError
+        if the request or a donation does not exist or is already used.
+        '''
+        try:
+            donationRefs = [self._donationRef(id) for id in donationIds]
+        except ValueError:
+            raise FulfillmentConflictError('Invalid donation id', donationIds)
+        requestRef = self.bloodrequest_ref.document(str(requestId))
+
+        @gcloudfirestore.transactional
+        def fulfill(transaction):
+            donationDocs = list(self.db.get_all(donationRefs, transaction=transaction))
+            conflicts = [doc.id for doc in donationDocs
+                         if not doc.exists or doc.get('usedBy') is not None]
+            if conflicts:
+                raise FulfillmentConflictError('Donations are missing or already used', conflicts)
+            requestDoc = requestRef.get(transaction=transaction)
+            if not requestDoc.exists:
+                raise FulfillmentConflictError(f'Blood request {requestId} does not exist')
+            if (requestDoc.to_dict() or {}).get('fulfilled'):
+                raise FulfillmentConflictError(f'Blood request {requestId} is already fulfilled')
+
+            # Reads are done, apply every write at once
+            for doc in donationDocs:
+                transaction.update(doc.reference, {'usedBy': str(requestId)})
+                transaction.set(self.inventory_ref.document(str(doc.get('branchId'))), {
+                    doc.get('bloodType'): gcloudfirestore.Increment(-int(doc.get('quantity')))}, merge=True)
+            transaction.update(requestRef, {'status': 'Delivered', 'fulfilled': 1})
+            self._bumpVersions('donation', 'request', batch=transaction)
+
+        fulfill(self.db.transaction())
 
     def getAllBranches(self):
-        branchDocs = self.branches_ref.get()
-        branches = []
-        for doc in branchDocs:
-            data = doc.to_dict()
-            data['id'] = doc.id
-            branches.append(Branch.fromDict(data))
-        return branches
-
-    def getDashboardStats(self, branchId):
-        '''Query data to show on the dashboard
-        Returns: DashboardData(donor count, available blood, pending requests, donations, blood inventory)
+        '''Query list of all blood bank branches (cached)'''
+        def load():
+            branchDocs = self.branches_ref.get()
+            branches = []
+            for doc in branchDocs:
+                data = doc.to_dict()
+                data['id'] = doc.id
+                branches.append(Branch.fromDict(data))
+            return branches
+        return self.refCache.get('branches', load)
+
+    def getAnalyticsRows(self, includeArchive=False):
+        '''Query (date, quantity, branchId, blood type, usedBy) of every donation, for analytics.
+        Dates are naive UTC datetimes.
+        '''
+        rows = []
+        for doc in (doc for ref in self._donationCollections(includeArchive)
+                    for doc in ref.select(['date', 'quantity', 'branchId', 'bloodType', 'usedBy']).get()):
+            donationDict = doc.to_dict()
+            rows.append((
+                donationDict['date'].astimezone(timezone.utc).replace(tzinfo=None),
+                int(donationDict['quantity']),
+                donationDict['branchId'],
+                donationDict.get('bloodType'),
+                donationDict.get('usedBy')))
+        return rows
+
+    def getDashboardCounts(self):
+        '''Query the dashboard figures that do not depend on the branch
+        Returns: (donor count, available blood, pending requests, donations this week, quantity donated this week)
         '''
         donorDocs = self.donors_ref.get()
-        availableBlood = 0
         pendingRequestDocs = self.bloodrequest_ref.where(
             'fulfilled', '==', 0).get()
-        donationsThisWeek = 0
-        bloodQtyThisWeek = 0
-
-        donationDocs = self.db.collection_group(u'blooddonations').get()
-        for doc in donationDocs:
-            bloodQty = int(doc.get("quantity"))
-            availableBlood += bloodQty  # Calculate total blood available
-            date = doc.get("date").astimezone(timezone.utc)
-            dateIso = date.isocalendar()
-            today = datetime.today()
-            todayIso = today.isocalendar()
-            if dateIso.week == todayIso.week and date.year == today.year:
-                # The date is in the current week
-                donationsThisWeek += 1
-                bloodQtyThisWeek += bloodQty
-
-        inventory = self.getBloodInventoryByBranchId(branchId)
-        res = DashboardData(len(donorDocs), availableBlood, len(
-            pendingRequestDocs), donationsThisWeek, bloodQtyThisWeek, inventory.storage)
-        return res
+
+        # Total blood available over all branches
+        availableBlood = 0
+        for doc in self.inventory_ref.get():
+            availableBlood += sum(doc.to_dict().values())
+
+        weekDoc = self.weeklystats_ref.document(self._weekKey(datetime.utcnow())).get()
+        weekDict = weekDoc.to_dict() if weekDoc.exists else {}
+        donationsThisWeek = weekDict.get('donationCount', 0)
+        bloodQtyThisWeek = weekDict.get('quantity', 0)
+
+        return len(donorDocs), availableBlood, len(pendingRequestDocs), donationsThisWeek, bloodQtyThisWeek
 
     def getBloodInventoryByBranchId(self, branchId):
         '''Query blood inventory data
         Returns: BloodInventory
         '''
-        APtotalQuantity = 0
-        AMtotalQuantity = 0
-        BPtotalQuantity = 0
-        BMtotalQuantity = 0
-        ABPtotalQuantity = 0
-        ABMtotalQuantity = 0
-        OPtotalQuantity = 0
-        OMtotalQuantity = 0
-
-        APbloodQuantityList = []
-        AMbloodQuantityList = []
-        BPbloodQuantityList = []
-        BMbloodQuantityList = []
-        ABPbloodQuantityList = []
-        ABMbloodQuantityList = []
-        OPbloodQuantityList = []
-        OMbloodQuantityList = []
-
-        donationDocs = self.db.collection_group(u'blooddonations').where(
-            'branchId', '==', str(branchId)).get()
-        for doc in donationDocs:
-            donationDict = doc.to_dict()
-            parentRef = doc.reference.parent.parent.get()
-            parentDict = parentRef.to_dict()
-            if parentDict['bloodType'] == 'A+':
-                APbloodQuantity = int(donationDict["quantity"])
-                APbloodQuantityList.append(APbloodQuantity)
-                APtotalQuantity = sum(APbloodQuantityList)
-            elif parentDict['bloodType'] == 'A-':
-                AMbloodQuantity = int(donationDict["quantity"])
-                AMbloodQuantityList.append(AMbloodQuantity)
-                AMtotalQuantity = sum(AMbloodQuantityList)
-            elif parentDict['bloodType'] == 'B+':
-                BPbloodQuantity = int(donationDict["quantity"])
-                BPbloodQuantityList.append(BPbloodQuantity)
-                BPtotalQuantity = sum(BPbloodQuantityList)
-            elif parentDict['bloodType'] == 'B-':
-                BMbloodQuantity = int(donationDict["quantity"])
-                BMbloodQuantityList.append(BMbloodQuantity)
-                BMtotalQuantity = sum(BMbloodQuantityList)
-            elif parentDict['bloodType'] == 'AB+':
-                ABPbloodQuantity = int(donationDict["quantity"])
-                ABPbloodQuantityList.append(ABPbloodQuantity)
-                ABPtotalQuantity = sum(ABPbloodQuantityList)
-            elif parentDict['bloodType'] == 'AB-':
-                ABMbloodQuantity = int(donationDict["quantity"])
-                ABMbloodQuantityList.append(ABMbloodQuantity)
-                ABMtotalQuantity = sum(ABMbloodQuantityList)
-            elif parentDict['bloodType'] == 'O+':
-                OPbloodQuantity = int(donationDict["quantity"])
-                OPbloodQuantityList.append(OPbloodQuantity)
-                OPtotalQuantity = sum(OPbloodQuantityList)
-            elif parentDict['bloodType'] == 'O-':
-                OMbloodQuantity = int(donationDict["quantity"])
-                OMbloodQuantityList.append(OMbloodQuantity)
-                OMtotalQuantity = sum(OMbloodQuantityList)
-
         inventory = BloodInventory(branchId)
-        inventory.storage['A+'] = APtotalQuantity
-        inventory.storage['A-'] = AMtotalQuantity
-        inventory.storage['B+'] = BPtotalQuantity
-        inventory.storage['B-'] = BMtotalQuantity
-        inventory.storage['AB+'] = ABPtotalQuantity
-        inventory.storage['AB-'] = ABMtotalQuantity
-        inventory.storage['O+'] = OPtotalQuantity
-        inventory.storage['O-'] = OMtotalQuantity
+        inventoryDoc = self.inventory_ref.document(str(branchId)).get()
+        if inventoryDoc.exists:
+            inventory.storage.update(inventoryDoc.to_dict())
         return inventory
+
+    def rebuildInventory(self):
+        '''Recompute the materialized inventory and weekly counters from the donation documents'''
+        inventories: dict[str, BloodInventory] = {}
+        weeklyStats: dict[str, dict] = {}
+
+        # Archived donations are all used, so they only count in the weekly counters
+        for doc in (doc for ref in self._donationCollections(True)
+                    for doc in ref.select(['date', 'quantity', 'branchId', 'bloodType', 'usedBy']).get()):
+            donationDict = doc.to_dict()
+            quantity = int(donationDict['quantity'])
+            week = weeklyStats.setdefault(
+                self._weekKey(donationDict['date']), {'donationCount': 0, 'quantity': 0})
+            week['donationCount'] += 1
+            week['quantity'] += quantity
+            bloodType = donationDict.get('bloodType')
+            if donationDict.get('usedBy') is None and bloodType is not None:
+                branchId = str(donationDict['branchId'])
+                if branchId not in inventories:
+                    inventories[branchId] = BloodInventory(branchId)
+                inventories[branchId].storage[bloodType] += quantity
+
+        # Delete stale documents, then overwrite the rest
+        writes = [(doc, None) for doc in self.inventory_ref.list_documents() if doc.id not in inventories]
+        writes += [(doc, None) for doc in self.weeklystats_ref.list_documents() if doc.id not in weeklyStats]
+        writes += [(self.inventory_ref.document(branchId), inventory.storage) for branchId, inventory in inventories.items()]
+        writes += [(self.weeklystats_ref.document(weekKey), stats) for weekKey, stats in weeklyStats.items()]
+        self._writeInBatches(writes)
+
+    def archiveDonations(self, before: datetime, batchSize=BATCH_LIMIT // 2):
+        '''Move donations used by a request and dated before the given time to the donations_archive collection,
+        batchSize donations per batch. Archived donations keep their document id.
+        Returns: number of donations archived
+        '''
+        count = 0
+        last = None
+        # Firestore allows a range filter on one field only, so the used check is done here
+        query = self.donations_ref.where('date', '<', before).order_by('date')
+        while True:
+            donationDocs = (query.start_after(last) if last else query).limit(batchSize).get()
+            if not donationDocs:
+                return count
+            writes = []
+            for doc in donationDocs:
+                if doc.get('usedBy') is not None:
+                    writes.append((self.donations_archive_ref.document(doc.id), doc.to_dict()))
+                    writes.append((doc.reference, None))
+            # Both writes of a donation fit in one batch, so a donation is never deleted without its copy
+            self._writeInBatches(writes)
+            if writes:
+                self._bumpVersions('donation')
+            count += len(writes) // 2
+            last = donationDocs[-1]
+
+    def _bumpVersions(self, *names, batch=None):
+        '''Increment the versions of the given DATA_VERSIONS collections, as part of a batch,
+        transaction or bulk writer if given, or else in a batch of their own
+        '''
+        writer = batch if batch is not None else self.db.batch()
+        for name in names:
+            writer.set(self.versions_ref.document(name), {
+                'version': gcloudfirestore.Increment(1),
+                'updatedAt': gcloudfirestore.SERVER_TIMESTAMP}, merge=True)
+        if batch is None:
+            writer.commit()
+
+    def getDataVersion(self, name):
+        '''Query the version of one of the DATA_VERSIONS collections, incremented by every write to it
+        Returns: (version, naive UTC datetime of the last write or None)
+        '''
+        versionDoc = self.versions_ref.document(name).get()
+        if not versionDoc.exists:
+            return 0, None
+        versionDict = versionDoc.to_dict()
+        return versionDict.get('version', 0), versionDict['updatedAt'].astimezone(timezone.utc).replace(tzinfo=None)
+
+    def _writeInBatches(self, writes, merge=False):
+        '''Commit (document ref, data) writes in batches of BATCH_LIMIT. Documents with data None are deleted.'''
+        for i in range(0, len(writes), BATCH_LIMIT):
+            batch = self.db.batch()
+            for ref, data in writes[i:i + BATCH_LIMIT]:
+                if data is None:
+                    batch.delete(ref)
+                else:
+                    batch.set(ref, data, merge=merge)
+            batch.commit()
+
+    def importDocuments(self, batches):
+        '''Store documents given as batches of (document path, data), at most BATCH_LIMIT per batch, one batch per commit
+        Returns: number of documents written
+        '''
+        count = 0
+        for writes in batches:
+            self._writeInBatches([(self.db.document(path), data) for path, data in writes])
+            # Invalidate the cached /query responses of the collections written to
+            names = {VERSIONED_COLLECTIONS.get(path.split('/', 1)[0]) for path, _ in writes} - {None}
+            if names:
+                self._bumpVersions(*sorted(names))
+            count += len(writes)
+        return count
+
+    def migrateDonations(self, deleteLegacy=False, batchSize=BATCH_LIMIT // 2):
+        '''Copy the donations of the legacy schema (donors/{id}/blooddonations subcollections) to the top-level
+        donations collection, embedding their blood type, branch name and staff username.
+        Donations keep their document id, so the migration can be run again after an interruption.
+        deleteLegacy: also delete the copied subcollection documents
+        Returns: number of donations copied
+        '''
+        count = 0
+        last = None
+        query = self.db.collection_group(u'blooddonations').order_by(gcloudfirestore.FieldPath.document_id())
+        while True:
+            donationDocs = (query.start_after(last) if last else query).limit(batchSize).get()
+            if not donationDocs:
+                return count
+            # One batched read of the referenced donors and users per batch of donations
+            bloodTypes = self._getBloodTypes(doc.reference.parent.parent for doc in donationDocs)
+            branchNames = self._getBranchNames({str(doc.get('branchId')) for doc in donationDocs})
+            usernames = self._getUsernames(
+                {int(doc.get('recordedBy')) for doc in donationDocs if doc.get('recordedBy') is not None})
+            writes = []
+            for doc in donationDocs:
+                data = doc.to_dict()
+                data['bloodType'] = bloodTypes.get(doc.reference.parent.parent.path)
+                data['branchName'] = branchNames.get(str(data['branchId']))
+                data['staffUsername'] = usernames.get(int(data['recordedBy'])) if data.get('recordedBy') is not None else None
+                writes.append((self.donations_ref.document(doc.id), data))
+                if deleteLegacy:
+                    writes.append((doc.reference, None))
+            # Both writes of a donation fit in one batch, so a donation is never deleted without its copy
+            self._writeInBatches(writes)
+            self._bumpVersions('donation')
+            count += len(donationDocs)
+            last = donationDocs[-1]
+
+    def repairRequestFlags(self):
+        '''Rename the 'fufilled' field written by older versions of insertRequest to 'fulfilled',
+        so that those requests are found by the pending request queries again
+        Returns: number of requests repaired
+        '''
+        count = 0
+        # Only documents that have the field are ordered by it, and repaired documents drop out of the query
+        query = self.bloodrequest_ref.order_by('fufilled').limit(BATCH_LIMIT - 1) # One write is left for the version
+        while True:
+            requestDocs = query.get()
+            if not requestDocs:
+                return count
+            batch = self.db.batch()
+            for doc in requestDocs:
+                data = doc.to_dict()
+                batch.update(doc.reference, {
+                    'fulfilled': data.get('fulfilled', data['fufilled']),
+                    'fufilled': gcloudfirestore.DELETE_FIELD})
+            self._bumpVersions('request', batch=batch)
+            batch.commit()
+            count += len(requestDocs)
@@ -141,6 +141,7 @@ CREATE TABLE IF NOT EXISTS `bloodmanagementsystem`.`BloodDonation` (
   `branchId` INT UNSIGNED NOT NULL,
   `recordedBy` INT UNSIGNED NULL,
   `usedBy` INT UNSIGNED NULL,
+  `bloodTypeId` INT UNSIGNED NOT NULL,
   PRIMARY KEY (`id`),
   CONSTRAINT `FK_BloodDonation_Donor_nric`
     FOREIGN KEY (`nric`)
@@ -161,6 +162,11 @@ CREATE TABLE IF NOT EXISTS `bloodmanagementsystem`.`BloodDonation` (
     FOREIGN KEY (`usedBy`)
     REFERENCES `bloodmanagementsystem`.`BloodRequest` (`id`)
     ON DELETE RESTRICT
+    ON UPDATE CASCADE,
+  CONSTRAINT `FK_BloodDonation_BloodType_id`
+    FOREIGN KEY (`bloodTypeId`)
+    REFERENCES `bloodmanagementsystem`.`BloodType` (`id`)
+    ON DELETE RESTRICT
     ON UPDATE CASCADE)
 ENGINE = InnoDB;
 
@@ -170,9 +176,107 @@ CREATE INDEX `IDX_BloodDonation_branchId` ON `bloodmanagementsystem`.`BloodDonat
 
 CREATE INDEX `IDX_BloodDonation_recordedBy` ON `bloodmanagementsystem`.`BloodDonation` (`recordedBy` ASC) VISIBLE;
 
-CREATE INDEX `IDX_BloodDonation_usedBy` ON `bloodmanagementsystem`.`BloodDonation` (`usedBy` ASC) VISIBLE;
+-- Available units (usedBy IS NULL) by blood type and branch, oldest first; also serves the usedBy foreign key
+CREATE INDEX `IDX_BloodDonation_available` ON `bloodmanagementsystem`.`BloodDonation` (`usedBy` ASC, `bloodTypeId` ASC, `branchId` ASC, `date` ASC) VISIBLE;
+
+-- Matches the ORDER BY of the paged donation listing, so pages are read in index order without sorting
+CREATE INDEX `IDX_BloodDonation_date_id` ON `bloodmanagementsystem`.`BloodDonation` (`date` DESC, `id` ASC) VISIBLE;
 
-CREATE INDEX `IDX_BloodDonation_date` ON `bloodmanagementsystem`.`BloodDonation` (`date` DESC) VISIBLE;
+
+-- -----------------------------------------------------
+-- Table `bloodmanagementsystem`.`BloodDonationArchive`
+-- Donations used by a request and older than the retention window, moved out of BloodDonation
+-- by `python manage.py archive-donations`. Same columns as BloodDonation, partitioned by year
+-- so that queries on a date range only read the matching partitions and old years can be dropped
+-- with ALTER TABLE ... DROP PARTITION. Partitioned InnoDB tables cannot have foreign keys, so the
+-- application keeps the rows consistent (donor updates and deletes also touch the archive).
+-- Add next year's partition by splitting pmax: ALTER TABLE ... REORGANIZE PARTITION pmax INTO (...).
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `bloodmanagementsystem`.`BloodDonationArchive` (
+  `id` INT UNSIGNED NOT NULL,
+  `nric` CHAR(10) NOT NULL,
+  `quantity` INT UNSIGNED NOT NULL,
+  `date` DATETIME NOT NULL,
+  `branchId` INT UNSIGNED NOT NULL,
+  `recordedBy` INT UNSIGNED NULL,
+  `usedBy` INT UNSIGNED NULL,
+  `bloodTypeId` INT UNSIGNED NOT NULL,
+  PRIMARY KEY (`id`, `date`),
+  INDEX `IDX_BloodDonationArchive_nric` (`nric` ASC),
+  INDEX `IDX_BloodDonationArchive_usedBy` (`usedBy` ASC))
+ENGINE = InnoDB
+PARTITION BY RANGE (YEAR(`date`)) (
+  PARTITION p2020 VALUES LESS THAN (2021),
+  PARTITION p2021 VALUES LESS THAN (2022),
+  PARTITION p2022 VALUES LESS THAN (2023),
+  PARTITION p2023 VALUES LESS THAN (2024),
+  PARTITION p2024 VALUES LESS THAN (2025),
+  PARTITION p2025 VALUES LESS THAN (2026),
+  PARTITION p2026 VALUES LESS THAN (2027),
+  PARTITION pmax VALUES LESS THAN MAXVALUE);
+
+
+-- -----------------------------------------------------
+-- Table `bloodmanagementsystem`.`BloodInventory`
+-- Materialized quantity of unused blood per branch and blood type,
+-- maintained by the application on every donation write.
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `bloodmanagementsystem`.`BloodInventory` (
+  `branchId` INT UNSIGNED NOT NULL,
+  `bloodTypeId` INT UNSIGNED NOT NULL,
+  `quantity` INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (`branchId`, `bloodTypeId`),
+  CONSTRAINT `FK_BloodInventory_Branch_id`
+    FOREIGN KEY (`branchId`)
+    REFERENCES `bloodmanagementsystem`.`Branch` (`id`)
+    ON DELETE CASCADE
+    ON UPDATE CASCADE,
+  CONSTRAINT `FK_BloodInventory_BloodType_id`
+    FOREIGN KEY (`bloodTypeId`)
+    REFERENCES `bloodmanagementsystem`.`BloodType` (`id`)
+    ON DELETE CASCADE
+    ON UPDATE CASCADE)
+ENGINE = InnoDB;
+
+
+-- -----------------------------------------------------
+-- Table `bloodmanagementsystem`.`DonationWeeklyStat`
+-- Number and total quantity of donations per week (starting Monday).
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `bloodmanagementsystem`.`DonationWeeklyStat` (
+  `weekStart` DATE NOT NULL,
+  `donationCount` INT NOT NULL DEFAULT 0,
+  `quantity` INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (`weekStart`))
+ENGINE = InnoDB;
+
+
+-- -----------------------------------------------------
+-- Table `bloodmanagementsystem`.`AppliedWrite`
+-- Idempotency keys of writes replayed from a branch write queue,
+-- inserted in the same transaction as the write so a replay is applied only once.
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `bloodmanagementsystem`.`AppliedWrite` (
+  `idempotencyKey` CHAR(36) NOT NULL,
+  `appliedAt` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`idempotencyKey`))
+ENGINE = InnoDB;
+
+
+-- -----------------------------------------------------
+-- Table `bloodmanagementsystem`.`DataVersion`
+-- Version of each collection served by /query (donor, donation, request), incremented right
+-- after every write to it commits. Used as the ETag of the /query responses.
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `bloodmanagementsystem`.`DataVersion` (
+  `name` VARCHAR(32) NOT NULL,
+  `version` BIGINT UNSIGNED NOT NULL DEFAULT 0,
+  `updatedAt` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`name`))
+ENGINE = InnoDB;
+
+INSERT IGNORE INTO `bloodmanagementsystem`.`DataVersion` (`name`, `updatedAt`)
+  VALUES ('donor', UTC_TIMESTAMP()), ('donation', UTC_TIMESTAMP()), ('request', UTC_TIMESTAMP());
 
 
 SET SQL_MODE=@OLD_SQL_MODE;
@@ -273,22 +377,48 @@ COMMIT;
 -- -----------------------------------------------------
 START TRANSACTION;
 USE `bloodmanagementsystem`;
-INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES (1, 'S9990000A', 350, '2022-01-01', 10001, 1, NULL);
-INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES (2, 'S9991111A', 450, '2022-01-01', 10001, 1, NULL);
-INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES (3, 'T0000000B', 300, '2022-01-01', 10002, 2, NULL);
-INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES (4, 'T0001111B', 350, '2022-03-20', 10002, 2, NULL);
-INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES (5, 'S8880000C', 420, '2022-05-01', 10003, 3, NULL);
-INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES (6, 'S8881111C', 320, '2022-05-02', 10003, 3, NULL);
-INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES (7, 'S7770000D', 450, '2022-05-03', 10004, 4, NULL);
-INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES (8, 'S7771111D', 400, '2022-06-30', 10004, 4, NULL);
-INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES (9, 'S9990000A', 200, '2022-06-30', 10001, 1, NULL);
-INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES (10, 'S9990000A', 150, '2022-08-10', 10001, 1, NULL);
-INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES (11, 'S9991111A', 350, '2022-08-10', 10001, 1, NULL);
-INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES (12, 'S9991111A', 400, '2022-08-10', 10001, 1, NULL);
-INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES (13, 'S7770000D', 380, '2022-10-05', 10001, 1, NULL);
-INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES (14, 'S7770000D', 420, '2022-10-10', 10001, 1, NULL);
-INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES (15, 'S7771111D', 280, '2022-11-22', 10001, 1, NULL);
-INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`) VALUES (16, 'S7771111D', 300, '2022-11-25', 10001, 1, NULL);
+INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`, `bloodTypeId`) VALUES (1, 'S9990000A', 350, '2022-01-01', 10001, 1, NULL, 1);
+INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`, `bloodTypeId`) VALUES (2, 'S9991111A', 450, '2022-01-01', 10001, 1, NULL, 2);
+INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`, `bloodTypeId`) VALUES (3, 'T0000000B', 300, '2022-01-01', 10002, 2, NULL, 3);
+INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`, `bloodTypeId`) VALUES (4, 'T0001111B', 350, '2022-03-20', 10002, 2, NULL, 4);
+INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`, `bloodTypeId`) VALUES (5, 'S8880000C', 420, '2022-05-01', 10003, 3, NULL, 5);
+INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`, `bloodTypeId`) VALUES (6, 'S8881111C', 320, '2022-05-02', 10003, 3, NULL, 6);
+INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`, `bloodTypeId`) VALUES (7, 'S7770000D', 450, '2022-05-03', 10004, 4, NULL, 7);
+INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`, `bloodTypeId`) VALUES (8, 'S7771111D', 400, '2022-06-30', 10004, 4, NULL, 8);
+INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`, `bloodTypeId`) VALUES (9, 'S9990000A', 200, '2022-06-30', 10001, 1, NULL, 1);
+INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`, `bloodTypeId`) VALUES (10, 'S9990000A', 150, '2022-08-10', 10001, 1, NULL, 1);
+INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`, `bloodTypeId`) VALUES (11, 'S9991111A', 350, '2022-08-10', 10001, 1, NULL, 2);
+INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`, `bloodTypeId`) VALUES (12, 'S9991111A', 400, '2022-08-10', 10001, 1, NULL, 2);
+INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`, `bloodTypeId`) VALUES (13, 'S7770000D', 380, '2022-10-05', 10001, 1, NULL, 7);
+INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`, `bloodTypeId`) VALUES (14, 'S7770000D', 420, '2022-10-10', 10001, 1, NULL, 7);
+INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`, `bloodTypeId`) VALUES (15, 'S7771111D', 280, '2022-11-22', 10001, 1, NULL, 8);
+INSERT INTO `bloodmanagementsystem`.`BloodDonation` (`id`, `nric`, `quantity`, `date`, `branchId`, `recordedBy`, `usedBy`, `bloodTypeId`) VALUES (16, 'S7771111D', 300, '2022-11-25', 10001, 1, NULL, 8);
 
 COMMIT;
 
+
+-- -----------------------------------------------------
+-- Data for table `bloodmanagementsystem`.`BloodInventory`
+-- -----------------------------------------------------
+START TRANSACTION;
+USE `bloodmanagementsystem`;
+INSERT INTO `bloodmanagementsystem`.`BloodInventory` (`branchId`, `bloodTypeId`, `quantity`)
+  SELECT bd.branchId, d.bloodTypeId, SUM(bd.quantity) FROM `bloodmanagementsystem`.`BloodDonation` bd
+  INNER JOIN `bloodmanagementsystem`.`Donor` d ON bd.nric=d.nric
+  WHERE bd.usedBy IS NULL
+  GROUP BY bd.branchId, d.bloodTypeId;
+
+COMMIT;
+
+
+-- -----------------------------------------------------
+-- Data for table `bloodmanagementsystem`.`DonationWeeklyStat`
+-- -----------------------------------------------------
+START TRANSACTION;
+USE `bloodmanagementsystem`;
+INSERT INTO `bloodmanagementsystem`.`DonationWeeklyStat` (`weekStart`, `donationCount`, `quantity`)
+  SELECT DATE(bd.date) - INTERVAL WEEKDAY(bd.date) DAY AS weekStart, COUNT(bd.id), SUM(bd.quantity)
+  FROM `bloodmanagementsystem`.`BloodDonation` bd
+  GROUP BY weekStart;
+
+COMMIT;
@@ -0,0 +1,246 @@
+-- SQLite version of the schema in generate_database.sql, used by the embedded backend (database/sqlite.py).
+-- The sample data is loaded from the INSERT statements of generate_database.sql when the database file is created.
+
+-- -----------------------------------------------------
+-- Table `BloodType`
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `BloodType` (
+  `id` INTEGER NOT NULL,
+  `type` VARCHAR(3) NOT NULL,
+  PRIMARY KEY (`id`));
+
+
+-- -----------------------------------------------------
+-- Table `Donor`
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `Donor` (
+  `nric` CHAR(10) NOT NULL,
+  `name` VARCHAR(50) NOT NULL,
+  `dateOfBirth` DATE NOT NULL,
+  `contactNo` VARCHAR(20) NOT NULL,
+  `bloodTypeId` INTEGER NOT NULL,
+  `registrationDate` DATETIME NOT NULL,
+  PRIMARY KEY (`nric`),
+  CONSTRAINT `fk_Donor_BloodType_id`
+    FOREIGN KEY (`bloodTypeId`)
+    REFERENCES `BloodType` (`id`)
+    ON DELETE RESTRICT
+    ON UPDATE CASCADE);
+
+CREATE INDEX IF NOT EXISTS `IDX_Donor_bloodTypeId` ON `Donor` (`bloodTypeId` ASC);
+
+
+-- -----------------------------------------------------
+-- Table `Branch`
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `Branch` (
+  `id` INTEGER NOT NULL,
+  `name` VARCHAR(100) NOT NULL,
+  `address` VARCHAR(200) NOT NULL,
+  `postalCode` CHAR(6) NOT NULL,
+  PRIMARY KEY (`id`));
+
+
+-- -----------------------------------------------------
+-- Table `Role`
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `Role` (
+  `id` INTEGER NOT NULL,
+  `name` VARCHAR(50) NOT NULL,
+  PRIMARY KEY (`id`));
+
+
+-- -----------------------------------------------------
+-- Table `User`
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `User` (
+  `id` INTEGER NOT NULL,
+  `username` VARCHAR(50) NOT NULL,
+  `password` VARCHAR(64) NOT NULL,
+  `name` VARCHAR(50) NOT NULL,
+  `branchId` INTEGER NULL,
+  `roleId` INTEGER NOT NULL,
+  PRIMARY KEY (`id`),
+  CONSTRAINT `FK_User_Branch_id`
+    FOREIGN KEY (`branchId`)
+    REFERENCES `Branch` (`id`)
+    ON DELETE RESTRICT
+    ON UPDATE CASCADE,
+  CONSTRAINT `FK_User_Role_id`
+    FOREIGN KEY (`roleId`)
+    REFERENCES `Role` (`id`)
+    ON DELETE RESTRICT
+    ON UPDATE CASCADE);
+
+CREATE INDEX IF NOT EXISTS `IDX_User_branchId` ON `User` (`branchId` ASC);
+
+CREATE INDEX IF NOT EXISTS `IDX_User_roleId` ON `User` (`roleId` ASC);
+
+CREATE INDEX IF NOT EXISTS `IDX_User_username_password` ON `User` (`username` ASC, `password` ASC);
+
+
+-- -----------------------------------------------------
+-- Table `BloodRequest`
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `BloodRequest` (
+  `id` INTEGER NOT NULL,
+  `requesterId` INTEGER NOT NULL,
+  `bloodTypeId` INTEGER NOT NULL,
+  `quantity` INT NOT NULL,
+  `date` DATE NOT NULL,
+  `address` VARCHAR(200) NOT NULL,
+  `status` VARCHAR(100) NOT NULL,
+  `fulfilled` TINYINT NOT NULL DEFAULT 0,
+  PRIMARY KEY (`id`),
+  CONSTRAINT `FK_BloodRequest_BloodType_id`
+    FOREIGN KEY (`bloodTypeId`)
+    REFERENCES `BloodType` (`id`)
+    ON DELETE RESTRICT
+    ON UPDATE CASCADE,
+  CONSTRAINT `FK_BloodRequest_User_id`
+    FOREIGN KEY (`requesterId`)
+    REFERENCES `User` (`id`)
+    ON DELETE CASCADE
+    ON UPDATE CASCADE);
+
+CREATE INDEX IF NOT EXISTS `IDX_BloodRequest_bloodTypeId` ON `BloodRequest` (`bloodTypeId` ASC);
+
+CREATE INDEX IF NOT EXISTS `IDX_BloodRequest_requesterId` ON `BloodRequest` (`requesterId` ASC);
+
+CREATE INDEX IF NOT EXISTS `IDX_BloodRequest_fulfilled` ON `BloodRequest` (`fulfilled` ASC);
+
+
+-- -----------------------------------------------------
+-- Table `BloodDonation`
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `BloodDonation` (
+  `id` INTEGER NOT NULL,
+  `nric` CHAR(10) NOT NULL,
+  `quantity` INT NOT NULL,
+  `date` DATETIME NOT NULL,
+  `branchId` INTEGER NOT NULL,
+  `recordedBy` INTEGER NULL,
+  `usedBy` INTEGER NULL,
+  `bloodTypeId` INTEGER NOT NULL,
+  PRIMARY KEY (`id`),
+  CONSTRAINT `FK_BloodDonation_Donor_nric`
+    FOREIGN KEY (`nric`)
+    REFERENCES `Donor` (`nric`)
+    ON DELETE CASCADE
+    ON UPDATE CASCADE,
+  CONSTRAINT `FK_BloodDonation_Branch_id`
+    FOREIGN KEY (`branchId`)
+    REFERENCES `Branch` (`id`)
+    ON DELETE CASCADE
+    ON UPDATE CASCADE,
+  CONSTRAINT `FK_BloodDonation_User_id`
+    FOREIGN KEY (`recordedBy`)
+    REFERENCES `User` (`id`)
+    ON DELETE SET NULL
+    ON UPDATE CASCADE,
+  CONSTRAINT `FK_BloodDonation_BloodRequest_id`
+    FOREIGN KEY (`usedBy`)
+    REFERENCES `BloodRequest` (`id`)
+    ON DELETE RESTRICT
+    ON UPDATE CASCADE,
+  CONSTRAINT `FK_BloodDonation_BloodType_id`
+    FOREIGN KEY (`bloodTypeId`)
+    REFERENCES `BloodType` (`id`)
+    ON DELETE RESTRICT
+    ON UPDATE CASCADE);
+
+CREATE INDEX IF NOT EXISTS `IDX_BloodDonation_nric` ON `BloodDonation` (`nric` ASC);
+
+CREATE INDEX IF NOT EXISTS `IDX_BloodDonation_branchId` ON `BloodDonation` (`branchId` ASC);
+
+CREATE INDEX IF NOT EXISTS `IDX_BloodDonation_recordedBy` ON `BloodDonation` (`recordedBy` ASC);
+
+-- Available units (usedBy IS NULL) by blood type and branch, oldest first
+CREATE INDEX IF NOT EXISTS `IDX_BloodDonation_available` ON `BloodDonation` (`usedBy` ASC, `bloodTypeId` ASC, `branchId` ASC, `date` ASC);
+
+-- Matches the ORDER BY of the paged donation listing, so pages are read in index order without sorting
+CREATE INDEX IF NOT EXISTS `IDX_BloodDonation_date_id` ON `BloodDonation` (`date` DESC, `id` ASC);
+
+
+-- -----------------------------------------------------
+-- Table `BloodDonationArchive`
+-- Donations used by a request and older than the retention window, moved out of BloodDonation
+-- by `python manage.py archive-donations`. Same columns as BloodDonation, without foreign keys
+-- (the MariaDB table is partitioned by year, which rules them out).
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `BloodDonationArchive` (
+  `id` INTEGER NOT NULL,
+  `nric` CHAR(10) NOT NULL,
+  `quantity` INT NOT NULL,
+  `date` DATETIME NOT NULL,
+  `branchId` INTEGER NOT NULL,
+  `recordedBy` INTEGER NULL,
+  `usedBy` INTEGER NULL,
+  `bloodTypeId` INTEGER NOT NULL,
+  PRIMARY KEY (`id`));
+
+CREATE INDEX IF NOT EXISTS `IDX_BloodDonationArchive_nric` ON `BloodDonationArchive` (`nric` ASC);
+
+CREATE INDEX IF NOT EXISTS `IDX_BloodDonationArchive_usedBy` ON `BloodDonationArchive` (`usedBy` ASC);
+
+
+-- -----------------------------------------------------
+-- Table `BloodInventory`
+-- Materialized quantity of unused blood per branch and blood type,
+-- maintained by the application on every donation write.
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `BloodInventory` (
+  `branchId` INTEGER NOT NULL,
+  `bloodTypeId` INTEGER NOT NULL,
+  `quantity` INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (`branchId`, `bloodTypeId`),
+  CONSTRAINT `FK_BloodInventory_Branch_id`
+    FOREIGN KEY (`branchId`)
+    REFERENCES `Branch` (`id`)
+    ON DELETE CASCADE
+    ON UPDATE CASCADE,
+  CONSTRAINT `FK_BloodInventory_BloodType_id`
+    FOREIGN KEY (`bloodTypeId`)
+    REFERENCES `BloodType` (`id`)
+    ON DELETE CASCADE
+    ON UPDATE CASCADE)
+WITHOUT ROWID;
+
+
+-- -----------------------------------------------------
+-- Table `DonationWeeklyStat`
+-- Number and total quantity of donations per week (starting Monday).
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `DonationWeeklyStat` (
+  `weekStart` DATE NOT NULL,
+  `donationCount` INT NOT NULL DEFAULT 0,
+  `quantity` INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (`weekStart`))
+WITHOUT ROWID;
+
+
+-- -----------------------------------------------------
+-- Table `AppliedWrite`
+-- Idempotency keys of writes replayed from a branch write queue,
+-- inserted in the same transaction as the write so a replay is applied only once.
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `AppliedWrite` (
+  `idempotencyKey` CHAR(36) NOT NULL,
+  `appliedAt` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`idempotencyKey`))
+WITHOUT ROWID;
+
+
+-- -----------------------------------------------------
+-- Table `DataVersion`
+-- Version of each collection served by /query (donor, donation, request), incremented right
+-- after every write to it commits. Used as the ETag of the /query responses.
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `DataVersion` (
+  `name` VARCHAR(32) NOT NULL,
+  `version` INTEGER NOT NULL DEFAULT 0,
+  `updatedAt` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`name`))
+WITHOUT ROWID;
+
+INSERT OR IGNORE INTO `DataVersion` (`name`) VALUES ('donor'), ('donation'), ('request');
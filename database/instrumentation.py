@@ -0,0 +1,181 @@
+'''Database instrumentation: query counts, rows read and time spent per HTTP request,
+process-wide totals in Prometheus text format, and a slow query log.
+
+A "query" is one MariaDB statement or one Firestore RPC. Rows are rows fetched from MariaDB
+or documents returned by Firestore.
+'''
+import contextvars
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Firestore RPCs that are recorded, and whether they stream documents back
+FIRESTORE_RPCS = {
+    'batch_get_documents': True,
+    'run_query': True,
+    'list_documents': False,
+    'run_aggregation_query': False,
+    'begin_transaction': False,
+    'commit': False,
+    'rollback': False,
+    'batch_write': False,
+}
+
+
+class QueryStats:
+    def __init__(self):
+        self.queries = 0
+        self.rows = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock() # A request's queries may run on several worker threads
+
+    def add(self, queries, rows, seconds):
+        with self._lock:
+            self.queries += queries
+            self.rows += rows
+            self.seconds += seconds
+
+
+class Instrumentation:
+    def __init__(self, slowQueryMs=100):
+        self.slowQueryMs = slowQueryMs
+        # A context variable rather than a thread local, so that queries an async view offloads
+        # to worker threads (which run in a copy of its context) count towards its request
+        self._stats = contextvars.ContextVar('queryStats', default=None)
+        self._lock = threading.Lock()
+        self.totals = QueryStats()
+        self.slowQueries = 0
+        self.requests = 0
+
+    @property
+    def current(self) -> QueryStats:
+        '''Stats of the request being served, or None outside of a request'''
+        return self._stats.get()
+
+    def begin(self):
+        '''Start collecting stats for a new request'''
+        self._stats.set(QueryStats())
+
+    def end(self):
+        '''Stop collecting stats for the current request
+        Returns: QueryStats of the request
+        '''
+        stats = self.current or QueryStats()
+        self._stats.set(None)
+        with self._lock:
+            self.requests += 1
+        return stats
+
+    def record(self, description, seconds, queries=1, rows=0):
+        '''Record database work done for the current request'''
+        if self.current is not None:
+            self.current.add(queries, rows, seconds)
+        with self._lock:
+            self.totals.add(queries, rows, seconds)
+            if queries and seconds * 1000 >= self.slowQueryMs:
+                self.slowQueries += 1
+        if queries and seconds * 1000 >= self.slowQueryMs:
+            logger.warning('Slow query (%.1f ms): %s', seconds * 1000, ' '.join(str(description).split()))
+
+    def instrumentFirestore(self, client):
+        '''Record every RPC made by a Firestore client'''
+        api = client._firestore_api
+        for rpc, streamsDocuments in FIRESTORE_RPCS.items():
+            if hasattr(api, rpc):
+                setattr(api, rpc, self._wrapRpc(rpc, getattr(api, rpc), streamsDocuments))
+
+    def _wrapRpc(self, name, fn, streamsDocuments):
+        def instrumented(*args, **kwargs):
+            start = time.perf_counter()
+            response = fn(*args, **kwargs)
+            if not streamsDocuments:
+                self.record(f'Firestore {name}', time.perf_counter() - start)
+                return response
+            return self._countDocuments(name, response, start)
+        return instrumented
+
+    def _countDocuments(self, name, responses, start):
+        '''Pass a streaming Firestore response through, recording it once fully consumed'''
+        documentField = 'document' if name == 'run_query' else 'found' # RunQueryResponse / BatchGetDocumentsResponse
+        documents = 0
+        try:
+            for response in responses:
+                if response._pb.HasField(documentField):
+                    documents += 1
+                yield response
+        finally:
+            self.record(f'Firestore {name}', time.perf_counter() - start, rows=documents)
+
+    def prometheus(self, extra=()):
+        '''Totals in Prometheus text exposition format.
+        extra: (name, type, help, value) of additional metrics to include
+        '''
+        with self._lock:
+            metrics = [
+                ('bloodmgt_http_requests_total', 'counter', 'HTTP requests served', self.requests),
+                ('bloodmgt_db_queries_total', 'counter', 'Database queries (MariaDB statements or Firestore RPCs)', self.totals.queries),
+                ('bloodmgt_db_rows_read_total', 'counter', 'Rows or documents read from the database', self.totals.rows),
+                ('bloodmgt_db_query_seconds_total', 'counter', 'Time spent in database queries', self.totals.seconds),
+                ('bloodmgt_db_slow_queries_total', 'counter', f'Database queries slower than {self.slowQueryMs} ms', self.slowQueries),
+            ]
+        lines = []
+        for name, type, help, value in list(metrics) + list(extra):
+            lines.append(f'# HELP {name} {help}')
+            lines.append(f'# TYPE {name} {type}')
+            lines.append(f'{name} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+class InstrumentedCursor:
+    '''Wraps a MariaDB cursor, recording each statement and the rows fetched'''
+    def __init__(self, cursor, instrumentation: Instrumentation):
+        self._cursor = cursor
+        self._instrumentation = instrumentation
+        self._statement = None
+
+    def execute(self, statement, data=()):
+        self._statement = statement
+        start = time.perf_counter()
+        try:
+            return self._cursor.execute(statement, data)
+        finally:
+            self._instrumentation.record(statement, time.perf_counter() - start)
+
+    def executemany(self, statement, data):
+        self._statement = statement
+        start = time.perf_counter()
+        try:
+            return self._cursor.executemany(statement, data)
+        finally:
+            self._instrumentation.record(statement, time.perf_counter() - start)
+
+    def _recordFetch(self, start, rows):
+        self._instrumentation.record(self._statement, time.perf_counter() - start, queries=0, rows=rows)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._recordFetch(start, 0 if row is None else 1)
+        return row
+
+    def fetchmany(self, size=1):
+        start = time.perf_counter()
+        rows = self._cursor.fetchmany(size)
+        self._recordFetch(start, len(rows))
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._recordFetch(start, len(rows))
+        return rows
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+# Shared by the backends and the web app
+instrumentation = Instrumentation(slowQueryMs=float(os.getenv('BLOODMGT_SLOW_QUERY_MS', 100)))
@@ -1,19 +1,33 @@
 import os
 import sys
+import threading
+import time
 
 import mariadb
-from database.models import BloodDonation, BloodInventory, BloodRequest, Branch, DashboardData, Donor, User
+from database.cache import ReferenceCache
+from database.instrumentation import InstrumentedCursor, instrumentation
+from database.pool import ConnectionPool
+from database.sql import SQLBackend
+from database.statements import PreparedCursor, StatementStats, inList
+
+# Fulfillment is retried on deadlock (1213) and lock wait timeout (1205)
+RETRYABLE_ERRNOS = (1205, 1213)
+FULFILL_ATTEMPTS = 3
+
+class MariaDBBackend(SQLBackend):
+    driver = mariadb
+    UPSERT_INVENTORY = 'ON DUPLICATE KEY UPDATE quantity=quantity + VALUES(quantity)'
+    UPSERT_WEEKLY_STAT = ('ON DUPLICATE KEY UPDATE donationCount=donationCount + VALUES(donationCount), '
+                          'quantity=quantity + VALUES(quantity)')
+    WEEK_START = 'DATE({0}) - INTERVAL WEEKDAY({0}) DAY'
+    LOCK_ROWS = ' FOR UPDATE'
+    UTC_NOW = 'UTC_TIMESTAMP()'
 
-TABLE_DONOR = 'Donor'
-TABLE_BLOODTYPE = 'BloodType'
-TABLE_DONATION = 'BloodDonation'
-TABLE_REQUEST = 'BloodRequest'
-TABLE_USER = 'User'
-TABLE_ROLE = 'Role'
-TABLE_BRANCH = 'Branch'
-
-class MariaDBBackend:
     def __init__(self):
+        self._local = threading.local() # Per-thread checked out connection and cursor
+        self._preparedCursors = {} # { id(connection): PreparedCursor }, kept while the connection is open
+        self.statementStats = StatementStats()
+        self.refCache = ReferenceCache.fromEnv('BLOODMGT_REFCACHE') # Branches, blood types and roles
         self.connect()
         super().__init__()
 
@@ -27,261 +41,85 @@ class MariaDBBackend:
             pwd = input("Enter your MariaDB password: ")
 
         try:
-            conn = mariadb.connect(
-                user=user,
-                password=pwd,
-                host='localhost',
-                port=3306,
-                database='bloodmanagementsystem'
+            pool = ConnectionPool(
+                {
+                    'user': user,
+                    'password': pwd,
+                    'host': 'localhost',
+                    'port': 3306,
+                    'database': 'bloodmanagementsystem',
+                },
+                minSize=int(os.getenv('BLOODMGT_MARIADB_POOL_MIN', 2)),
+                maxSize=int(os.getenv('BLOODMGT_MARIADB_POOL_MAX', 10)),
+                onReset=self._forgetStatements,
             )
         except mariadb.Error as e:
             print(f"Error connecting to MariaDB Platform: {e}")
             sys.exit(1)
 
-        self._connection: mariadb.Connection = conn
-        self._cursor: mariadb.Cursor = conn.cursor()
+        self._pool = pool
+        return pool
+
+    @property
+    def maxConnections(self):
+        return self._pool.maxSize
+
+    @property
+    def _connection(self) -> mariadb.Connection:
+        '''Connection checked out by the current thread, acquired from the pool on first use'''
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            conn = self._pool.acquire()
+            cursor = self._preparedCursors.get(id(conn))
+            if cursor is None:
+                cursor = self._preparedCursors[id(conn)] = PreparedCursor(conn, self.statementStats)
+            self._local.connection = conn
+            self._local.cursor = InstrumentedCursor(cursor, instrumentation)
         return conn
 
-    def commit(self):
-        self._connection.commit()
-
-    def getUserById(self, id):
-        '''Query user by id'''
-        self._cursor.execute(f'''
-            SELECT u.id, u.username, u.password, u.name, u.branchId, r.name FROM {TABLE_USER} u
-            INNER JOIN {TABLE_ROLE} r ON u.roleId=r.id
-            WHERE u.id=?
-        ''', (id,))
-        res = self._cursor.fetchone()
-        if res is None:
-            return None
-        return User(*res)
-
-    def login(self, username, password):
-        '''User authentication. Return the user if successful or None'''
-        self._cursor.execute(f'''
-            SELECT u.id, u.username, u.password, u.name, u.branchId, r.name FROM {TABLE_USER} u
-            INNER JOIN {TABLE_ROLE} r ON u.roleId=r.id
-            WHERE u.username=? AND u.password=?
-        ''', (username, password))
-        res = self._cursor.fetchone()
-        if res is None:
-            return None
-        return User(*res)
-
-    def register(self, user: User):
-        '''User registration. Return the user if successful or None'''
-        roleId = self.getRoleIdByName(user.role)
-        self._cursor.execute(f'''
-            INSERT INTO {TABLE_USER} (username, password, name, branchId, roleId)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (user.username, user.password, user.name, user.branchId, roleId))
-        self.commit()
-        return self.login(user.username, user.password)
-
-    def getAllDonors(self):
-        '''Query list of all donors'''
-        statement = f'''
-            SELECT d.nric, d.name, d.dateOfBirth, d.contactNo, bt.type, d.registrationDate FROM {TABLE_DONOR} d
-            INNER JOIN {TABLE_BLOODTYPE} bt ON d.BloodTypeId=bt.id
-            ORDER BY d.nric
-            LIMIT 1000
-        '''
-        self._cursor.execute(statement)
-        return [Donor(*d) for d in self._cursor.fetchall()]
-
-    def getDonorByNRIC(self, nric: str):
-        '''Query one donor by NRIC'''
-        statement = f'''
-            SELECT d.nric, d.name, d.dateOfBirth, d.contactNo, bt.type, d.registrationDate FROM {TABLE_DONOR} d
-            INNER JOIN {TABLE_BLOODTYPE} bt ON d.BloodTypeId=bt.id
-            WHERE nric=?
-        '''
-        self._cursor.execute(statement, (nric,))
-        res = self._cursor.fetchone()
-        if res is None:
-            return None
-        return Donor(*res)
-
-    def insertDonor(self, donor: Donor):
-        '''Insert new Donor'''
-        bloodTypeId = self.getBloodTypeId(donor.bloodType)
-        statement = f'''
-            INSERT INTO {TABLE_DONOR} (nric, name, dateOfBirth, contactNo, bloodTypeId, registrationDate)
-            VALUES (?, ?, ?, ?, ?, ?)
-        '''
-        data = donor.toTuple(bloodTypeId)
-        assert(len(data) == 6)
-        try:
-            self._cursor.execute(statement, data)
-        except mariadb.Error as e:
-            print(f"Error inserting new donor: {e}")
-
-    def updateDonor(self, donor: Donor):
-        '''Update existing Donor'''
-        bloodTypeId = self.getBloodTypeId(donor.bloodType)
-        statement = f'''
-            UPDATE {TABLE_DONOR}
-            SET name=?, dateOfBirth=?, contactNo=?, bloodTypeId=?
-            WHERE nric=?
-        '''
-        self._cursor.execute(statement, (donor.name, donor.dateOfBirth, donor.contactNo, bloodTypeId, donor.nric))
+    @property
+    def _cursor(self) -> InstrumentedCursor:
+        self._connection
+        return self._local.cursor
 
-    def deleteDonorByNRIC(self, nric: str):
-        '''Delete donor by NRIC'''
-        statement = f'DELETE FROM {TABLE_DONOR} WHERE nric=?'
-        self._cursor.execute(statement, (nric,))
+    def _forgetStatements(self, conn: mariadb.Connection):
+        '''Drop the prepared statements of a connection that is reconnected or closed by the pool'''
+        cursor = self._preparedCursors.pop(id(conn), None)
+        if cursor is not None:
+            cursor.close()
 
-    def getAllDonations(self):
-        '''Query list of all blood donations'''
-        statement = f'''
-            SELECT bd.id, bd.nric, bd.quantity, bd.date, bd.branchId, bd.recordedBy, bd.usedBy, b.name, u.username, bt.type
-                FROM {TABLE_DONATION} bd
-            INNER JOIN {TABLE_BRANCH} b ON bd.branchId=b.id
-            LEFT JOIN {TABLE_USER} u ON bd.recordedBy=u.id
-            INNER JOIN {TABLE_DONOR} d ON bd.nric=d.nric
-            INNER JOIN {TABLE_BLOODTYPE} bt ON d.bloodTypeId=bt.id
-            ORDER BY bd.date DESC, bd.id
-            LIMIT 1000
+    def release(self):
+        '''Return the current thread's connection to the pool (called when the request ends).
+        Its prepared statements stay open for the next checkout.
         '''
-        self._cursor.execute(statement)
-        return [BloodDonation(*bd) for bd in self._cursor.fetchall()]
-
-    def getDonationsIdsByRequestId(self, id):
-        '''Query all blood donation ids used to fulfill the request with given id.'''
-        statement = f'''
-            SELECT id FROM {TABLE_DONATION}
-            WHERE usedBy=?
-        '''
-        self._cursor.execute(statement, (id,))
-        return [r[0] for r in self._cursor.fetchall()]
-
-    def getAvailableDonationsByBloodType(self, bloodType: str):
-        '''Query donation records not yet used for request fulfillment by blood type'''
-        self._cursor.execute(f'''
-            SELECT bd.id, bd.nric, bd.quantity, bd.date, bd.branchId, bd.recordedBy, bd.usedBy
-                FROM {TABLE_DONATION} bd
-            INNER JOIN {TABLE_DONOR} d ON bd.nric=d.nric
-            INNER JOIN {TABLE_BLOODTYPE} bt ON d.bloodTypeId=bt.id
-            WHERE bd.usedBy IS NULL AND bt.type=? 
-        ''', (bloodType,))
-        return [BloodDonation(*d) for d in self._cursor.fetchall()]
-
-    def insertDonation(self, donation: BloodDonation):
-        statement = f'''
-            INSERT INTO {TABLE_DONATION} (id, nric, quantity, date, branchId, recordedBy)
-            VALUES (?, ?, ?, ?, ?, ?)
-        '''
-        data = donation.toTuple()
-        assert(len(data) == 6)
-        self._cursor.execute(statement, data)
-        return self._cursor.lastrowid
-
-    def getAllRequests(self):
-        '''Query list of all blood requests'''
-        self._cursor.execute(f'''
-            SELECT br.id, br.requesterId, bt.type, br.quantity, br.date, br.address, 
-                br.status, br.fulfilled, u.username FROM {TABLE_REQUEST} br
-            INNER JOIN {TABLE_BLOODTYPE} bt ON br.bloodTypeId=bt.id
-            INNER JOIN {TABLE_USER} u ON br.requesterId=u.id
-            LIMIT 1000
-        ''')
-        return [BloodRequest(*br) for br in self._cursor.fetchall()]
-
-    def getRequestById(self, id):
-        '''Query blood requests by request id'''
-        self._cursor.execute(f'''
-            SELECT br.id, br.requesterId, bt.type, br.quantity, br.date, br.address, 
-                br.status, br.fulfilled, u.username FROM {TABLE_REQUEST} br
-            INNER JOIN {TABLE_BLOODTYPE} bt ON br.bloodTypeId=bt.id
-            INNER JOIN {TABLE_USER} u ON br.requesterId=u.id
-            WHERE br.id=?
-        ''', (id,))
-        return BloodRequest(*self._cursor.fetchone())
-
-    def insertRequest(self, req: BloodRequest):
-        bloodTypeId = self.getBloodTypeId(req.bloodType)
-        statement = f'''
-            INSERT INTO {TABLE_REQUEST} (id, requesterId, bloodTypeId, quantity, date, address, status, fulfilled)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        '''
-        data = req.toTuple(bloodTypeId)
-        assert(len(data) == 8)
-        try:
-            self._cursor.execute(statement, data)
-            return self._cursor.lastrowid
-        except mariadb.Error as e:
-            print(f"Error inserting new blood request: {e}")
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            return
+        self._local.connection = None
+        self._local.cursor = None
+        self._local.pendingVersions = None # Uncommitted, rolled back by the pool
+        self._pool.release(conn)
+
+    def _inList(self, values):
+        # Padded, so that IN lists of different lengths share a few prepared statements
+        return inList(values)
+
+    def explainAvailableDonations(self, bloodTypes=None):
+        '''Query plan of getAvailableDonations (EXPLAIN), one line per table'''
+        statement, data = self._availableDonationsQuery(bloodTypes)
+        self._cursor.execute('EXPLAIN ' + statement, data)
+        columns = [c[0] for c in self._cursor.description]
+        return [' '.join(f'{k}={v}' for k, v in zip(columns, row) if v is not None) for row in self._cursor.fetchall()]
 
     def fulfillRequest(self, requestId: str, donationIds: list[str]):
-        '''Mark blood request as fulfilled using one or more blood donations'''
-        statement = f'''
-            UPDATE {TABLE_DONATION}
-            SET usedBy=?
-            WHERE id in ({','.join(['?'] * len(donationIds))})
-        '''
-        data = tuple((int(requestId),)) + tuple(map(int, donationIds))
-        self._cursor.execute(statement, data)
-
-        statement = f'''
-            UPDATE {TABLE_REQUEST}
-            SET status=?, fulfilled=?
-            WHERE id=?
-        '''
-        self._cursor.execute(statement, ('Delivered', 1, requestId))
-
-    def getAllBranches(self):
-        '''Query list of all blood bank branches'''
-        self._cursor.execute(f'SELECT id, name, address, postalCode FROM {TABLE_BRANCH}')
-        return [Branch(*br) for br in self._cursor.fetchall()]
-
-    def getRoleIdByName(self, roleName):
-        '''Query role id by its name'''
-        statement = f'''
-            SELECT id FROM {TABLE_ROLE}
-            WHERE name=?
-        '''
-        self._cursor.execute(statement, (roleName,))
-        return self._cursor.fetchone()[0]
-
-    def getBloodTypeId(self, bloodType):
-        '''Query the id of a blood type (e.g. A+)'''
-        self._cursor.execute(f'SELECT id FROM {TABLE_BLOODTYPE} WHERE type=?', (bloodType,))
-        res = self._cursor.fetchone()
-        return res[0] if res is not None else None
-
-    def getDashboardStats(self, branchId):
-        '''Query data to show on the dashboard
-        Returns: DashboardData(donor count, available blood, pending requests, donations, blood inventory)
-        '''
-        self._cursor.execute(f'''
-            SELECT d.donorCount, bd.availableBlood, req.pendingCount, bd2.donationsThisWeek, bd2.bloodQtyThisWeek FROM
-            	(SELECT COUNT(nric) AS donorCount FROM {TABLE_DONOR}) AS d,
-            	(SELECT SUM(quantity) AS availableBlood FROM {TABLE_DONATION} WHERE usedBy IS NULL) AS bd,
-            	(SELECT COUNT(id) AS pendingCount FROM {TABLE_REQUEST} WHERE fulfilled=0) AS req,
-            	(SELECT COUNT(d2Stat.id) AS donationsThisWeek, COALESCE(SUM(d2Stat.quantity),0) AS bloodQtyThisWeek FROM (
-            		SELECT bd.id, bd.quantity FROM {TABLE_DONATION} bd
-            			WHERE bd.date BETWEEN DATE(DATE_ADD(NOW(), INTERVAL(-WEEKDAY(NOW())) DAY))
-            				AND DATE(DATE_ADD(NOW(), INTERVAL(7-WEEKDAY(NOW())) DAY))
-            		) AS d2Stat
-            	) AS bd2;
-        ''')
-        donorCount, availableBlood, pendingCount, donationsThisWeek, bloodQtyThisWeek = self._cursor.fetchone()
-        inventory = self.getBloodInventoryByBranchId(branchId)
-        return DashboardData(donorCount, availableBlood, pendingCount, donationsThisWeek, bloodQtyThisWeek, inventory.storage)
-
-    def getBloodInventoryByBranchId(self, branchId):
-        '''Query blood inventory data
-        Returns: BloodInventory
+        '''Mark blood request as fulfilled using one or more blood donations (see SQLBackend).
+        Deadlocks and lock wait timeouts roll back the transaction and are retried.
         '''
-        self._cursor.execute(f'''
-            SELECT b.branchId, bt.type, SUM(b.quantity) FROM {TABLE_DONATION} b
-                INNER JOIN {TABLE_DONOR} d ON b.nric=d.nric
-                INNER JOIN {TABLE_BLOODTYPE} bt ON d.bloodTypeId=bt.id
-                WHERE b.usedBy IS NULL AND b.branchId=?
-                GROUP BY bt.type;
-        ''', (branchId,))
-        inventories = BloodInventory.fromTupleList(self._cursor.fetchall())
-        assert(len(inventories) == 1)
-        return inventories[0]
-    
\ No newline at end of file
+        for attempt in range(FULFILL_ATTEMPTS):
+            try:
+                return super().fulfillRequest(requestId, donationIds)
+            except mariadb.Error as e:
+                self.rollback()
+                if e.errno not in RETRYABLE_ERRNOS or attempt == FULFILL_ATTEMPTS - 1:
+                    raise
+                time.sleep(0.05 * 2 ** attempt)
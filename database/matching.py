@@ -0,0 +1,131 @@
+'''Allocation of available blood donations to blood requests.
+
+Donations are matched across compatible blood types (red cell compatibility, so O- can be given
+to anyone), first-expiring-first-out: the oldest units are used first, as blood expires a fixed
+number of days after donation. Exact-type units are preferred over compatible ones, so that
+universal O- units are kept for the patients who need them.
+'''
+from collections import defaultdict
+
+from database.models import BloodDonation, BloodRequest
+
+# Recipient blood type -> donor blood types it can receive, in order of preference
+COMPATIBLE_DONORS = {
+    'O-': ['O-'],
+    'O+': ['O+', 'O-'],
+    'A-': ['A-', 'O-'],
+    'A+': ['A+', 'A-', 'O+', 'O-'],
+    'B-': ['B-', 'O-'],
+    'B+': ['B+', 'B-', 'O+', 'O-'],
+    'AB-': ['AB-', 'A-', 'B-', 'O-'],
+    'AB+': ['AB+', 'AB-', 'A+', 'A-', 'B+', 'B-', 'O+', 'O-'],
+}
+
+# How many upcoming units are considered when picking the unit that completes a request.
+# A larger window wastes less blood but departs further from strict oldest-first order.
+LOOKAHEAD = 32
+
+
+class Allocation:
+    def __init__(self, request: BloodRequest, donations: list[BloodDonation]):
+        self.request = request
+        self.donations = donations
+
+    @property
+    def quantity(self):
+        return sum(int(d.quantity) for d in self.donations)
+
+    @property
+    def overshoot(self):
+        '''Quantity allocated beyond the requested quantity'''
+        return self.quantity - int(self.request.quantity)
+
+    def serialize(self):
+        return {
+            'requestId': self.request.id,
+            'donationIds': [d.id for d in self.donations],
+            'quantity': self.quantity,
+            'overshoot': self.overshoot,
+        }
+
+
+class DonationIndex:
+    '''Available donations per blood type, oldest first. Allocated units are removed as requests are matched,
+    so one index serves a whole batch of requests.
+    '''
+    def __init__(self, donations, branchId=None):
+        self._units = defaultdict(list) # { blood type: [BloodDonation] sorted by date }
+        self._next = defaultdict(int) # { blood type: index of the oldest unit that may still be free }
+        self._allocated = set() # ids of allocated donations
+        self._free = defaultdict(int) # { blood type: free quantity }
+        for d in donations:
+            if d.usedBy is None and (branchId is None or str(d.branchId) == str(branchId)):
+                self._units[d.bloodType].append(d)
+                self._free[d.bloodType] += int(d.quantity)
+        for units in self._units.values():
+            units.sort(key=lambda d: d.date)
+
+    def available(self, bloodType):
+        '''Total free quantity of a blood type'''
+        return self._free[bloodType]
+
+    def _candidates(self, recipientType):
+        '''Free units a recipient can receive, in preference then date order'''
+        for bloodType in COMPATIBLE_DONORS.get(recipientType, []):
+            units = self._units[bloodType]
+            # Skip the allocated units at the front once, instead of on every request
+            while self._next[bloodType] < len(units) and units[self._next[bloodType]].id in self._allocated:
+                self._next[bloodType] += 1
+            for i in range(self._next[bloodType], len(units)):
+                if units[i].id not in self._allocated:
+                    yield units[i]
+
+    def allocate(self, request: BloodRequest):
+        '''Pick donations covering the request's quantity, or None if compatible stock is insufficient.
+        Units are taken oldest first. The unit that completes the request is the smallest one that covers
+        the remainder among the next LOOKAHEAD candidates, to keep the overshoot small.
+        Picked units are removed from the index.
+        '''
+        remaining = int(request.quantity)
+        if sum(self._free[t] for t in COMPATIBLE_DONORS.get(request.bloodType, [])) < remaining:
+            return None # Not enough compatible blood; leave the stock for other requests
+        picked = []
+        candidates = self._candidates(request.bloodType)
+        window = []
+        while remaining > 0:
+            # Keep LOOKAHEAD upcoming candidates in view
+            for unit in candidates:
+                window.append(unit)
+                if len(window) >= LOOKAHEAD:
+                    break
+            if not window:
+                return None
+            covering = [u for u in window if int(u.quantity) >= remaining]
+            if covering:
+                unit = min(covering, key=lambda u: int(u.quantity)) # min keeps the oldest among equal sizes
+            else:
+                unit = window[0]
+            window.remove(unit)
+            picked.append(unit)
+            remaining -= int(unit.quantity)
+        for unit in picked:
+            self._allocated.add(unit.id)
+            self._free[unit.bloodType] -= int(unit.quantity)
+        return Allocation(request, picked)
+
+
+def allocateRequests(requests, donations, branchId=None):
+    '''Match requests (oldest first) against the available donations.
+    branchId: only use donations of this branch
+    Returns: (list of Allocation, list of requests that could not be covered)
+    '''
+    index = DonationIndex(donations, branchId)
+    allocations = []
+    unfilled = []
+    for request in sorted(requests, key=lambda r: (r.date, str(r.id))):
+        allocation = index.allocate(request)
+        if allocation is None:
+            unfilled.append(request)
+        else:
+            allocations.append(allocation)
+    return allocations, unfilled
@@ -0,0 +1,66 @@
+-- Migration 001: materialized blood inventory and weekly donation counters.
+-- Creates the tables and populates them from the existing donation records.
+-- The same data can be recomputed at any time with `python manage.py rebuild-inventory`.
+
+USE `bloodmanagementsystem`;
+
+-- -----------------------------------------------------
+-- Table `bloodmanagementsystem`.`BloodInventory`
+-- Materialized quantity of unused blood per branch and blood type,
+-- maintained by the application on every donation write.
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `bloodmanagementsystem`.`BloodInventory` (
+  `branchId` INT UNSIGNED NOT NULL,
+  `bloodTypeId` INT UNSIGNED NOT NULL,
+  `quantity` INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (`branchId`, `bloodTypeId`),
+  CONSTRAINT `FK_BloodInventory_Branch_id`
+    FOREIGN KEY (`branchId`)
+    REFERENCES `bloodmanagementsystem`.`Branch` (`id`)
+    ON DELETE CASCADE
+    ON UPDATE CASCADE,
+  CONSTRAINT `FK_BloodInventory_BloodType_id`
+    FOREIGN KEY (`bloodTypeId`)
+    REFERENCES `bloodmanagementsystem`.`BloodType` (`id`)
+    ON DELETE CASCADE
+    ON UPDATE CASCADE)
+ENGINE = InnoDB;
+
+
+-- -----------------------------------------------------
+-- Table `bloodmanagementsystem`.`DonationWeeklyStat`
+-- Number and total quantity of donations per week (starting Monday).
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `bloodmanagementsystem`.`DonationWeeklyStat` (
+  `weekStart` DATE NOT NULL,
+  `donationCount` INT NOT NULL DEFAULT 0,
+  `quantity` INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (`weekStart`))
+ENGINE = InnoDB;
+
+
+-- -----------------------------------------------------
+-- Data for table `bloodmanagementsystem`.`BloodInventory`
+-- -----------------------------------------------------
+START TRANSACTION;
+USE `bloodmanagementsystem`;
+INSERT INTO `bloodmanagementsystem`.`BloodInventory` (`branchId`, `bloodTypeId`, `quantity`)
+  SELECT bd.branchId, d.bloodTypeId, SUM(bd.quantity) FROM `bloodmanagementsystem`.`BloodDonation` bd
+  INNER JOIN `bloodmanagementsystem`.`Donor` d ON bd.nric=d.nric
+  WHERE bd.usedBy IS NULL
+  GROUP BY bd.branchId, d.bloodTypeId;
+
+COMMIT;
+
+
+-- -----------------------------------------------------
+-- Data for table `bloodmanagementsystem`.`DonationWeeklyStat`
+-- -----------------------------------------------------
+START TRANSACTION;
+USE `bloodmanagementsystem`;
+INSERT INTO `bloodmanagementsystem`.`DonationWeeklyStat` (`weekStart`, `donationCount`, `quantity`)
+  SELECT DATE(bd.date) - INTERVAL WEEKDAY(bd.date) DAY AS weekStart, COUNT(bd.id), SUM(bd.quantity)
+  FROM `bloodmanagementsystem`.`BloodDonation` bd
+  GROUP BY weekStart;
+
+COMMIT;
@@ -0,0 +1,15 @@
+-- Migration 002: idempotency keys of writes replayed from branch write queues.
+
+USE `bloodmanagementsystem`;
+
+
+-- -----------------------------------------------------
+-- Table `bloodmanagementsystem`.`AppliedWrite`
+-- Idempotency keys of writes replayed from a branch write queue,
+-- inserted in the same transaction as the write so a replay is applied only once.
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `bloodmanagementsystem`.`AppliedWrite` (
+  `idempotencyKey` CHAR(36) NOT NULL,
+  `appliedAt` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`idempotencyKey`))
+ENGINE = InnoDB;
@@ -0,0 +1,37 @@
+-- Migration 004: archive table for donations used by a request and older than the retention window.
+-- Move rows with `python manage.py archive-donations --days N`.
+
+USE `bloodmanagementsystem`;
+
+
+-- -----------------------------------------------------
+-- Table `bloodmanagementsystem`.`BloodDonationArchive`
+-- Donations used by a request and older than the retention window, moved out of BloodDonation
+-- by `python manage.py archive-donations`. Same columns as BloodDonation, partitioned by year
+-- so that queries on a date range only read the matching partitions and old years can be dropped
+-- with ALTER TABLE ... DROP PARTITION. Partitioned InnoDB tables cannot have foreign keys, so the
+-- application keeps the rows consistent (donor updates and deletes also touch the archive).
+-- Add next year's partition by splitting pmax: ALTER TABLE ... REORGANIZE PARTITION pmax INTO (...).
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `bloodmanagementsystem`.`BloodDonationArchive` (
+  `id` INT UNSIGNED NOT NULL,
+  `nric` CHAR(10) NOT NULL,
+  `quantity` INT UNSIGNED NOT NULL,
+  `date` DATETIME NOT NULL,
+  `branchId` INT UNSIGNED NOT NULL,
+  `recordedBy` INT UNSIGNED NULL,
+  `usedBy` INT UNSIGNED NULL,
+  `bloodTypeId` INT UNSIGNED NOT NULL,
+  PRIMARY KEY (`id`, `date`),
+  INDEX `IDX_BloodDonationArchive_nric` (`nric` ASC),
+  INDEX `IDX_BloodDonationArchive_usedBy` (`usedBy` ASC))
+ENGINE = InnoDB
+PARTITION BY RANGE (YEAR(`date`)) (
+  PARTITION p2020 VALUES LESS THAN (2021),
+  PARTITION p2021 VALUES LESS THAN (2022),
+  PARTITION p2022 VALUES LESS THAN (2023),
+  PARTITION p2023 VALUES LESS THAN (2024),
+  PARTITION p2024 VALUES LESS THAN (2025),
+  PARTITION p2025 VALUES LESS THAN (2026),
+  PARTITION p2026 VALUES LESS THAN (2027),
+  PARTITION pmax VALUES LESS THAN MAXVALUE);
@@ -0,0 +1,19 @@
+-- Migration 005: collection versions, the ETags of the /query responses.
+
+USE `bloodmanagementsystem`;
+
+
+-- -----------------------------------------------------
+-- Table `bloodmanagementsystem`.`DataVersion`
+-- Version of each collection served by /query (donor, donation, request), incremented right
+-- after every write to it commits. Used as the ETag of the /query responses.
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `bloodmanagementsystem`.`DataVersion` (
+  `name` VARCHAR(32) NOT NULL,
+  `version` BIGINT UNSIGNED NOT NULL DEFAULT 0,
+  `updatedAt` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`name`))
+ENGINE = InnoDB;
+
+INSERT IGNORE INTO `bloodmanagementsystem`.`DataVersion` (`name`, `updatedAt`)
+  VALUES ('donor', UTC_TIMESTAMP()), ('donation', UTC_TIMESTAMP()), ('request', UTC_TIMESTAMP());
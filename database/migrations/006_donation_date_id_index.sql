@@ -0,0 +1,15 @@
+-- Migration 006: index matching the ORDER BY of the paged donation listing (date DESC, id ASC),
+-- so that each page is read in index order from its cursor without sorting.
+
+USE `bloodmanagementsystem`;
+
+ALTER TABLE `bloodmanagementsystem`.`BloodDonation`
+  ADD INDEX `IDX_BloodDonation_date_id` (`date` DESC, `id` ASC);
+
+-- The new index starts with date, so it also serves every query of the old one
+ALTER TABLE `bloodmanagementsystem`.`BloodDonation`
+  DROP INDEX `IDX_BloodDonation_date`;
+
+-- Check the plan: key should be IDX_BloodDonation_date_id, with no filesort
+EXPLAIN SELECT bd.id FROM `bloodmanagementsystem`.`BloodDonation` bd
+  ORDER BY bd.date DESC, bd.id ASC LIMIT 101;
@@ -2,6 +2,8 @@ from datetime import date, datetime
 
 from flask_login import UserMixin
 
+BLOOD_TYPES = ['A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-']
+
 # Inheriting from UserMixin required for flask login
 class User(UserMixin):
     def __init__(self, id, username, password, name, branchId, role):
@@ -32,7 +34,11 @@ class User(UserMixin):
             'role': self.role,
         }
 
+# The record models use __slots__ (listed in constructor and serialize() order, which is also the column
+# order of the backends' SELECTs), so that large result sets take less memory and build faster.
 class Donor:
+    __slots__ = ('nric', 'name', 'dateOfBirth', 'contactNo', 'bloodType', 'registrationDate')
+
     def __init__(self, nric, name, dateOfBirth, contactNo, bloodType, registrationDate):
         self.nric = nric
         self.name = name
@@ -62,10 +68,12 @@ class Donor:
             'dateOfBirth': self.dateOfBirth.isoformat(),
             'contactNo': self.contactNo,
             'bloodType': self.bloodType,
-            'registrationDate': self.registrationDate,
+            'registrationDate': self.registrationDate.isoformat() if self.registrationDate else None,
         }
 
 class BloodDonation:
+    __slots__ = ('id', 'nric', 'quantity', 'date', 'branchId', 'recordedBy', 'usedBy', 'branchName', 'staffUsername', 'bloodType')
+
     def __init__(self, id, nric, quantity, date, branchId, recordedBy, usedBy, branchName = None, staffUsername = None, bloodType = None):
         self.id = id
         self.nric = nric
@@ -111,6 +119,8 @@ class BloodDonation:
         }
 
 class BloodRequest:
+    __slots__ = ('id', 'requesterId', 'bloodType', 'quantity', 'date', 'address', 'status', 'fulfilled', 'requester')
+
     def __init__(self, id, requesterId, bloodType, quantity, date, address, status, fulfilled, requester = None):
         self.id = id
         self.requesterId = requesterId
@@ -154,6 +164,8 @@ class BloodRequest:
         }
 
 class Branch:
+    __slots__ = ('id', 'name', 'address', 'postalCode')
+
     def __init__(self, id, name, address, postalCode):
         self.id = id
         self.name = name
@@ -170,6 +182,8 @@ class Branch:
         )
 
 class DashboardData:
+    __slots__ = ('donorCount', 'availableBlood', 'pendingRequests', 'donationsThisWeek', 'bloodQtyThisWeek', 'bloodInventoryMap')
+
     def __init__(self, donorCount, availableBlood, pendingRequests, donationsThisWeek, bloodQtyThisWeek, bloodInventoryMap):
         self.donorCount = donorCount
         self.availableBlood = availableBlood
@@ -179,11 +193,11 @@ class DashboardData:
         self.bloodInventoryMap = bloodInventoryMap
 
 class BloodInventory:
+    __slots__ = ('branchId', 'storage')
+
     def __init__(self, branchId):
         self.branchId = branchId
-        self.storage = dict.fromkeys([
-            'A+', 'A-', 'B+', 'B-',
-            'AB+', 'AB-', 'O+', 'O-'], 0)
+        self.storage = dict.fromkeys(BLOOD_TYPES, 0)
 
     @staticmethod
     def fromTupleList(data: list):
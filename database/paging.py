@@ -0,0 +1,43 @@
+'''Helpers for keyset (cursor) pagination shared by the database backends.
+
+Every paged listing method has the signature `getXPage(after=None, pageSize=PAGE_SIZE)` and returns
+`(items, nextCursor)`. The cursor is an opaque string produced by the backend; `nextCursor` is None
+on the last page. With `serialized=True` the items are serialize()-shaped dicts instead of model objects.
+'''
+from database.serialization import serializeRows
+
+PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def clampPageSize(pageSize):
+    '''Coerce a user supplied page size into [1, MAX_PAGE_SIZE]'''
+    try:
+        pageSize = int(pageSize)
+    except (TypeError, ValueError):
+        return PAGE_SIZE
+    return max(1, min(pageSize, MAX_PAGE_SIZE))
+
+
+def pageFromRows(cls, rows, pageSize, cursorOf, serialized=False):
+    '''Build a page from the up to pageSize + 1 rows fetched for it, of columns in cls.__slots__ order.
+    cursorOf: returns the cursor of a row
+    Returns: (list of cls or of dicts if serialized, next page cursor or None)
+    '''
+    after = None
+    if len(rows) > pageSize:
+        rows = rows[:pageSize]
+        after = cursorOf(rows[-1])
+    if serialized:
+        return serializeRows(cls, rows), after
+    return [cls(*row) for row in rows], after
+
+
+def iterPages(fetchPage, pageSize=MAX_PAGE_SIZE):
+    '''Yield every item of a paged listing, fetching one page at a time'''
+    after = None
+    while True:
+        items, after = fetchPage(after, pageSize)
+        yield from items
+        if after is None:
+            return
@@ -0,0 +1,115 @@
+import queue
+import threading
+
+import mariadb
+
+
+class PoolExhaustedError(Exception):
+    '''Raised when no connection becomes free before the checkout timeout'''
+
+
+class ConnectionPool:
+    '''Thread-safe pool of MariaDB connections.
+
+    `minSize` connections are opened up front and more are opened on demand, up to `maxSize`.
+    Connections are pinged on checkout and reconnected if the server has dropped them.
+    onReset(conn) is called when a connection is reconnected or closed, which loses its session state
+    (such as prepared statements).
+    '''
+    def __init__(self, connectArgs: dict, minSize=2, maxSize=10, timeout=30, onReset=None):
+        if minSize < 0 or maxSize < 1 or minSize > maxSize:
+            raise ValueError(f'Invalid pool size (min={minSize}, max={maxSize})')
+        self.connectArgs = connectArgs
+        self.minSize = minSize
+        self.maxSize = maxSize
+        self.timeout = timeout
+        self.onReset = onReset
+        self._idle: queue.LifoQueue = queue.LifoQueue() # LIFO keeps the most recently used connections warm
+        self._lock = threading.Lock()
+        self._size = 0 # Connections currently open (idle + checked out)
+
+        for _ in range(minSize):
+            self._idle.put(self._open())
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def idle(self):
+        return self._idle.qsize()
+
+    def _open(self):
+        '''Open a new connection, reserving a slot in the pool first'''
+        with self._lock:
+            if self._size >= self.maxSize:
+                return None
+            self._size += 1
+        try:
+            return mariadb.connect(**self.connectArgs)
+        except mariadb.Error:
+            with self._lock:
+                self._size -= 1
+            raise
+
+    def _discard(self, conn: mariadb.Connection):
+        '''Close a broken connection and free its slot'''
+        if self.onReset is not None:
+            self.onReset(conn)
+        try:
+            conn.close()
+        except mariadb.Error:
+            pass
+        with self._lock:
+            self._size -= 1
+
+    def _checkHealth(self, conn: mariadb.Connection):
+        '''Ping the connection, reconnecting or replacing it if it went stale'''
+        try:
+            conn.ping()
+            return conn
+        except mariadb.Error:
+            pass
+        if self.onReset is not None:
+            self.onReset(conn)
+        try:
+            conn.reconnect()
+            return conn
+        except mariadb.Error:
+            self._discard(conn)
+        return self._open()
+
+    def acquire(self):
+        '''Check out a connection, blocking up to `timeout` seconds if the pool is exhausted'''
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._open()
+            if conn is not None:
+                return conn
+            try:
+                conn = self._idle.get(timeout=self.timeout)
+            except queue.Empty:
+                raise PoolExhaustedError(f'No connection available after {self.timeout}s ({self.maxSize} in use)')
+        conn = self._checkHealth(conn)
+        if conn is None: # Could not replace a dead connection because the pool refilled meanwhile
+            return self.acquire()
+        return conn
+
+    def release(self, conn: mariadb.Connection):
+        '''Return a connection to the pool. Uncommitted work is rolled back.'''
+        try:
+            conn.rollback()
+        except mariadb.Error:
+            self._discard(conn)
+            return
+        self._idle.put(conn)
+
+    def close(self):
+        '''Close all idle connections'''
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
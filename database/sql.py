@@ -0,0 +1,573 @@
+'''Queries and bookkeeping shared by the SQL backends (MariaDB and SQLite).
+
+SQLBackend holds every statement both databases run the same way. Subclasses provide the
+connection handling (`_connection`, `_cursor`, `release`) and the few dialect differences
+as class attributes and hooks: upsert clauses, the week start expression, row locking,
+the current UTC time and IN list placeholders.
+'''
+import logging
+from collections import Counter
+from datetime import date, datetime, timedelta
+from itertools import islice
+
+from database.backend import ARCHIVE_BATCH_SIZE, DatabaseBackend
+from database.errors import FulfillmentConflictError
+from database.models import BloodDonation, BloodInventory, BloodRequest, Branch, Donor, User
+from database.paging import PAGE_SIZE, pageFromRows
+
+TABLE_DONOR = 'Donor'
+TABLE_BLOODTYPE = 'BloodType'
+TABLE_DONATION = 'BloodDonation'
+TABLE_REQUEST = 'BloodRequest'
+TABLE_USER = 'User'
+TABLE_ROLE = 'Role'
+TABLE_BRANCH = 'Branch'
+TABLE_INVENTORY = 'BloodInventory'
+TABLE_WEEKLY_STAT = 'DonationWeeklyStat'
+TABLE_APPLIED_WRITE = 'AppliedWrite'
+TABLE_DONATION_ARCHIVE = 'BloodDonationArchive'
+TABLE_DATA_VERSION = 'DataVersion'
+
+# Columns shared by BloodDonation and BloodDonationArchive
+DONATION_COLUMNS = 'id, nric, quantity, date, branchId, recordedBy, usedBy, bloodTypeId'
+
+# Rows sent per executemany call by bulk inserts
+BULK_CHUNK_SIZE = 1000
+
+logger = logging.getLogger(__name__)
+
+
+class SQLBackend(DatabaseBackend):
+    # DB-API module of the database driver (for its exception classes)
+    driver = None
+    # Clauses that add to an existing BloodInventory / DonationWeeklyStat row instead of failing on the key
+    UPSERT_INVENTORY = ''
+    UPSERT_WEEKLY_STAT = ''
+    # Monday of the week of a DATETIME column, as a DATE
+    WEEK_START = ''
+    # Suffix of SELECT statements that lock the rows they read until the transaction ends
+    LOCK_ROWS = ''
+    # Current UTC time, as stored in DATETIME columns
+    UTC_NOW = ''
+
+    def _inList(self, values):
+        '''Placeholders and parameters for `column IN (...)`
+        Returns: (placeholders, tuple of parameters)
+        '''
+        values = tuple(values)
+        return ','.join(['?'] * len(values)), values
+
+    def _beginWrite(self):
+        '''Start the transaction of a read-check-write sequence (fulfillRequest).
+        Backends that lock rows with LOCK_ROWS need nothing here.
+        '''
+
+    def commit(self):
+        '''Commit the current transaction, then the versions of the collections it changed (see _bumpVersions)'''
+        self._connection.commit()
+        self._commitVersions()
+
+    def rollback(self):
+        '''Roll back the current transaction and drop its version bumps'''
+        self._local.pendingVersions = None
+        self._connection.rollback()
+
+    def getUserById(self, id):
+        '''Query user by id'''
+        self._cursor.execute(f'''
+            SELECT u.id, u.username, u.password, u.name, u.branchId, r.name FROM {TABLE_USER} u
+            INNER JOIN {TABLE_ROLE} r ON u.roleId=r.id
+            WHERE u.id=?
+        ''', (id,))
+        res = self._cursor.fetchone()
+        if res is None:
+            return None
+        return User(*res)
+
+    def login(self, username, password):
+        '''User authentication. Return the user if successful or None'''
+        self._cursor.execute(f'''
+            SELECT u.id, u.username, u.password, u.name, u.branchId, r.name FROM {TABLE_USER} u
+            INNER JOIN {TABLE_ROLE} r ON u.roleId=r.id
+            WHERE u.username=? AND u.password=?
+        ''', (username, password))
+        res = self._cursor.fetchone()
+        if res is None:
+            return None
+        return User(*res)
+
+    def register(self, user: User):
+        '''User registration. Return the user if successful or None'''
+        roleId = self.getRoleIdByName(user.role)
+        self._cursor.execute(f'''
+            INSERT INTO {TABLE_USER} (username, password, name, branchId, roleId)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (user.username, user.password, user.name, user.branchId, roleId))
+        self.commit()
+        return self.login(user.username, user.password)
+
+    def getDonorsPage(self, after=None, pageSize=PAGE_SIZE, serialized=False):
+        '''Query one page of donors ordered by NRIC, starting after the given cursor
+        Returns: (list of Donor, next page cursor or None)
+        '''
+        self._cursor.execute(f'''
+            SELECT d.nric, d.name, d.dateOfBirth, d.contactNo, bt.type, d.registrationDate FROM {TABLE_DONOR} d
+            INNER JOIN {TABLE_BLOODTYPE} bt ON d.bloodTypeId=bt.id
+            WHERE d.nric > ?
+            ORDER BY d.nric
+            LIMIT ?
+        ''', (after or '', pageSize + 1))
+        return pageFromRows(Donor, self._cursor.fetchall(), pageSize, lambda d: d[0], serialized)
+
+    def getDonorByNRIC(self, nric: str):
+        '''Query one donor by NRIC'''
+        self._cursor.execute(f'''
+            SELECT d.nric, d.name, d.dateOfBirth, d.contactNo, bt.type, d.registrationDate FROM {TABLE_DONOR} d
+            INNER JOIN {TABLE_BLOODTYPE} bt ON d.bloodTypeId=bt.id
+            WHERE nric=?
+        ''', (nric,))
+        res = self._cursor.fetchone()
+        if res is None:
+            return None
+        return Donor(*res)
+
+    def insertDonor(self, donor: Donor, idempotencyKey=None):
+        '''Insert new Donor'''
+        if not self._claimWrite(idempotencyKey):
+            return
+        bloodTypeId = self.getBloodTypeId(donor.bloodType)
+        statement = f'''
+            INSERT INTO {TABLE_DONOR} (nric, name, dateOfBirth, contactNo, bloodTypeId, registrationDate)
+            VALUES (?, ?, ?, ?, ?, ?)
+        '''
+        # Errors propagate, so that the caller (or the write-behind queue) does not count the write as applied
+        self._cursor.execute(statement, donor.toTuple(bloodTypeId))
+        self._bumpVersions('donor')
+
+    def updateDonor(self, donor: Donor):
+        '''Update existing Donor'''
+        bloodTypeId = self.getBloodTypeId(donor.bloodType)
+        # Move the donor's unused blood to the new blood type in the inventory
+        self._adjustInventory('bd.nric=?', (donor.nric,), -1)
+        self._cursor.execute(f'''
+            UPDATE {TABLE_DONOR}
+            SET name=?, dateOfBirth=?, contactNo=?, bloodTypeId=?
+            WHERE nric=?
+        ''', (donor.name, donor.dateOfBirth, donor.contactNo, bloodTypeId, donor.nric))
+        self._cursor.execute(f'UPDATE {TABLE_DONATION} SET bloodTypeId=? WHERE nric=?', (bloodTypeId, donor.nric))
+        self._cursor.execute(f'UPDATE {TABLE_DONATION_ARCHIVE} SET bloodTypeId=? WHERE nric=?', (bloodTypeId, donor.nric))
+        self._adjustInventory('bd.nric=?', (donor.nric,), 1)
+        self._bumpVersions('donor', 'donation') # Donation listings show the donor's blood type
+
+    def deleteDonorByNRIC(self, nric: str):
+        '''Delete donor by NRIC'''
+        # Donations are deleted along with the donor
+        self._adjustInventory('bd.nric=?', (nric,), -1)
+        self._adjustWeeklyStats('bd.nric=?', (nric,), -1)
+        self._adjustWeeklyStats('bd.nric=?', (nric,), -1, TABLE_DONATION_ARCHIVE)
+        self._cursor.execute(f'DELETE FROM {TABLE_DONATION_ARCHIVE} WHERE nric=?', (nric,))
+        self._cursor.execute(f'DELETE FROM {TABLE_DONOR} WHERE nric=?', (nric,))
+        self._bumpVersions('donor', 'donation')
+
+    def getDonationsPage(self, after=None, pageSize=PAGE_SIZE, serialized=False):
+        '''Query one page of blood donations, newest first, starting after the given cursor
+        Returns: (list of BloodDonation, next page cursor or None)
+        '''
+        condition = ''
+        data = ()
+        if after:
+            # Keyset on (date DESC, id ASC), matching the ORDER BY and IDX_BloodDonation_date_id
+            afterDate, afterId = after.rsplit('|', 1)
+            afterDate = datetime.fromisoformat(afterDate)
+            condition = 'WHERE bd.date < ? OR (bd.date = ? AND bd.id > ?)'
+            data = (afterDate, afterDate, int(afterId))
+        self._cursor.execute(f'''
+            SELECT bd.id, bd.nric, bd.quantity, bd.date, bd.branchId, bd.recordedBy, bd.usedBy, b.name, u.username, bt.type
+                FROM {TABLE_DONATION} bd
+            INNER JOIN {TABLE_BRANCH} b ON bd.branchId=b.id
+            LEFT JOIN {TABLE_USER} u ON bd.recordedBy=u.id
+            INNER JOIN {TABLE_BLOODTYPE} bt ON bd.bloodTypeId=bt.id
+            {condition}
+            ORDER BY bd.date DESC, bd.id
+            LIMIT ?
+        ''', data + (pageSize + 1,))
+        return pageFromRows(BloodDonation, self._cursor.fetchall(), pageSize, lambda bd: f'{bd[3].isoformat()}|{bd[0]}', serialized)
+
+    def getDonationsIdsByRequestId(self, id, includeArchive=False):
+        '''Query all blood donation ids used to fulfill the request with given id.'''
+        self._cursor.execute(f'SELECT id FROM {self._donationTable(includeArchive)} bd WHERE usedBy=?', (id,))
+        return [r[0] for r in self._cursor.fetchall()]
+
+    @staticmethod
+    def _donationTable(includeArchive):
+        '''Donation rows to query: BloodDonation, or BloodDonation and the archive'''
+        if not includeArchive:
+            return TABLE_DONATION
+        return f'''(
+            SELECT {DONATION_COLUMNS} FROM {TABLE_DONATION}
+            UNION ALL
+            SELECT {DONATION_COLUMNS} FROM {TABLE_DONATION_ARCHIVE})'''
+
+    def _availableDonationsQuery(self, bloodTypes=None):
+        '''Statement and parameters of getAvailableDonations, filtering on the donation's own blood type
+        so that the lookup is a range of IDX_BloodDonation_available'''
+        condition = ''
+        data = ()
+        if bloodTypes is not None:
+            placeholders, data = self._inList(self.getBloodTypeId(bloodType) for bloodType in bloodTypes)
+            condition = f'AND bd.bloodTypeId IN ({placeholders})'
+        return f'''
+            SELECT bd.id, bd.nric, bd.quantity, bd.date, bd.branchId, bd.recordedBy, bd.usedBy, NULL, NULL, bt.type
+                FROM {TABLE_DONATION} bd
+            INNER JOIN {TABLE_BLOODTYPE} bt ON bd.bloodTypeId=bt.id
+            WHERE bd.usedBy IS NULL {condition}
+            ORDER BY bd.date, bd.id
+        ''', data
+
+    def getAvailableDonations(self, bloodTypes=None):
+        '''Query donation records not yet used for request fulfillment, oldest first, with their blood type.
+        bloodTypes: only return donations of these blood types (default all)
+        '''
+        self._cursor.execute(*self._availableDonationsQuery(bloodTypes))
+        return [BloodDonation(*d) for d in self._cursor.fetchall()]
+
+    def insertDonation(self, donation: BloodDonation, idempotencyKey=None):
+        if not self._claimWrite(idempotencyKey):
+            return None
+        statement = f'''
+            INSERT INTO {TABLE_DONATION} (id, nric, quantity, date, branchId, recordedBy, bloodTypeId)
+            VALUES (?, ?, ?, ?, ?, ?, (SELECT bloodTypeId FROM {TABLE_DONOR} WHERE nric=?))
+        '''
+        data = (donation.id or None,) + donation.toTuple()[1:] + (donation.nric,)
+        self._cursor.execute(statement, data)
+        id = donation.id or self._cursor.lastrowid
+        self._adjustInventory('bd.id=?', (id,), 1)
+        self._adjustWeeklyStats('bd.id=?', (id,), 1)
+        self._bumpVersions('donation')
+        return id
+
+    def bulkInsertDonations(self, donations, chunkSize=BULK_CHUNK_SIZE):
+        '''Insert many donations in one transaction, sending chunkSize rows per executemany call.
+        donations can be any iterable (e.g. a generator over a CSV file); it is consumed lazily.
+        Returns: number of donations inserted
+        '''
+        statement = f'''
+            INSERT INTO {TABLE_DONATION} (id, nric, quantity, date, branchId, recordedBy, usedBy, bloodTypeId)
+            VALUES (?, ?, ?, ?, ?, ?, ?, (SELECT bloodTypeId FROM {TABLE_DONOR} WHERE nric=?))
+        '''
+        inventory = Counter() # { (branchId, nric): unused quantity }
+        weeklyCount = Counter() # { week start: donations }
+        weeklyQty = Counter() # { week start: quantity }
+        count = 0
+        donations = iter(donations)
+        try:
+            while True:
+                chunk = list(islice(donations, chunkSize))
+                if not chunk:
+                    break
+                self._cursor.executemany(statement, [(d.id or None,) + d.toTuple()[1:] + (d.usedBy, d.nric) for d in chunk])
+                for d in chunk:
+                    if d.usedBy is None:
+                        inventory[(d.branchId, d.nric)] += int(d.quantity)
+                    week = (d.date - timedelta(days=d.date.weekday())).date()
+                    weeklyCount[week] += 1
+                    weeklyQty[week] += int(d.quantity)
+                count += len(chunk)
+
+            # Update the materialized inventory and weekly counters once per group, not per row
+            if inventory:
+                self._cursor.executemany(f'''
+                    INSERT INTO {TABLE_INVENTORY} (branchId, bloodTypeId, quantity)
+                        SELECT ?, d.bloodTypeId, ? FROM {TABLE_DONOR} d WHERE d.nric=?
+                    {self.UPSERT_INVENTORY}
+                ''', [(branchId, qty, nric) for (branchId, nric), qty in inventory.items()])
+            if weeklyCount:
+                self._cursor.executemany(f'''
+                    INSERT INTO {TABLE_WEEKLY_STAT} (weekStart, donationCount, quantity) VALUES (?, ?, ?)
+                    {self.UPSERT_WEEKLY_STAT}
+                ''', [(week, weeklyCount[week], weeklyQty[week]) for week in weeklyCount])
+            self._bumpVersions('donation')
+            self.commit()
+        except Exception:
+            self.rollback()
+            raise
+        return count
+
+    def getRequestsPage(self, after=None, pageSize=PAGE_SIZE, serialized=False):
+        '''Query one page of blood requests ordered by id, starting after the given cursor
+        Returns: (list of BloodRequest, next page cursor or None)
+        '''
+        self._cursor.execute(f'''
+            SELECT br.id, br.requesterId, bt.type, br.quantity, br.date, br.address,
+                br.status, br.fulfilled, u.username FROM {TABLE_REQUEST} br
+            INNER JOIN {TABLE_BLOODTYPE} bt ON br.bloodTypeId=bt.id
+            INNER JOIN {TABLE_USER} u ON br.requesterId=u.id
+            WHERE br.id > ?
+            ORDER BY br.id
+            LIMIT ?
+        ''', (int(after or 0), pageSize + 1))
+        return pageFromRows(BloodRequest, self._cursor.fetchall(), pageSize, lambda br: str(br[0]), serialized)
+
+    def getPendingRequests(self):
+        '''Query blood requests that are not fulfilled yet, oldest first'''
+        self._cursor.execute(f'''
+            SELECT br.id, br.requesterId, bt.type, br.quantity, br.date, br.address,
+                br.status, br.fulfilled, u.username FROM {TABLE_REQUEST} br
+            INNER JOIN {TABLE_BLOODTYPE} bt ON br.bloodTypeId=bt.id
+            INNER JOIN {TABLE_USER} u ON br.requesterId=u.id
+            WHERE br.fulfilled=0
+            ORDER BY br.date, br.id
+        ''')
+        return [BloodRequest(*br) for br in self._cursor.fetchall()]
+
+    def getRequestById(self, id):
+        '''Query blood request by request id, or None if it does not exist'''
+        self._cursor.execute(f'''
+            SELECT br.id, br.requesterId, bt.type, br.quantity, br.date, br.address,
+                br.status, br.fulfilled, u.username FROM {TABLE_REQUEST} br
+            INNER JOIN {TABLE_BLOODTYPE} bt ON br.bloodTypeId=bt.id
+            INNER JOIN {TABLE_USER} u ON br.requesterId=u.id
+            WHERE br.id=?
+        ''', (id,))
+        res = self._cursor.fetchone()
+        if res is None:
+            return None
+        return BloodRequest(*res)
+
+    def insertRequest(self, req: BloodRequest):
+        bloodTypeId = self.getBloodTypeId(req.bloodType)
+        statement = f'''
+            INSERT INTO {TABLE_REQUEST} (id, requesterId, bloodTypeId, quantity, date, address, status, fulfilled)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        '''
+        self._cursor.execute(statement, req.toTuple(bloodTypeId))
+        id = self._cursor.lastrowid
+        self._bumpVersions('request')
+        return id
+
+    def fulfillRequest(self, requestId: str, donationIds: list[str]):
+        '''Mark blood request as fulfilled using one or more blood donations.
+        The request and donations are locked while they are checked, so concurrent fulfillments
+        cannot use the same donation. Raises FulfillmentConflictError (after rolling back the
+        current transaction) if the request or a donation is missing or already used.
+        '''
+        try:
+            return self._fulfillRequest(int(requestId), sorted(set(map(int, donationIds))))
+        except FulfillmentConflictError:
+            self.rollback()
+            raise
+
+    def _fulfillRequest(self, requestId: int, donationIds: list[int]):
+        self._beginWrite()
+        # Lock the request first and the donations in id order, the same order in every transaction
+        self._cursor.execute(f'SELECT fulfilled FROM {TABLE_REQUEST} WHERE id=?{self.LOCK_ROWS}', (requestId,))
+        res = self._cursor.fetchone()
+        if res is None:
+            raise FulfillmentConflictError(f'Blood request {requestId} does not exist')
+        if res[0]:
+            raise FulfillmentConflictError(f'Blood request {requestId} is already fulfilled')
+
+        placeholders, ids = self._inList(donationIds)
+        self._cursor.execute(f'''
+            SELECT id, usedBy FROM {TABLE_DONATION}
+            WHERE id IN ({placeholders})
+            ORDER BY id{self.LOCK_ROWS}
+        ''', ids)
+        usedBy = dict(self._cursor.fetchall())
+        conflicts = [str(id) for id in donationIds if id not in usedBy or usedBy[id] is not None]
+        if conflicts:
+            raise FulfillmentConflictError('Donations are missing or already used', conflicts)
+
+        self._adjustInventory(f'bd.id IN ({placeholders})', ids, -1)
+        self._cursor.execute(f'''
+            UPDATE {TABLE_DONATION}
+            SET usedBy=?
+            WHERE id IN ({placeholders}) AND usedBy IS NULL
+        ''', (requestId,) + ids)
+        # The rows are locked, so this only fails if the locking above is broken
+        assert(self._cursor.rowcount == len(donationIds))
+
+        self._cursor.execute(f'''
+            UPDATE {TABLE_REQUEST}
+            SET status=?, fulfilled=?
+            WHERE id=?
+        ''', ('Delivered', 1, requestId))
+        self._bumpVersions('donation', 'request')
+
+    def getAllBranches(self):
+        '''Query list of all blood bank branches (cached)'''
+        def load():
+            self._cursor.execute(f'SELECT id, name, address, postalCode FROM {TABLE_BRANCH}')
+            return [Branch(*br) for br in self._cursor.fetchall()]
+        return self.refCache.get('branches', load)
+
+    def getRoleIdByName(self, roleName):
+        '''Query role id by its name (cached)'''
+        def load():
+            self._cursor.execute(f'SELECT id FROM {TABLE_ROLE} WHERE name=?', (roleName,))
+            return self._cursor.fetchone()[0]
+        return self.refCache.get(('roleId', roleName), load)
+
+    def getBloodTypeId(self, bloodType):
+        '''Query the id of a blood type (e.g. A+) (cached)'''
+        def load():
+            self._cursor.execute(f'SELECT id FROM {TABLE_BLOODTYPE} WHERE type=?', (bloodType,))
+            res = self._cursor.fetchone()
+            return res[0] if res is not None else None
+        return self.refCache.get(('bloodTypeId', bloodType), load)
+
+    def getAnalyticsRows(self, includeArchive=False):
+        '''Query (date, quantity, branchId, blood type, usedBy) of every donation, for analytics'''
+        self._cursor.execute(f'''
+            SELECT bd.date, bd.quantity, bd.branchId, bt.type, bd.usedBy FROM {self._donationTable(includeArchive)} bd
+            INNER JOIN {TABLE_BLOODTYPE} bt ON bd.bloodTypeId=bt.id
+        ''')
+        return self._cursor.fetchall()
+
+    def getDashboardCounts(self):
+        '''Query the dashboard figures that do not depend on the branch
+        Returns: (donor count, available blood, pending requests, donations this week, quantity donated this week)
+        '''
+        today = date.today()
+        self._cursor.execute(f'''
+            SELECT
+                (SELECT COUNT(nric) FROM {TABLE_DONOR}),
+                (SELECT COALESCE(SUM(quantity),0) FROM {TABLE_INVENTORY}),
+                (SELECT COUNT(id) FROM {TABLE_REQUEST} WHERE fulfilled=0),
+                COALESCE((SELECT donationCount FROM {TABLE_WEEKLY_STAT} WHERE weekStart=?),0),
+                COALESCE((SELECT quantity FROM {TABLE_WEEKLY_STAT} WHERE weekStart=?),0)
+        ''', (today - timedelta(days=today.weekday()),) * 2)
+        return self._cursor.fetchone()
+
+    def getBloodInventoryByBranchId(self, branchId):
+        '''Query blood inventory data
+        Returns: BloodInventory
+        '''
+        self._cursor.execute(f'''
+            SELECT inv.branchId, bt.type, inv.quantity FROM {TABLE_INVENTORY} inv
+                INNER JOIN {TABLE_BLOODTYPE} bt ON inv.bloodTypeId=bt.id
+                WHERE inv.branchId=?
+        ''', (branchId,))
+        inventories = BloodInventory.fromTupleList(self._cursor.fetchall())
+        if len(inventories) == 0:
+            return BloodInventory(branchId)
+        assert(len(inventories) == 1)
+        return inventories[0]
+
+    def _claimWrite(self, idempotencyKey):
+        '''Record the key of a replayed write in the caller's transaction.
+        Returns: False if a write with this key was already applied
+        '''
+        if idempotencyKey is None:
+            return True
+        try:
+            self._cursor.execute(f'INSERT INTO {TABLE_APPLIED_WRITE} (idempotencyKey) VALUES (?)', (idempotencyKey,))
+        except self.driver.IntegrityError:
+            return False
+        return True
+
+    def _adjustInventory(self, condition: str, data: tuple, sign: int):
+        '''Add (sign=1) or remove (sign=-1) the unused donations matching the condition
+        to/from the materialized inventory. Runs in the caller's transaction, which then holds the lock
+        on the inventory row of each branch and blood type it touched until it ends: writes to the
+        same branch and blood type are serialized, others run concurrently.
+        '''
+        self._cursor.execute(f'''
+            INSERT INTO {TABLE_INVENTORY} (branchId, bloodTypeId, quantity)
+                SELECT bd.branchId, bd.bloodTypeId, ? * SUM(bd.quantity) FROM {TABLE_DONATION} bd
+                WHERE bd.usedBy IS NULL AND ({condition})
+                GROUP BY bd.branchId, bd.bloodTypeId
+            {self.UPSERT_INVENTORY}
+        ''', (sign,) + data)
+
+    def _adjustWeeklyStats(self, condition: str, data: tuple, sign: int, table=TABLE_DONATION):
+        '''Add (sign=1) or remove (sign=-1) the donations matching the condition
+        to/from the weekly donation counters. Runs in the caller's transaction, which then holds the lock
+        on the counter row of the week until it ends: donations recorded in the same week are inserted
+        one transaction at a time. Keep those transactions short (commit right after the insert).
+        table: donation table to read, BloodDonation or BloodDonationArchive
+        '''
+        self._cursor.execute(f'''
+            INSERT INTO {TABLE_WEEKLY_STAT} (weekStart, donationCount, quantity)
+                SELECT {self.WEEK_START.format('bd.date')} AS weekStart, ? * COUNT(bd.id), ? * SUM(bd.quantity)
+                FROM {table} bd
+                WHERE {condition}
+                GROUP BY weekStart
+            {self.UPSERT_WEEKLY_STAT}
+        ''', (sign, sign) + data)
+
+    def archiveDonations(self, before: datetime, batchSize=ARCHIVE_BATCH_SIZE):
+        '''Move donations used by a request and dated before the given time to the archive table,
+        batchSize donations per transaction. Returns: number of donations archived
+        '''
+        count = 0
+        while True:
+            self._cursor.execute(f'''
+                SELECT id FROM {TABLE_DONATION}
+                WHERE usedBy IS NOT NULL AND date < ?
+                ORDER BY id
+                LIMIT ?{self.LOCK_ROWS}
+            ''', (before, batchSize))
+            rows = self._cursor.fetchall()
+            if not rows:
+                return count
+            placeholders, ids = self._inList(r[0] for r in rows)
+            # Used donations are not in the inventory, and the weekly counters include the archive
+            self._cursor.execute(f'''
+                INSERT INTO {TABLE_DONATION_ARCHIVE} ({DONATION_COLUMNS})
+                    SELECT {DONATION_COLUMNS} FROM {TABLE_DONATION} WHERE id IN ({placeholders})
+            ''', ids)
+            self._cursor.execute(f'DELETE FROM {TABLE_DONATION} WHERE id IN ({placeholders})', ids)
+            self._bumpVersions('donation')
+            self.commit()
+            count += len(rows)
+
+    def _bumpVersions(self, *names):
+        '''Mark the given DATA_VERSIONS collections as changed by the caller's transaction.
+        Their versions are incremented by commit(), after the data (see _commitVersions).
+        '''
+        pending = getattr(self._local, 'pendingVersions', None)
+        if pending is None:
+            pending = self._local.pendingVersions = set()
+        pending.update(names)
+
+    def _commitVersions(self):
+        '''Increment the versions marked by _bumpVersions in a short transaction of their own.
+        A collection has a single DataVersion row, so bumping it in the write's transaction would
+        lock it until that commits and serialize every write to the collection. Bumping after the
+        data is committed also means a response is never older than its ETag. If the bump fails,
+        the data stays committed and cached responses are stale until the next write or the
+        query cache TTL.
+        '''
+        names = getattr(self._local, 'pendingVersions', None)
+        if not names:
+            return
+        self._local.pendingVersions = None
+        placeholders, data = self._inList(sorted(names)) # Same lock order in every transaction
+        try:
+            self._cursor.execute(f'''
+                UPDATE {TABLE_DATA_VERSION}
+                SET version=version + 1, updatedAt={self.UTC_NOW}
+                WHERE name IN ({placeholders})
+            ''', data)
+            self._connection.commit()
+        except self.driver.Error as e:
+            self._connection.rollback()
+            logger.warning('Version bump of %s failed: %s', ', '.join(sorted(names)), e)
+
+    def getDataVersion(self, name):
+        '''Query the version of one of the DATA_VERSIONS collections, incremented by every write to it
+        Returns: (version, naive UTC datetime of the last write or None)
+        '''
+        self._cursor.execute(f'SELECT version, updatedAt FROM {TABLE_DATA_VERSION} WHERE name=?', (name,))
+        res = self._cursor.fetchone()
+        return tuple(res) if res is not None else (0, None)
+
+    def rebuildInventory(self):
+        '''Recompute the materialized inventory and weekly counters from the donation records'''
+        self._cursor.execute(f'DELETE FROM {TABLE_INVENTORY}')
+        self._adjustInventory('TRUE', (), 1)
+        self._cursor.execute(f'DELETE FROM {TABLE_WEEKLY_STAT}')
+        self._adjustWeeklyStats('TRUE', (), 1)
+        self._adjustWeeklyStats('TRUE', (), 1, TABLE_DONATION_ARCHIVE)
+        self.commit()
@@ -0,0 +1,134 @@
+import os
+import queue
+import re
+import sqlite3
+import threading
+from datetime import date, datetime
+
+from database.cache import ReferenceCache
+from database.instrumentation import InstrumentedCursor, instrumentation
+from database.sql import TABLE_BLOODTYPE, TABLE_DONATION, TABLE_DONOR, SQLBackend
+
+SCHEMA_FILE = os.path.join(os.path.dirname(__file__), 'generate_database_sqlite.sql')
+DATA_FILE = os.path.join(os.path.dirname(__file__), 'generate_database.sql')
+
+# Prepared statements kept per connection. Statements are built from constants, so their text
+# (the cache key) is the same on every call and each one is only compiled once per connection.
+STATEMENT_CACHE_SIZE = 256
+
+# Store dates as ISO 8601 text and read DATE / DATETIME columns back as date / datetime,
+# the same types the MariaDB connector returns
+sqlite3.register_adapter(date, lambda d: d.isoformat())
+sqlite3.register_adapter(datetime, lambda d: d.isoformat(sep=' '))
+sqlite3.register_converter('DATE', lambda s: datetime.fromisoformat(s.decode()).date())
+sqlite3.register_converter('DATETIME', lambda s: datetime.fromisoformat(s.decode()))
+
+
+class SQLiteBackend(SQLBackend):
+    '''Embedded backend for single-branch and offline deployments.
+
+    The database is a local file (BLOODMGT_SQLITE_PATH) in WAL mode, so requests read
+    concurrently with a writer. It is created with the sample data on first use.
+    '''
+    driver = sqlite3
+    UPSERT_INVENTORY = 'ON CONFLICT (branchId, bloodTypeId) DO UPDATE SET quantity=quantity + excluded.quantity'
+    UPSERT_WEEKLY_STAT = ('ON CONFLICT (weekStart) DO UPDATE SET '
+                          'donationCount=donationCount + excluded.donationCount, quantity=quantity + excluded.quantity')
+    WEEK_START = "DATE({}, '-6 days', 'weekday 1')"
+    UTC_NOW = 'CURRENT_TIMESTAMP'
+
+    def __init__(self, path=None):
+        self.path = path or os.getenv('BLOODMGT_SQLITE_PATH', 'database/bloodmanagementsystem.db')
+        self._local = threading.local() # Per-thread checked out connection and cursor
+        self._idle: queue.LifoQueue = queue.LifoQueue() # Connections (with their statement caches) not in use
+        self.refCache = ReferenceCache.fromEnv('BLOODMGT_REFCACHE') # Branches, blood types and roles
+        self.connect()
+        super().__init__()
+
+    def connect(self):
+        '''Open the database, creating the schema and sample data if it is new'''
+        conn = self._open()
+        isNew = conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table'").fetchone()[0] == 0
+        if not isNew:
+            self._migrate(conn)
+        with open(SCHEMA_FILE) as f:
+            conn.executescript(f.read())
+        if isNew:
+            self._loadSampleData(conn)
+        self._idle.put(conn)
+
+    def _migrate(self, conn: sqlite3.Connection):
+        '''Bring a database file created by an older version up to the current schema'''
+        columns = [row[1] for row in conn.execute(f'PRAGMA table_info({TABLE_DONATION})')]
+        if 'bloodTypeId' not in columns:
+            # Blood type on each donation (migrations/003_donation_blood_type.sql); the new index is created by the schema
+            conn.executescript(f'''
+                BEGIN;
+                ALTER TABLE {TABLE_DONATION} ADD COLUMN bloodTypeId INTEGER NULL REFERENCES {TABLE_BLOODTYPE} (id);
+                UPDATE {TABLE_DONATION} SET bloodTypeId=(SELECT bloodTypeId FROM {TABLE_DONOR} d WHERE d.nric={TABLE_DONATION}.nric);
+                DROP INDEX IF EXISTS IDX_BloodDonation_usedBy;
+                COMMIT;
+            ''')
+
+    def _open(self):
+        conn = sqlite3.connect(self.path, detect_types=sqlite3.PARSE_DECLTYPES, timeout=30,
+                               cached_statements=STATEMENT_CACHE_SIZE, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL') # Durable at checkpoints; safe against corruption in WAL mode
+        conn.execute('PRAGMA foreign_keys=ON')
+        return conn
+
+    def _loadSampleData(self, conn: sqlite3.Connection):
+        '''Run the single-row INSERT statements of generate_database.sql'''
+        insert = re.compile(r'^INSERT INTO .* VALUES \(.*\);$')
+        with open(DATA_FILE) as f:
+            statements = [line.replace('`bloodmanagementsystem`.', '') for line in f if insert.match(line.strip())]
+        conn.executescript('BEGIN;\n' + ''.join(statements) + 'COMMIT;')
+        self._local.connection = conn
+        self._local.cursor = InstrumentedCursor(conn.cursor(), instrumentation)
+        self.rebuildInventory()
+        self._local.connection = None
+        self._local.cursor = None
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        '''Connection checked out by the current thread'''
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._open()
+            self._local.connection = conn
+            self._local.cursor = InstrumentedCursor(conn.cursor(), instrumentation)
+        return conn
+
+    @property
+    def _cursor(self) -> InstrumentedCursor:
+        self._connection
+        return self._local.cursor
+
+    def release(self):
+        '''Return the current thread's connection to the idle list (called when the request ends).
+        Uncommitted work is rolled back.
+        '''
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            return
+        self._local.cursor.close()
+        self._local.connection = None
+        self._local.cursor = None
+        self._local.pendingVersions = None
+        conn.rollback()
+        self._idle.put(conn)
+
+    def _beginWrite(self):
+        if not self._connection.in_transaction:
+            # Take the write lock before checking, so no other writer can use the donations meanwhile
+            self._cursor.execute('BEGIN IMMEDIATE')
+
+    def explainAvailableDonations(self, bloodTypes=None):
+        '''Query plan of getAvailableDonations (EXPLAIN QUERY PLAN), one line per step'''
+        statement, data = self._availableDonationsQuery(bloodTypes)
+        self._cursor.execute('EXPLAIN QUERY PLAN ' + statement, data)
+        return [row[3] for row in self._cursor.fetchall()]
@@ -0,0 +1,112 @@
+'''Reuse of server-side prepared statements on MariaDB connections.
+
+Every pooled connection keeps its prepared statements, keyed by statement text, for as long as it
+stays open. The backend builds its statements from constants, so a query has the same text on every
+call and the server parses it once per connection instead of on every execution. Variable-length
+IN lists are padded to a few fixed sizes by inList, so that they map to a bounded number of statements.
+'''
+import threading
+from collections import OrderedDict
+
+import mariadb
+
+# Prepared statements kept per connection (the server caps the total with max_prepared_stmt_count)
+STATEMENT_CACHE_SIZE = 256
+# IN lists are padded to the next of these sizes, longer lists to a multiple of the largest
+IN_LIST_SIZES = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+
+def inList(values):
+    '''Placeholders and parameters for `column IN (...)`, padded to one of IN_LIST_SIZES
+    by repeating the last value (which does not change the result)
+    Returns: (placeholders, tuple of parameters)
+    '''
+    values = tuple(values)
+    if not values:
+        raise ValueError('IN list is empty')
+    size = next((s for s in IN_LIST_SIZES if s >= len(values)), None)
+    if size is None:
+        largest = IN_LIST_SIZES[-1]
+        size = -(-len(values) // largest) * largest
+    return ','.join(['?'] * size), values + (values[-1],) * (size - len(values))
+
+
+class StatementStats:
+    '''Prepared statement cache counters, shared by all connections of a backend'''
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def add(self, hits=0, misses=0, evictions=0):
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.evictions += evictions
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+
+class PreparedCursor:
+    '''Cursor of one connection that runs each distinct statement on its own prepared cursor,
+    so that the statement is only prepared the first time it is executed on the connection.
+    Fetches and attributes such as rowcount and lastrowid refer to the last executed statement.
+    '''
+    def __init__(self, conn: mariadb.Connection, stats: StatementStats, maxsize=STATEMENT_CACHE_SIZE):
+        self._conn = conn
+        self._stats = stats
+        self._maxsize = maxsize
+        self._cursors = OrderedDict() # { statement: prepared cursor }, least recently used first
+        self._current = None
+
+    def _prepared(self, statement):
+        cursor = self._cursors.get(statement)
+        if cursor is not None:
+            self._cursors.move_to_end(statement)
+            self._stats.add(hits=1)
+            return cursor
+        self._stats.add(misses=1)
+        cursor = self._conn.cursor(prepared=True)
+        self._cursors[statement] = cursor
+        if len(self._cursors) > self._maxsize:
+            _, evicted = self._cursors.popitem(last=False)
+            self._close(evicted)
+            self._stats.add(evictions=1)
+        return cursor
+
+    @staticmethod
+    def _close(cursor):
+        try:
+            cursor.close()
+        except mariadb.Error:
+            pass
+
+    def execute(self, statement, data=()):
+        self._current = self._prepared(statement)
+        return self._current.execute(statement, data)
+
+    def executemany(self, statement, data):
+        self._current = self._prepared(statement)
+        return self._current.executemany(statement, data)
+
+    def fetchone(self):
+        return self._current.fetchone()
+
+    def fetchmany(self, size=1):
+        return self._current.fetchmany(size)
+
+    def fetchall(self):
+        return self._current.fetchall()
+
+    def close(self):
+        '''Close every prepared statement of the connection'''
+        for cursor in self._cursors.values():
+            self._close(cursor)
+        self._cursors.clear()
+        self._current = None
+
+    def __getattr__(self, name):
+        return getattr(self._current, name)
@@ -0,0 +1,247 @@
+'''Write-behind queue for branches with a slow or unreliable link to the central database.
+
+New donors and donations are stored in a local SQLite file and acknowledged at once. A background
+thread replays them to the central backend in batches. Every write carries an idempotency key, so
+a batch that is replayed again after a failure (e.g. the link dropped before the commit was
+acknowledged) is only applied once.
+'''
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import date, datetime
+
+from database.models import BloodDonation, Donor
+
+logger = logging.getLogger(__name__)
+
+# A write that fails this many times is set aside as failed, so it does not hold back the queue
+MAX_ATTEMPTS = 20
+# Longest wait between sync attempts while the central database is failing (seconds)
+MAX_BACKOFF = 300
+
+# Operation -> (model class, fields stored in the queue, date fields)
+OPERATIONS = {
+    'insertDonor': (Donor, ['nric', 'name', 'dateOfBirth', 'contactNo', 'bloodType', 'registrationDate'],
+                    ['dateOfBirth', 'registrationDate']),
+    'insertDonation': (BloodDonation, ['nric', 'quantity', 'date', 'branchId', 'recordedBy'], ['date']),
+}
+
+
+def _encode(operation, obj):
+    _, fields, _ = OPERATIONS[operation]
+    data = {field: getattr(obj, field) for field in fields}
+    return json.dumps({k: v.isoformat() if isinstance(v, (date, datetime)) else v for k, v in data.items()})
+
+
+def _decode(operation, payload):
+    cls, fields, dateFields = OPERATIONS[operation]
+    data = json.loads(payload)
+    for field in dateFields:
+        if data.get(field):
+            data[field] = datetime.fromisoformat(data[field])
+    return cls.fromDict(data)
+
+
+class QueuedWrite:
+    def __init__(self, seq, idempotencyKey, operation, payload, queuedAt, attempts):
+        self.seq = seq
+        self.idempotencyKey = idempotencyKey
+        self.operation = operation
+        self.payload = payload
+        self.queuedAt = queuedAt
+        self.attempts = attempts
+
+    def toModel(self):
+        return _decode(self.operation, self.payload)
+
+
+class WriteQueue:
+    '''Durable FIFO of writes waiting to be sent to the central database, stored in a SQLite file'''
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=FULL') # A queued write is acknowledged, so it must survive a power loss
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS PendingWrite (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                idempotencyKey TEXT NOT NULL UNIQUE,
+                operation TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                queuedAt REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lastError TEXT,
+                failed INTEGER NOT NULL DEFAULT 0)
+        ''')
+
+    def put(self, operation, obj):
+        '''Append a write. Returns: its idempotency key'''
+        key = str(uuid.uuid4())
+        with self._lock:
+            self._conn.execute('''
+                INSERT INTO PendingWrite (idempotencyKey, operation, payload, queuedAt) VALUES (?, ?, ?, ?)
+            ''', (key, operation, _encode(operation, obj), time.time()))
+        return key
+
+    def peek(self, limit):
+        '''Oldest writes still to be sent, at most limit'''
+        with self._lock:
+            rows = self._conn.execute('''
+                SELECT seq, idempotencyKey, operation, payload, queuedAt, attempts FROM PendingWrite
+                WHERE failed=0 ORDER BY seq LIMIT ?
+            ''', (limit,)).fetchall()
+        return [QueuedWrite(*row) for row in rows]
+
+    def remove(self, seqs):
+        '''Delete writes that were applied to the central database'''
+        with self._lock:
+            self._conn.executemany('DELETE FROM PendingWrite WHERE seq=?', [(seq,) for seq in seqs])
+
+    def recordFailure(self, seq, error):
+        '''Count a failed attempt, setting the write aside after MAX_ATTEMPTS'''
+        with self._lock:
+            self._conn.execute('''
+                UPDATE PendingWrite SET attempts=attempts + 1, lastError=?, failed=(attempts + 1 >= ?) WHERE seq=?
+            ''', (str(error), MAX_ATTEMPTS, seq))
+
+    def retryFailed(self):
+        '''Put writes that were set aside back in the queue. Returns: number of writes'''
+        with self._lock:
+            return self._conn.execute('UPDATE PendingWrite SET failed=0, attempts=0 WHERE failed=1').rowcount
+
+    def stats(self):
+        '''Returns: { pending, failed, lagSeconds } where lagSeconds is the age of the oldest pending write'''
+        with self._lock:
+            pending, failed, oldest = self._conn.execute('''
+                SELECT COALESCE(SUM(failed=0), 0), COALESCE(SUM(failed=1), 0), MIN(CASE WHEN failed=0 THEN queuedAt END)
+                FROM PendingWrite
+            ''').fetchone()
+        return {
+            'pending': pending,
+            'failed': failed,
+            'lagSeconds': time.time() - oldest if oldest is not None else 0,
+        }
+
+
+class WriteBehindBackend:
+    '''Wraps a backend so that insertDonor and insertDonation return as soon as the write is queued
+    locally. Queued writes are replayed to the wrapped backend by a background thread; everything
+    else, including reads, goes straight to the wrapped backend. Reads do not see queued writes
+    until they are synced.
+    '''
+    def __init__(self, backend, queue: WriteQueue, interval=5, batchSize=100):
+        self.backend = backend
+        self.queue = queue
+        self.interval = interval
+        self.batchSize = batchSize
+        self.lastSyncAt = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def fromEnv(backend):
+        '''Wrap the backend if BLOODMGT_WRITE_QUEUE names a queue file, starting the sync thread.
+        The sync interval and batch size are read from BLOODMGT_WRITE_QUEUE_INTERVAL and _BATCH.
+        '''
+        path = os.getenv('BLOODMGT_WRITE_QUEUE')
+        if not path:
+            return backend
+        writeBehind = WriteBehindBackend(
+            backend, WriteQueue(path),
+            interval=float(os.getenv('BLOODMGT_WRITE_QUEUE_INTERVAL', 5)),
+            batchSize=int(os.getenv('BLOODMGT_WRITE_QUEUE_BATCH', 100)))
+        writeBehind.start()
+        return writeBehind
+
+    def __getattr__(self, name):
+        return getattr(self.backend, name)
+
+    def insertDonor(self, donor: Donor):
+        '''Queue a new Donor. Returns: the idempotency key of the write'''
+        return self.queue.put('insertDonor', donor)
+
+    def insertDonation(self, donation: BloodDonation):
+        '''Queue a new donation. Returns: the idempotency key of the write, which stands in for
+        the donation id until it is synced
+        '''
+        return self.queue.put('insertDonation', donation)
+
+    def _apply(self, write: QueuedWrite):
+        getattr(self.backend, write.operation)(write.toModel(), idempotencyKey=write.idempotencyKey)
+
+    def syncBatch(self):
+        '''Send the oldest queued writes to the central database in one transaction.
+        If the batch fails, its writes are retried one at a time so that a single bad write
+        only holds back itself; it stops at the first write that still fails.
+        Returns: (number of writes applied, whether all of them succeeded)
+        '''
+        writes = self.queue.peek(self.batchSize)
+        if not writes:
+            return 0, True
+        try:
+            try:
+                for write in writes:
+                    self._apply(write)
+                self.backend.commit()
+                self.queue.remove([w.seq for w in writes])
+                self.lastSyncAt = time.time()
+                return len(writes), True
+            except Exception:
+                self.backend.release() # Roll back the partial batch
+            applied = 0
+            for write in writes:
+                try:
+                    self._apply(write)
+                    self.backend.commit()
+                except Exception as e:
+                    self.backend.release()
+                    self.queue.recordFailure(write.seq, e)
+                    logger.warning('Sync of queued %s %s failed: %s', write.operation, write.idempotencyKey, e)
+                    return applied, False
+                self.queue.remove([write.seq])
+                self.lastSyncAt = time.time()
+                applied += 1
+            return applied, True
+        finally:
+            self.backend.release()
+
+    def sync(self):
+        '''Send queued writes until the queue is empty or a write fails. Returns: (applied, ok)'''
+        total = 0
+        while True:
+            applied, ok = self.syncBatch()
+            total += applied
+            if not ok or applied < self.batchSize:
+                return total, ok
+
+    def _run(self):
+        backoff = self.interval
+        while not self._stop.is_set():
+            try:
+                _, ok = self.sync()
+            except Exception as e: # e.g. the central database is unreachable
+                logger.warning('Sync of queued writes failed: %s', e)
+                ok = False
+            backoff = self.interval if ok else min(backoff * 2, MAX_BACKOFF)
+            self._stop.wait(backoff)
+
+    def start(self):
+        '''Start syncing in a background thread'''
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='write-queue-sync', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self):
+        '''Queue stats plus lastSyncAt (epoch seconds of the last write applied, or None)'''
+        return dict(self.queue.stats(), lastSyncAt=self.lastSyncAt)
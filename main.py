@@ -1,16 +1,28 @@
+import asyncio
+import codecs
 from datetime import datetime
 
-from flask import (Flask, flash, jsonify, redirect, render_template, request,
-                   url_for)
+from flask import (Flask, Response, flash, jsonify, redirect, render_template, request,
+                   stream_with_context, url_for)
 from flask_login import (LoginManager, current_user, login_required,
                          login_user, logout_user)
 from flask_wtf import FlaskForm
 from wtforms import PasswordField, StringField
+from werkzeug.http import is_resource_modified
 from wtforms.validators import InputRequired, Length
 
-from database.firebase import FirebaseBackend
-from database.mariadb import MariaDBBackend
+from database.aio import AsyncBackend
+from database.analytics import DonationAnalytics
+from database.backend import DATA_VERSIONS, getBackend
+from database.cache import ReferenceCache
+from database.errors import FulfillmentConflictError
+from database.importer import importDonations, readDonationsCsv
+from database.instrumentation import instrumentation
+from database.matching import COMPATIBLE_DONORS, allocateRequests
 from database.models import BloodDonation, BloodRequest, DashboardData, Donor, User
+from database.paging import MAX_PAGE_SIZE, clampPageSize
+from database.serialization import dumps, jsonResponse
+from database.writequeue import WriteBehindBackend
 
 # Setup flask
 app = Flask(__name__) # Create an instance of the flask app and put in variable app
@@ -22,14 +34,44 @@ login_manager.init_app(app)
 login_manager.login_view = 'login'
 login_manager.login_message = ''
 
-# Setup database (only use one of them)
-db = MariaDBBackend()
-#db = FirebaseBackend()
+# Setup database (selected by BLOODMGT_DB_BACKEND, mariadb by default)
+# With BLOODMGT_WRITE_QUEUE set, new donors and donations are queued locally and synced in the background
+db = WriteBehindBackend.fromEnv(getBackend())
+# Async views await the backend through adb, which runs each call on a worker thread
+adb = AsyncBackend.fromEnv(db)
+
+# Collect database stats for each request
+@app.before_request
+def begin_db_stats():
+    instrumentation.begin()
+
+# Report the request's database work to the browser (visible in the dev tools timing tab)
+@app.after_request
+def add_server_timing(response):
+    stats = instrumentation.current
+    if stats is not None:
+        response.headers.add('Server-Timing', f'db;dur={stats.seconds * 1000:.1f};desc="{stats.queries} queries, {stats.rows} rows"')
+    return response
+
+# Return the database connection used by this request to the pool
+@app.teardown_appcontext
+def release_db(exception):
+    instrumentation.end()
+    db.release()
+
+# Logged in users, so that authenticating a request does not need a database query
+userCache = ReferenceCache.fromEnv('BLOODMGT_USERCACHE', maxsize=1024, ttl=60)
 
 # This callback is used by flask login to load the user object from the user id stored in the session
 @login_manager.user_loader
 def load_user(user_id):
-    return db.getUserById(user_id)
+    def load():
+        try:
+            return db.getUserById(user_id)
+        finally:
+            # Return the connection at once: async views then wait on adb without holding one (see AsyncBackend.fromEnv)
+            db.release()
+    return userCache.get(str(user_id), load)
 
 # The form on the login page
 class LoginForm(FlaskForm):
@@ -38,9 +80,9 @@ class LoginForm(FlaskForm):
 
 @app.route('/')
 @login_required
-def home():
+async def home():
     if current_user.role == 'role.staff.bloodbank':
-        data = db.getDashboardStats(current_user.branchId)
+        data = await adb.getDashboardStats(current_user.branchId)
         return render_template('dashboard_staff.html', data=data)
     elif current_user.role == 'role.staff.healthcare':
         return redirect(url_for('bloodrequest'))
@@ -79,6 +121,7 @@ def register():
         newUser = User(None, username, password, name, branchId, role)
         user = db.register(newUser)
         if user is not None:
+            userCache.invalidate(str(user.id))
             login_user(user)
             return jsonify(success=True)
         else:
@@ -122,30 +165,53 @@ def donors():
 
 @app.route('/donations', methods= ['GET', 'POST'])
 @login_required
-def donations():
-    if request.method == 'POST':
-        id = request.form.get('id')
-        nric = request.form.get('nric')
-        quantity = request.form.get('quantity')
-        branchId = request.form.get('branchId')
-        donation = BloodDonation(id, nric, quantity, None, branchId, current_user.id, None)
+async def donations():
+    if request.method == 'POST' and request.args.get('action') == 'bulk':
+        # /donations?action=bulk
+        return await adb.run(bulkImportDonations)
 
-        # Depending on the query string do the respective action
-        try:
-            action = request.args.get('action')
-            if action == 'create':
-                # /donations?action=create
-                donation.date = datetime.now()
-                donation.id = db.insertDonation(donation)
-            db.commit()
-            return jsonify(success=True, data=donation.serialize())
-        except Exception as e:
-            return jsonify(success=False)
+    if request.method == 'POST':
+        # The insert and the commit must use the same connection, so they run together on one worker thread
+        return await adb.run(saveDonation)
 
-    donors = db.getAllDonors()
-    branches = db.getAllBranches()
+    # Both lists are queried concurrently
+    donors, branches = await asyncio.gather(adb.getAllDonors(), adb.getAllBranches())
     return render_template('donations.html', donors=donors, branches=branches)
 
+def saveDonation():
+    '''Create a donation from the submitted form'''
+    id = request.form.get('id')
+    nric = request.form.get('nric')
+    quantity = request.form.get('quantity')
+    branchId = request.form.get('branchId')
+    donation = BloodDonation(id, nric, quantity, None, branchId, current_user.id, None)
+
+    # Depending on the query string do the respective action
+    try:
+        action = request.args.get('action')
+        if action == 'create':
+            # /donations?action=create
+            donation.date = datetime.now()
+            donation.id = db.insertDonation(donation)
+        db.commit()
+        return jsonify(success=True, data=donation.serialize())
+    except Exception as e:
+        return jsonify(success=False)
+
+def bulkImportDonations():
+    '''Import donations from a CSV file uploaded as form field "file", or sent as a text/csv request body.
+    The upload is parsed and inserted as it streams in.
+    '''
+    upload = request.files.get('file')
+    lines = codecs.iterdecode(upload.stream if upload else request.stream, 'utf-8')
+    try:
+        count, seconds = importDonations(db, readDonationsCsv(lines, recordedBy=current_user.id))
+    except ValueError as e:
+        return jsonify(success=False, error=str(e)), 400
+    except Exception as e:
+        return jsonify(success=False, error=str(e))
+    return jsonify(success=True, count=count, seconds=seconds, rowsPerSecond=count / seconds if seconds else None)
+
 @app.route('/requests', methods= ['GET', 'POST'])
 @login_required
 def requests():
@@ -159,12 +225,43 @@ def requests():
                 donationIds = request.form.getlist('fulfillDonations[]')
                 db.fulfillRequest(requestId, donationIds)
                 db.commit()
+            elif action == 'autofulfill':
+                # /requests?action=autofulfill
+                return autofulfillRequests()
             return jsonify(success=True)
+        except FulfillmentConflictError as e:
+            return jsonify(success=False, error=str(e), conflicts=e.donationIds), 409
         except Exception as e:
             return jsonify(success=False, error=str(e))
 
     return render_template('requests.html')
 
+def autofulfillRequests():
+    '''Fulfill pending requests (form field "id", or all) with compatible donations, oldest first.
+    Form field "branchId" restricts the donations to one branch.
+    '''
+    requestId = request.form.get('id')
+    if requestId:
+        pending = [req for req in [db.getRequestById(requestId)] if req is not None and not req.fulfilled]
+    else:
+        pending = db.getPendingRequests()
+    bloodTypes = sorted({t for req in pending for t in COMPATIBLE_DONORS.get(req.bloodType, [])})
+    donations = db.getAvailableDonations(bloodTypes) if bloodTypes else []
+    allocations, unfilled = allocateRequests(pending, donations, request.form.get('branchId') or None)
+
+    fulfilled = []
+    conflicts = []
+    for allocation in allocations:
+        try:
+            db.fulfillRequest(allocation.request.id, [d.id for d in allocation.donations])
+            db.commit()
+            fulfilled.append(allocation.serialize())
+        except FulfillmentConflictError:
+            # Donations used by someone else meanwhile; the request is picked up by the next run
+            db.release()
+            conflicts.append(allocation.request.id)
+    return jsonify(success=True, fulfilled=fulfilled, unfilled=[req.id for req in unfilled], conflicts=conflicts)
+
 @app.route('/bloodrequest', methods= ['GET', 'POST'])
 @login_required
 def bloodrequest():
@@ -193,43 +290,155 @@ def branches():
 @app.route('/logout', methods=['GET', 'POST'])
 @login_required
 def logout():
+    userCache.invalidate(str(current_user.id))
     logout_user()  # log the user out
     flash('Logged out')
     return redirect(url_for('login'))
 
+# Donation analytics are loaded from the database at most once per TTL
+analyticsCache = ReferenceCache.fromEnv('BLOODMGT_ANALYTICS', maxsize=2, ttl=60)
+
+@app.route('/analytics')
+@login_required
+def analytics():
+    '''Endpoint for donation analytics
+    /analytics?q=inventory,weekly,monthly,expiry&days=<expiry window in days>&archive=1
+    archive=1 includes the archived donations in the intake figures
+    '''
+    queries = request.args.get('q', 'inventory,weekly,monthly,expiry').split(',')
+    try:
+        days = int(request.args.get('days', 7))
+    except ValueError:
+        return jsonify(success=False, error='Bad expiry window')
+
+    includeArchive = request.args.get('archive') == '1'
+    data = analyticsCache.get('donations+archive' if includeArchive else 'donations',
+                              lambda: DonationAnalytics.fromRows(db.getAnalyticsRows(includeArchive)))
+    result = {}
+    if 'inventory' in queries:
+        result['inventory'] = data.inventory()
+    if 'weekly' in queries:
+        result['weeklyIntake'] = data.intake('week')
+    if 'monthly' in queries:
+        result['monthlyIntake'] = data.intake('month')
+    if 'expiry' in queries:
+        result['expiry'] = data.expiring(days)
+    return jsonify(success=True, data=result)
+
+@app.route('/metrics')
+def metrics():
+    '''Process-wide counters in Prometheus text format'''
+    extra = []
+    for cacheName, cache in [('refcache', db.refCache), ('usercache', userCache), ('querycache', queryCache)]:
+        stats = cache.stats()
+        extra.append((f'bloodmgt_{cacheName}_hits_total', 'counter', f'{cacheName} hits', stats['hits']))
+        extra.append((f'bloodmgt_{cacheName}_misses_total', 'counter', f'{cacheName} misses', stats['misses']))
+    statementStats = getattr(db, 'statementStats', None) # MariaDB prepared statements
+    if statementStats is not None:
+        stats = statementStats.stats()
+        extra.append(('bloodmgt_prepared_statement_hits_total', 'counter', 'Statements run on an already prepared statement', stats['hits']))
+        extra.append(('bloodmgt_prepared_statement_misses_total', 'counter', 'Statements prepared on the server', stats['misses']))
+        extra.append(('bloodmgt_prepared_statement_evictions_total', 'counter', 'Prepared statements closed to stay under the per-connection limit', stats['evictions']))
+    if isinstance(db, WriteBehindBackend):
+        stats = db.stats()
+        extra.append(('bloodmgt_writequeue_pending', 'gauge', 'Queued writes not yet synced', stats['pending']))
+        extra.append(('bloodmgt_writequeue_failed', 'gauge', 'Queued writes set aside after failing repeatedly', stats['failed']))
+        extra.append(('bloodmgt_writequeue_lag_seconds', 'gauge', 'Age of the oldest queued write', stats['lagSeconds']))
+    return Response(instrumentation.prometheus(extra), mimetype='text/plain; version=0.0.4')
+
+def streamAllPages(fetchPage):
+    '''Stream every page of a listing as one JSON response, so the full list is never held in memory'''
+    def generate():
+        yield b'{"success":true,"data":['
+        after = None
+        first = True
+        while True:
+            items, after = fetchPage(after, MAX_PAGE_SIZE, serialized=True)
+            if items:
+                # Encode the page as one array and strip its brackets to splice it into the stream
+                yield (b'' if first else b',') + dumps(items)[1:-1]
+                first = False
+            if after is None:
+                break
+        yield b']}'
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+def jsonPage(fetchPage):
+    '''Return one page of a listing: /query?type=...&key=page&after=<cursor>&size=<page size>'''
+    try:
+        items, after = fetchPage(request.args.get('after'), clampPageSize(request.args.get('size')), serialized=True)
+    except ValueError:
+        return jsonify(success=False, error='Bad cursor')
+    return jsonResponse(success=True, data=items, next=after)
+
+# Rendered /query responses by URL and collection version, so repeat loads of an unchanged listing skip the database
+queryCache = ReferenceCache.fromEnv('BLOODMGT_QUERYCACHE', maxsize=32, ttl=600)
+
 @app.route('/query')
 @login_required
 def query():
-    '''Endpoint for AJAX query calls'''
+    '''Endpoint for AJAX query calls.
+    The version of the queried collection is sent as ETag (with the time of its last write as Last-Modified),
+    and requests for an unchanged version are answered with 304 Not Modified.
+    '''
     type = request.args.get('type')
+    if type not in DATA_VERSIONS:
+        return jsonify(success=False, error='Bad query')
+    version, updatedAt = db.getDataVersion(type)
+    etag = f'{type}-{version}'
+    # Read the version before rendering: a write made meanwhile bumps it, so the body is never older than its ETag
+    if not is_resource_modified(request.environ, etag, last_modified=updatedAt):
+        response = Response(status=304)
+    elif request.args.get('key') == 'all':
+        # Full listings are streamed and never buffered, so they are not cached
+        response = renderQuery(type)
+    else:
+        body = queryCache.get((request.full_path, etag), lambda: renderQuery(type).get_data())
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.last_modified = updatedAt
+    # Browsers revalidate on every load, sending If-None-Match
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+def renderQuery(type):
+    '''Response of /query for a collection'''
     key = request.args.get('key')
     val = request.args.get('val')
 
     if type == 'donor':
         if key == 'all':
-            donors = db.getAllDonors()
-            return jsonify(success=True, data=[d.serialize() for d in donors])
+            return streamAllPages(db.getDonorsPage)
+        elif key == 'page':
+            return jsonPage(db.getDonorsPage)
         elif key == 'nric':
             donor = db.getDonorByNRIC(val)
+            if donor is None:
+                return jsonify(success=False, error='Not found')
             return jsonify(success=True, data=donor.serialize())
 
     elif type == 'donation':
         if key == 'all':
-            donations = db.getAllDonations()
-            return jsonify(success=True, data=[d.serialize() for d in donations])
+            return streamAllPages(db.getDonationsPage)
+        elif key == 'page':
+            return jsonPage(db.getDonationsPage)
         elif key == 'bloodType':
             donations = db.getAvailableDonationsByBloodType(val)
-            return jsonify(success=True, data=[d.serialize() for d in donations])
+            return jsonResponse(success=True, data=[d.serialize() for d in donations])
         elif key == 'usedBy':
-            donationIds = db.getDonationsIdsByRequestId(val)
+            donationIds = db.getDonationsIdsByRequestId(val, includeArchive=request.args.get('archive') == '1')
             return jsonify(success=True, data=donationIds)
 
     elif type == 'request':
         if key == 'all':
-            requests = db.getAllRequests()
-            return jsonify(success=True, data=[r.serialize() for r in requests])
+            return streamAllPages(db.getRequestsPage)
+        elif key == 'page':
+            return jsonPage(db.getRequestsPage)
         if key == 'id':
             req = db.getRequestById(val)
+            if req is None:
+                return jsonify(success=False, error='Not found')
             return jsonify(success=True, data=req.serialize())
 
     return jsonify(success=False, error='Bad query')
@@ -0,0 +1,124 @@
+'''Maintenance commands for the blood donation management system.
+Run `python manage.py --help` for usage.
+'''
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+
+from database.backend import AVAILABLE_DONATIONS_INDEX, BACKENDS, getBackend
+from database.data_generator.generate_donations import readFirestoreBatches
+from database.importer import importDonations, readDonationsCsv
+from database.writequeue import WriteBehindBackend, WriteQueue
+
+
+def rebuildInventory(db, args):
+    '''Recompute the materialized blood inventory and weekly donation counters'''
+    db.rebuildInventory()
+    print('Inventory and weekly donation counters rebuilt.')
+
+def importDonationsCsv(db, args):
+    '''Bulk import donations from a CSV file'''
+    with open(args.file, newline='', encoding='utf-8') as f:
+        donations = readDonationsCsv(f, recordedBy=args.recorded_by)
+        count, seconds = importDonations(db, donations)
+    print(f'Imported {count} donations in {seconds:.2f}s ({count / seconds if seconds else 0:.0f} rows/sec).')
+
+def syncQueue(db, args):
+    '''Send the writes queued by a branch to the central database'''
+    queue = WriteQueue(args.queue)
+    if args.retry_failed:
+        print(f'Retrying {queue.retryFailed()} failed writes.')
+    applied, ok = WriteBehindBackend(db, queue).sync()
+    stats = queue.stats()
+    print(f"Synced {applied} writes; {stats['pending']} pending, {stats['failed']} failed"
+          + ('' if ok else ' (stopped at a failing write, see the log)') + '.')
+
+def migrateDonations(db, args):
+    '''Move Firestore donations from the donor subcollections to the top-level donations collection'''
+    if not hasattr(db, 'migrateDonations'):
+        print('Only the Firestore backend stores donations in donor subcollections.')
+        return
+    count = db.migrateDonations(deleteLegacy=args.delete_legacy)
+    print(f'Copied {count} donations' + (' and deleted the originals.' if args.delete_legacy else '.'))
+    # The inventory was kept up to date, but recompute it in case donations were written during the copy
+    db.rebuildInventory()
+
+def repairRequests(db, args):
+    '''Repair Firestore blood requests stored with the misspelt 'fufilled' flag'''
+    if not hasattr(db, 'repairRequestFlags'):
+        print('Only the Firestore backend stored the misspelt flag.')
+        return
+    print(f'Repaired {db.repairRequestFlags()} requests.')
+
+def loadFirestore(db, args):
+    '''Load the Firestore output of the test data generator (JSON lines of batches)'''
+    if not hasattr(db, 'importDocuments'):
+        print('Only the Firestore backend loads JSON batches; load the sql or csv output into MariaDB.')
+        return
+    with open(args.file, encoding='utf-8') as f:
+        count = db.importDocuments(readFirestoreBatches(f))
+    print(f'Loaded {count} documents.')
+    # The generator does not write the materialized inventory and weekly counters
+    db.rebuildInventory()
+
+def explainAvailable(db, args):
+    '''Show the query plan of the available donation lookup and check that it uses its index'''
+    plan = db.explainAvailableDonations(args.blood_type or None)
+    if plan is None:
+        print('This backend has no query plans to check.')
+        return
+    print('\n'.join(plan))
+    if not any(AVAILABLE_DONATIONS_INDEX in line for line in plan):
+        print(f'The lookup does not use {AVAILABLE_DONATIONS_INDEX}; run the latest migration in database/migrations.')
+        sys.exit(1)
+
+def archiveDonations(db, args):
+    '''Move used donations older than the retention window to the archive'''
+    before = datetime.now() - timedelta(days=args.days)
+    count = db.archiveDonations(before)
+    print(f'Archived {count} donations used by a request and dated before {before:%Y-%m-%d %H:%M}.')
+
+def main():
+    parser = argparse.ArgumentParser(description='Blood donation management system maintenance commands')
+    parser.add_argument('--backend', choices=BACKENDS, help='database to operate on (default BLOODMGT_DB_BACKEND or mariadb)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('rebuild-inventory', help=rebuildInventory.__doc__).set_defaults(func=rebuildInventory)
+
+    importParser = commands.add_parser('import-donations', help=importDonationsCsv.__doc__)
+    importParser.add_argument('file', help='CSV with columns nric, quantity, date, branchId and optionally id, recordedBy, usedBy')
+    importParser.add_argument('--recorded-by', type=int, default=None, help='user id recorded for rows without recordedBy')
+    importParser.set_defaults(func=importDonationsCsv)
+
+    syncParser = commands.add_parser('sync-queue', help=syncQueue.__doc__)
+    syncParser.add_argument('--queue', default=os.getenv('BLOODMGT_WRITE_QUEUE'), required=not os.getenv('BLOODMGT_WRITE_QUEUE'),
+                            help='queue file (default BLOODMGT_WRITE_QUEUE)')
+    syncParser.add_argument('--retry-failed', action='store_true', help='also retry writes set aside after failing repeatedly')
+    syncParser.set_defaults(func=syncQueue)
+
+    migrateParser = commands.add_parser('migrate-donations', help=migrateDonations.__doc__)
+    migrateParser.add_argument('--delete-legacy', action='store_true', help='delete the subcollection documents once copied')
+    migrateParser.set_defaults(func=migrateDonations)
+
+    commands.add_parser('repair-requests', help=repairRequests.__doc__).set_defaults(func=repairRequests)
+
+    loadParser = commands.add_parser('load-firestore', help=loadFirestore.__doc__)
+    loadParser.add_argument('file', help='<base>-firestore.jsonl written by generate_donations.py --format firestore')
+    loadParser.set_defaults(func=loadFirestore)
+
+    explainParser = commands.add_parser('explain-available', help=explainAvailable.__doc__)
+    explainParser.add_argument('--blood-type', action='append', help='blood type to look up, can be repeated (default all)')
+    explainParser.set_defaults(func=explainAvailable)
+
+    archiveParser = commands.add_parser('archive-donations', help=archiveDonations.__doc__)
+    archiveParser.add_argument('--days', type=int, default=int(os.getenv('BLOODMGT_ARCHIVE_DAYS', 365)),
+                               help='retention window in days (default BLOODMGT_ARCHIVE_DAYS or 365)')
+    archiveParser.set_defaults(func=archiveDonations)
+
+    args = parser.parse_args()
+    db = getBackend(args.backend)
+    args.func(db, args)
+
+if __name__ == '__main__':
+    main()
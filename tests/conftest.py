@@ -0,0 +1,23 @@
+'''Fixtures shared by the tests'''
+import os
+
+import pytest
+from werkzeug.test import Client
+
+
+@pytest.fixture(scope='session')
+def app(tmp_path_factory):
+    '''The Flask app on an SQLite database with the sample data'''
+    os.environ['BLOODMGT_DB_BACKEND'] = 'sqlite'
+    os.environ['BLOODMGT_SQLITE_PATH'] = str(tmp_path_factory.mktemp('app') / 'app.db')
+    import main
+    main.app.config['WTF_CSRF_ENABLED'] = False
+    return main.app
+
+
+@pytest.fixture
+def client(app):
+    '''Test client logged in as a blood bank staff user'''
+    client = Client(app) # Flask 2.0's test_client does not work with Werkzeug 2.2
+    client.post('/login', data={'username': 'user1', 'password': '1234'})
+    return client
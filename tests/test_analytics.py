@@ -0,0 +1,59 @@
+'''Analytics engine (database.analytics), on in-memory donation rows'''
+from datetime import datetime
+
+import pytest
+
+from database.analytics import DonationAnalytics
+
+
+def analytics(*rows):
+    '''Rows of (date, quantity, branchId, bloodType, usedBy)'''
+    return DonationAnalytics.fromRows(rows)
+
+
+def test_weekly_intake_starts_on_monday():
+    data = analytics(
+        (datetime(2024, 1, 1, 9), 450, 1, 'A+', None), # Monday
+        (datetime(2024, 1, 7, 23), 350, 1, 'A+', None), # Sunday of the same week
+        (datetime(2024, 1, 8), 450, 1, 'O-', None),
+        (datetime(2024, 1, 24), 250, 2, 'B+', 3)) # Two weeks later; the empty week is left out
+
+    assert data.intake('week') == [
+        {'period': '2024-01-01', 'donations': 2, 'quantity': 800},
+        {'period': '2024-01-08', 'donations': 1, 'quantity': 450},
+        {'period': '2024-01-22', 'donations': 1, 'quantity': 250}]
+
+
+def test_monthly_intake_since():
+    data = analytics(
+        (datetime(2023, 12, 31), 450, 1, 'A+', None),
+        (datetime(2024, 1, 31, 23, 59), 450, 1, 'A+', None),
+        (datetime(2024, 2, 1), 300, 1, 'A+', None))
+
+    assert data.intake('month', since=datetime(2024, 1, 1)) == [
+        {'period': '2024-01-01', 'donations': 1, 'quantity': 450},
+        {'period': '2024-02-01', 'donations': 1, 'quantity': 300}]
+
+
+def test_intake_of_no_donations():
+    assert analytics().intake('week') == []
+    with pytest.raises(ValueError):
+        analytics().intake('day')
+
+
+def test_expiring_and_expired_unused_blood():
+    now = datetime(2024, 3, 1)
+    data = analytics(
+        (datetime(2024, 1, 15), 450, 1, 'A+', None), # Expired on 2024-02-26
+        (datetime(2024, 1, 20), 350, 1, 'A+', None), # Expires on 2024-03-02
+        (datetime(2024, 1, 21), 250, 2, 'O-', None), # Expires on 2024-03-03
+        (datetime(2024, 1, 10), 450, 2, 'O-', 5), # Used, so neither
+        (datetime(2024, 2, 20), 450, 1, 'A+', None)) # Expires after the window
+
+    result = data.expiring(withinDays=7, now=now)
+
+    assert result['expired']['1']['A+'] == 450
+    assert result['expiring']['1']['A+'] == 350
+    assert result['expiring']['2']['O-'] == 250
+    assert result['expired']['2']['O-'] == 0
+    assert data.inventory()['1']['A+'] == 1250
@@ -0,0 +1,69 @@
+'''Backend contract tests. They run on SQLite, and on MariaDB when the driver is installed
+and BLOODMGT_MARIADB_USER / BLOODMGT_MARIADB_PASS point at a database created by generate_database.sql.
+'''
+import os
+from datetime import datetime
+
+import pytest
+
+
+@pytest.fixture(params=['sqlite', 'mariadb'])
+def db(request, tmp_path):
+    if request.param == 'sqlite':
+        from database.sqlite import SQLiteBackend
+        backend = SQLiteBackend(str(tmp_path / 'test.db'))
+    else:
+        pytest.importorskip('mariadb')
+        if not os.getenv('BLOODMGT_MARIADB_USER'):
+            pytest.skip('BLOODMGT_MARIADB_USER is not set')
+        from database.mariadb import MariaDBBackend
+        backend = MariaDBBackend()
+    yield backend
+    backend.release()
+
+
+def test_get_request_by_id(db):
+    request = db.getRequestById(1)
+    assert request is not None
+    assert str(request.id) == '1'
+
+
+def test_get_request_by_missing_id(db):
+    assert db.getRequestById(999999999) is None
+
+
+def test_query_missing_request_and_donor(client):
+    for url in ['/query?type=request&key=id&val=999999999', '/query?type=donor&key=nric&val=T0000000X']:
+        res = client.get(url)
+        assert res.status_code == 200
+        assert res.json == {'success': False, 'error': 'Not found'}
+
+
+def test_failed_queued_donor_is_not_applied(db, tmp_path):
+    from database.models import Donor
+    from database.writequeue import WriteBehindBackend, WriteQueue
+    writeBehind = WriteBehindBackend(db, WriteQueue(str(tmp_path / 'queue.db')))
+    existing, _ = db.getDonorsPage(pageSize=1)
+    writeBehind.insertDonor(Donor(existing[0].nric, 'Duplicate', datetime(1990, 1, 1), '91234567', 'A+', datetime.now()))
+    # The NRIC is taken, so the insert fails and the write stays queued instead of being marked applied
+    assert writeBehind.syncBatch() == (0, False)
+    assert len(writeBehind.queue.peek(10)) == 1
+
+
+def test_version_is_bumped_when_the_write_commits(db):
+    from database.models import BloodRequest
+    version, _ = db.getDataVersion('request')
+    db.insertRequest(BloodRequest(None, 1, 'A+', 450, datetime.now(), 'Test address', 'Pending', 0))
+    # The version row is not touched (or locked) by the write's transaction
+    assert db.getDataVersion('request')[0] == version
+    db.commit()
+    assert db.getDataVersion('request')[0] == version + 1
+
+
+def test_rolled_back_write_does_not_bump_version(db):
+    from database.models import BloodRequest
+    version, _ = db.getDataVersion('request')
+    db.insertRequest(BloodRequest(None, 1, 'A+', 450, datetime.now(), 'Test address', 'Pending', 0))
+    db.rollback()
+    db.commit()
+    assert db.getDataVersion('request')[0] == version
@@ -0,0 +1,69 @@
+'''Firestore backend tests. They run against the Firestore emulator
+(`firebase emulators:start --only firestore`, then set FIRESTORE_EMULATOR_HOST) and are skipped without it.
+'''
+import os
+import uuid
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip('firebase_admin')
+pytestmark = pytest.mark.skipif(not os.getenv('FIRESTORE_EMULATOR_HOST'), reason='FIRESTORE_EMULATOR_HOST is not set')
+
+from database.models import BloodDonation, BloodRequest, Donor
+
+
+@pytest.fixture(scope='module')
+def db():
+    from database.firebase import FirebaseBackend
+    return FirebaseBackend()
+
+
+def insertDonation(db, bloodType='A+', quantity=450):
+    nric = f'T{uuid.uuid4().hex[:8].upper()}'
+    db.insertDonor(Donor(nric, 'Test Donor', datetime(1990, 1, 1), '91234567', bloodType, datetime.now()))
+    return db.insertDonation(BloodDonation(None, nric, quantity, datetime.now(), 10001, None, None),
+                             idempotencyKey=str(uuid.uuid4()))
+
+
+def test_fulfill_request_created_by_app(db):
+    donationId = insertDonation(db)
+    requestId = db.insertRequest(BloodRequest(None, 1, 'A+', 450, datetime.today(), 'Test address', 'Pending', 0))
+
+    db.fulfillRequest(requestId, [donationId])
+
+    requestDict = db.bloodrequest_ref.document(requestId).get().to_dict()
+    assert requestDict['fulfilled'] == 1
+    assert requestDict['status'] == 'Delivered'
+    assert db.donations_ref.document(donationId).get().get('usedBy') == requestId
+
+
+def test_repair_misspelt_request_flag(db):
+    _, requestRef = db.bloodrequest_ref.add({
+        'address': 'Test address', 'bloodType': 'A+', 'date': str(datetime.today()), 'fufilled': 0,
+        'quantity': 450, 'requesterId': 1, 'status': 'Pending'})
+
+    assert db.repairRequestFlags() >= 1
+
+    assert requestRef.get().to_dict()['fulfilled'] == 0
+    assert requestRef.id in [req.id for req in db.getPendingRequests()]
+
+
+def test_donations_page_after_deleted_cursor_document(db):
+    for _ in range(3):
+        insertDonation(db)
+    firstPage, after = db.getDonationsPage(pageSize=2)
+    assert after is not None
+    # The cursor holds the sort values, so the page after it does not depend on the document still existing
+    db._donationRef(firstPage[-1].id).delete()
+    secondPage, _ = db.getDonationsPage(after=after, pageSize=2)
+    assert not {d.id for d in firstPage} & {d.id for d in secondPage}
+
+
+def test_inserted_donation_stores_numeric_quantity_and_utc_date(db):
+    # Form values arrive as strings
+    donationId = insertDonation(db, quantity='450')
+
+    donationDict = db.donations_ref.document(donationId).get().to_dict()
+    assert donationDict['quantity'] == 450
+    assert donationDict['date'].utcoffset().total_seconds() == 0
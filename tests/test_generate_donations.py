@@ -0,0 +1,56 @@
+'''The test data generator's output loads into a database seeded by generate_database.sql'''
+import random
+from datetime import datetime
+
+from database.data_generator.generate_donations import generateTables, readFirestoreBatches, writeFirestore, writeSql
+from database.sqlite import SQLiteBackend
+
+
+def loadSql(db, path):
+    '''Run the generator's MariaDB INSERT script on a SQLite database'''
+    with open(path) as f:
+        script = (f.read().replace('`bloodmanagementsystem`.', '').replace('START TRANSACTION;', 'BEGIN;')
+                  .replace('UTC_TIMESTAMP()', 'CURRENT_TIMESTAMP'))
+    db._connection.executescript(script)
+
+
+def count(db, table):
+    db._cursor.execute(f'SELECT COUNT(*) FROM {table}')
+    return db._cursor.fetchone()[0]
+
+
+def test_sql_output_loads_into_seeded_database(tmp_path):
+    db = SQLiteBackend(str(tmp_path / 'seeded.db'))
+    seeded = {table: count(db, table) for table in ('Donor', 'BloodRequest', 'BloodDonation')}
+    assert all(seeded.values())
+    version, _ = db.getDataVersion('donation')
+
+    writeSql(tmp_path / 'generated.sql', generateTables(random.Random(1), donors=50, donations=500, requests=40), 100)
+    loadSql(db, tmp_path / 'generated.sql')
+    db.rebuildInventory()
+
+    assert count(db, 'Donor') == seeded['Donor'] + 50
+    assert count(db, 'BloodRequest') == seeded['BloodRequest'] + 40
+    assert count(db, 'BloodDonation') == seeded['BloodDonation'] + 500
+    assert db.getDataVersion('donation')[0] > version
+    # Generated donations only point at existing requests
+    db._cursor.execute('SELECT COUNT(*) FROM BloodDonation bd LEFT JOIN BloodRequest br ON bd.usedBy=br.id '
+                       'WHERE bd.usedBy IS NOT NULL AND br.id IS NULL')
+    assert db._cursor.fetchone()[0] == 0
+    # Donations carry their donor's blood type
+    db._cursor.execute('SELECT COUNT(*) FROM BloodDonation bd INNER JOIN Donor d ON bd.nric=d.nric '
+                       'WHERE bd.bloodTypeId<>d.bloodTypeId')
+    assert db._cursor.fetchone()[0] == 0
+    db.release()
+
+
+def test_firestore_output_has_timestamps(tmp_path):
+    writeFirestore(str(tmp_path / 'generated'), generateTables(random.Random(1), donors=5, donations=20, requests=4), 500)
+    with open(tmp_path / 'generated-firestore.jsonl') as f:
+        writes = [write for batch in readFirestoreBatches(f) for write in batch]
+
+    donors = [data for path, data in writes if path.startswith('donors/')]
+    donations = [data for path, data in writes if path.startswith('donations/')]
+    assert len(donors) == 5 and len(donations) == 20
+    assert all(isinstance(d['dateOfBirth'], datetime) and isinstance(d['registrationDate'], datetime) for d in donors)
+    assert all(isinstance(d['date'], datetime) for d in donations)
@@ -0,0 +1,79 @@
+'''Blood matching engine (database.matching), on in-memory donations'''
+from datetime import datetime
+
+from database.matching import allocateRequests
+from database.models import BloodDonation, BloodRequest
+
+
+def donation(id, bloodType, quantity=450, day=1, branchId=1, usedBy=None):
+    return BloodDonation(id, 'T0000000A', quantity, datetime(2024, 1, day), branchId, None, usedBy, bloodType=bloodType)
+
+
+def request(id, bloodType, quantity=450, day=1):
+    return BloodRequest(id, 1, bloodType, quantity, datetime(2024, 2, day), 'Test address', 'Pending', 0)
+
+
+def allocatedIds(allocations):
+    return {a.request.id: [d.id for d in a.donations] for a in allocations}
+
+
+def test_only_compatible_types_are_allocated():
+    donations = [donation(1, 'B+'), donation(2, 'AB-'), donation(3, 'O-')]
+
+    allocations, unfilled = allocateRequests([request(1, 'A+')], donations)
+
+    assert allocatedIds(allocations) == {1: [3]}
+    assert unfilled == []
+
+
+def test_exact_type_is_preferred_over_universal_donor():
+    donations = [donation(1, 'O-', day=1), donation(2, 'A+', day=20)]
+
+    allocations, _ = allocateRequests([request(1, 'A+')], donations)
+
+    # O- is older, but is kept for the recipients who can only receive O-
+    assert allocatedIds(allocations) == {1: [2]}
+
+
+def test_oldest_units_are_used_first():
+    donations = [donation(1, 'A+', day=9), donation(2, 'A+', day=3), donation(3, 'A+', day=6)]
+
+    allocations, _ = allocateRequests([request(1, 'A+', 900)], donations)
+
+    assert allocatedIds(allocations) == {1: [2, 3]}
+
+
+def test_lookahead_picks_the_smallest_unit_covering_the_remainder():
+    donations = [donation(1, 'A+', 450, day=1), donation(2, 'A+', 250, day=2), donation(3, 'A+', 100, day=3)]
+
+    allocations, _ = allocateRequests([request(1, 'A+', 500)], donations)
+
+    # Strictly oldest first would take 450 + 250 and overshoot by 200
+    assert allocatedIds(allocations) == {1: [1, 3]}
+    assert allocations[0].overshoot == 50
+
+
+def test_shortage_leaves_the_stock_for_later_requests():
+    donations = [donation(1, 'A+')]
+
+    allocations, unfilled = allocateRequests([request(1, 'A+', 900, day=1), request(2, 'A+', 450, day=2)], donations)
+
+    assert [r.id for r in unfilled] == [1]
+    assert allocatedIds(allocations) == {2: [1]}
+
+
+def test_used_and_other_branch_donations_are_skipped():
+    donations = [donation(1, 'A+', usedBy=7), donation(2, 'A+', branchId=2), donation(3, 'A+', day=28)]
+
+    allocations, _ = allocateRequests([request(1, 'A+')], donations, branchId=1)
+
+    assert allocatedIds(allocations) == {1: [3]}
+
+
+def test_requests_are_matched_oldest_first():
+    donations = [donation(1, 'O-')]
+
+    allocations, unfilled = allocateRequests([request(1, 'O-', day=5), request(2, 'O-', day=2)], donations)
+
+    assert allocatedIds(allocations) == {2: [1]}
+    assert [r.id for r in unfilled] == [1]
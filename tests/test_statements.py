@@ -0,0 +1,32 @@
+'''IN list padding of the MariaDB prepared statements (database.statements). Needs the mariadb driver, not a database.'''
+import pytest
+
+pytest.importorskip('mariadb')
+
+from database.statements import IN_LIST_SIZES, inList
+
+
+@pytest.mark.parametrize('count, size', [(1, 1), (2, 2), (3, 4), (5, 8), (100, 128), (1024, 1024)])
+def test_padded_to_next_size(count, size):
+    placeholders, params = inList(range(count))
+
+    assert placeholders == ','.join(['?'] * size)
+    assert params == tuple(range(count)) + (count - 1,) * (size - count)
+
+
+def test_longer_lists_padded_to_multiple_of_largest_size():
+    largest = IN_LIST_SIZES[-1]
+
+    placeholders, params = inList(range(largest + 1))
+
+    assert len(params) == placeholders.count('?') == 2 * largest
+    assert set(params) == set(range(largest + 1))
+
+
+def test_few_statements_for_all_lengths():
+    assert len({inList(range(n))[0] for n in range(1, 1025)}) == len(IN_LIST_SIZES)
+
+
+def test_empty_list_is_rejected():
+    with pytest.raises(ValueError):
+        inList([])
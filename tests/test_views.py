@@ -0,0 +1,36 @@
+'''Web app routes, on an SQLite database with the sample data'''
+
+DONOR = {'nric': 'T1234567Z', 'name': 'Test Donor', 'dateOfBirth': '1990-01-01', 'contactNo': '91234567', 'bloodType': 'A+'}
+
+
+def test_create_and_delete_donor(client):
+    assert client.post('/donors?action=create', data=DONOR).json['success']
+
+    res = client.post('/donors?action=delete', data=DONOR).json
+
+    assert res['success']
+    assert res['data']['nric'] == DONOR['nric']
+    assert not client.get(f"/query?type=donor&key=nric&val={DONOR['nric']}").json['success']
+
+
+def test_load_user_returns_its_connection(app):
+    import main
+    main.userCache.invalidate('1')
+
+    assert main.load_user('1').username == 'user1'
+    # Async views wait on worker threads that share the connection pool, so none may be held meanwhile
+    assert getattr(main.db._local, 'connection', None) is None
+
+
+def test_query_etag_changes_on_write(client):
+    url = '/query?type=donor&key=page&size=10'
+    etag = client.get(url).headers['ETag']
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+    client.post('/donors?action=create', data=DONOR)
+    res = client.get(url, headers={'If-None-Match': etag})
+    client.post('/donors?action=delete', data=DONOR)
+
+    assert res.status_code == 200
+    assert res.headers['ETag'] != etag
+    assert client.get(url, headers={'If-None-Match': res.headers['ETag']}).status_code == 200 # Bumped by the delete